@@ -1,13 +1,110 @@
-import streamlit as st
+import functools
+import hashlib
+import io
+import os
+import tempfile
+
 import numpy as np
-import matplotlib.pyplot as plt
-import math
+import streamlit as st
+
+from grafik import (CACHE, gambar_png, grafik_antrian_transien, grafik_biaya_persediaan, grafik_frontier_redundansi,
+                    grafik_keandalan, grafik_ketersediaan, grafik_komposisi_waktu, grafik_parametrik,
+                    grafik_probabilitas_antrian, grafik_produksi, grafik_sensitivitas, grafik_siklus_persediaan,
+                    kunci_grafik)
+from grafik_klien import spek_grafik
+from model_industri import (alokasi_redundansi, antrian_transien, cache_dari_env, hitung_berkas, hitung_diagram,
+                            hitung_mmc, hitung_mmck, hitung_persediaan, hitung_persediaan_katalog, hitung_produksi,
+                            jalankan_server_metrik, mttf_dari_keandalan, opsi_paralel, pengukur_dari_env,
+                            profil_per_jam, rentang_optimal, rss_byte, selesaikan_lp, simulasi_antrian,
+                            simulasi_ketersediaan, simulasi_persediaan, staf_minimal, statistik_kedatangan,
+                            statistik_lead_time, statistik_permintaan)
 
 # --- KONFIGURASI HALAMAN ---
 st.set_page_config(page_title="Dashboard Model Matematika Industri", layout="wide", initial_sidebar_state="expanded")
 st.title("📈 Dashboard Model Matematika untuk Industri")
 st.markdown("Sebuah aplikasi interaktif untuk memahami penerapan model matematika kunci dalam skenario bisnis di dunia nyata.")
 
+# --- CACHE HASIL MODEL ---
+# Parameter bawaan setiap tab; dihitung sekali saat startup agar kunjungan pertama tidak lambat
+PERSEDIAAN_BAWAAN = hitung_persediaan(1200, 500000, 25000, 14, 10)
+KEANDALAN_MESIN_BAWAAN = {'Stamping': 0.98, 'Welding': 0.99, 'Painting': 0.96, 'Assembly': 0.97}
+HARGA_MESIN_BAWAAN = {'Stamping': 750.0, 'Welding': 500.0, 'Painting': 400.0, 'Assembly': 350.0}
+LUAS_MESIN_BAWAAN = {'Stamping': 40.0, 'Welding': 25.0, 'Painting': 60.0, 'Assembly': 30.0}
+SKENARIO_BAWAAN = [
+    (hitung_produksi, (750000, 300000, 6.0, 2.0, 4.0, 1.5, 240, 120), {}),
+    (selesaikan_lp, ([750000, 300000], [[6.0, 2.0], [4.0, 1.5]], [240, 120]), {'integer': True}),
+    (hitung_persediaan, (1200, 500000, 25000, 14, 10), {}),
+    (simulasi_persediaan, (1200, float(PERSEDIAAN_BAWAAN['eoq']), float(PERSEDIAAN_BAWAAN['rop']), 10, 14, 1.0, 2.0),
+     {'target_layanan': 0.95}),
+    (staf_minimal, (30, 35, 5.0 / 60), {}),
+    (hitung_mmc, (30, 35, 1), {}),
+    (hitung_diagram, (('seri', list(KEANDALAN_MESIN_BAWAAN)), KEANDALAN_MESIN_BAWAAN), {}),
+]
+
+# Pola kedatangan relatif drive-thru per jam (10.00–21.00): puncak makan siang dan makan malam
+JAM_BUKA = 10
+POLA_JAM_SIBUK = [0.5, 0.8, 1.0, 0.9, 0.6, 0.5, 0.6, 0.9, 1.0, 0.8, 0.6, 0.4]
+
+# Kolom katalog SKU untuk EOQ multi-item; tiga kolom pertama wajib ada di CSV unggahan
+KOLOM_KATALOG = ['D', 'S', 'H', 'ruang', 'harga', 'lead_time', 'safety_stock']
+
+@st.cache_data
+def katalog_contoh(n_sku, seed=0):
+    # Katalog sintetis bahan baku kedai kopi: permintaan lognormal, ruang dalam m³/kg, harga dalam Rp/kg
+    rng = np.random.default_rng(seed)
+    return {'D': rng.lognormal(np.log(1200), 0.8, n_sku), 'S': rng.uniform(200_000, 800_000, n_sku),
+            'H': rng.uniform(10_000, 40_000, n_sku), 'ruang': rng.uniform(0.001, 0.01, n_sku),
+            'harga': rng.uniform(50_000, 300_000, n_sku), 'lead_time': rng.integers(3, 22, n_sku).astype(float),
+            'safety_stock': rng.uniform(0, 20, n_sku)}
+
+@st.cache_data
+def baca_katalog(isi_csv):
+    data = np.genfromtxt(io.BytesIO(isi_csv), delimiter=',', names=True, dtype=float, encoding='utf-8')
+    data = np.atleast_1d(data)
+    hilang = [k for k in KOLOM_KATALOG[:3] if k not in data.dtype.names]
+    if hilang:
+        raise ValueError(f"Kolom wajib tidak ada di CSV: {', '.join(hilang)}")
+    return {k: data[k] for k in KOLOM_KATALOG if k in data.dtype.names}
+
+@st.cache_data(max_entries=50)
+def persediaan_katalog(katalog, persen_ruang=100, persen_modal=100):
+    # Di-cache per isi katalog dan batas; hasil tanpa batas (juga di-cache) menjadi skala kapasitas dan anggaran
+    if persen_ruang == 100 and persen_modal == 100:
+        return hitung_persediaan_katalog(**katalog)
+    bebas = persediaan_katalog(katalog)
+    return hitung_persediaan_katalog(
+        **katalog, kapasitas_ruang=np.inf if persen_ruang == 100 else bebas['ruang_terpakai'] * persen_ruang / 100,
+        anggaran_modal=np.inf if persen_modal == 100 else bebas['modal_terpakai'] * persen_modal / 100)
+
+@st.cache_resource
+def pengukur_model():
+    # Satu pengukur per proses; MODEL_METRICS_PORT membuka endpoint /metrics untuk di-scrape Prometheus,
+    # hanya di 127.0.0.1 kecuali MODEL_METRICS_HOST diisi (mis. 0.0.0.0)
+    pengukur = pengukur_dari_env()
+    if os.environ.get('MODEL_METRICS_PORT'):
+        jalankan_server_metrik(pengukur, int(os.environ['MODEL_METRICS_PORT']),
+                               host=os.environ.get('MODEL_METRICS_HOST', '127.0.0.1'))
+    return pengukur
+
+@st.cache_resource
+def cache_model():
+    # Satu instance per proses; isinya (SQLite) dipakai bersama oleh semua proses dan bertahan setelah restart
+    cache = cache_dari_env(pengukur=pengukur_model())
+    cache.panaskan(SKENARIO_BAWAAN)
+    return cache
+
+pengukur = pengukur_model()
+cache = cache_model()
+
+def terukur(tampilkan_model):
+    """Catat setiap (re)run panel model: waktu hitung, bangun grafik, kirim ke browser, dan RSS proses."""
+    @functools.wraps(tampilkan_model)
+    def jalankan():
+        with pengukur.rerun(tampilkan_model.__name__) as rekaman:
+            st.session_state[f"rerun_{tampilkan_model.__name__}"] = rekaman
+            return tampilkan_model()
+    return jalankan
+
 # --- SIDEBAR ---
 with st.sidebar:
     st.header("Panduan Aplikasi")
@@ -15,6 +112,13 @@ with st.sidebar:
     Aplikasi ini mendemonstrasikan empat model matematika melalui studi kasus yang relevan dengan industri di Indonesia. Setiap tab menyediakan **analisis, visualisasi, dan wawasan bisnis** yang dapat ditindaklanjuti.
     """)
     st.info("**Tips:** Ubah parameter di setiap model untuk melihat bagaimana hasilnya berubah secara real-time!")
+    semua_tab = st.toggle("Hitung semua model sekaligus", value=False,
+                          help="Jika nonaktif, hanya model yang sedang dipilih yang dihitung dan digambar.")
+    grafik_statis = st.toggle("Gambar grafik di server (PNG)", value=os.environ.get('GRAFIK_MODE') == 'png',
+                              help="Bawaan: grafik interaktif digambar di browser dari data ringkas. PNG statis "
+                                   "tetap dapat diunduh di bawah setiap grafik.")
+    mode_debug = st.toggle("🛠️ Panel debug kinerja", value=bool(os.environ.get('MODEL_DEBUG')),
+                           help="Waktu hitung, bangun grafik, dan kirim per rerun beserta memori proses.")
     
     st.markdown("""
     ---
@@ -33,7 +137,96 @@ with st.sidebar:
     st.divider()
     st.caption("Matematika Terapan | Teknik Informatika - Universitas Pelita Bangsa")
 
+# --- RENDER GRAFIK ---
+def tampilkan_grafik(fungsi, **params):
+    """Tampilkan `fungsi(**params)` sebagai grafik Vega-Lite di browser, atau PNG jika mode statis dipilih."""
+    pengukur.tambah('grafik')
+    if grafik_statis:
+        with pengukur.ukur('figur'):
+            png = gambar_png(fungsi, **params)
+        with pengukur.ukur('kirim'):
+            st.image(png, width='stretch')
+        return
+    with pengukur.ukur('figur'):
+        spek = spek_grafik(fungsi, **params)
+    with pengukur.ukur('kirim'):
+        st.vega_lite_chart(spek, width='stretch')
+
+    # PNG baru dirender (dan matplotlib baru dimuat) saat tombol unduh diklik
+    def png():
+        return gambar_png(fungsi, **params)
+
+    kunci = hashlib.sha1(repr(kunci_grafik(fungsi, params)).encode()).hexdigest()[:12]
+    st.download_button("⬇️ Unduh PNG", data=png, file_name=f"{fungsi.__name__}.png", mime='image/png',
+                       key=f"png_{kunci}", type='tertiary')
+
+# --- LOG HISTORIS ---
+# Folder log besar di server (CSV/.npy); tanpa variabel ini hanya unggahan yang tersedia
+FOLDER_LOG = os.environ.get('MODEL_LOG_DIR')
+
+def path_unggahan(berkas):
+    # Simpan unggahan sekali per isi agar sidik jari berkas (dan cache statistiknya) tetap sama antar rerun
+    isi = berkas.getvalue()
+    folder = os.path.join(tempfile.gettempdir(), 'model_industri_log')
+    os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, hashlib.sha1(isi).hexdigest()[:16] + os.path.splitext(berkas.name)[1])
+    if not os.path.exists(path):
+        with open(path, 'wb') as f:
+            f.write(isi)
+    return path
+
+def statistik_log(kunci, judul, kolom, fungsi, **kwargs):
+    """Pilih log dari FOLDER_LOG atau unggahan, lalu kembalikan statistiknya (di-cache per sidik jari berkas)."""
+    st.markdown(f"**{judul}** — kolom: `{kolom}`")
+    path = None
+    if FOLDER_LOG and os.path.isdir(FOLDER_LOG):
+        daftar = sorted(f for f in os.listdir(FOLDER_LOG) if f.endswith(('.csv', '.npy')))
+        pilihan = st.selectbox(f"Berkas di {FOLDER_LOG}", ["(tidak dipakai)"] + daftar, key=f"{kunci}_server")
+        if pilihan != "(tidak dipakai)":
+            path = os.path.join(FOLDER_LOG, pilihan)
+    berkas = st.file_uploader(f"Unggah {judul.lower()}", type=['csv', 'npy'], key=f"{kunci}_unggah")
+    if berkas is not None:
+        path = path_unggahan(berkas)
+    if path is None:
+        return None
+    try:
+        with st.spinner(f"Membaca {judul.lower()}..."):
+            return hitung_berkas(cache, fungsi, path, **kwargs)
+    except (OSError, ValueError) as e:
+        st.error(f"{judul} tidak dapat dibaca: {e}")
+        return None
+
+# --- PETA SENSITIVITAS ---
+def peta_sensitivitas(kunci, fungsi, tetap, sumbu_x, sumbu_y, pilihan_metrik):
+    """Heatmap satu metrik model di grid dua parameter.
+
+    `sumbu_x`/`sumbu_y` berupa `(nama_argumen, label, nilai_saat_ini, minimum, maksimum)` dan
+    `pilihan_metrik` memetakan label ke `(kunci_hasil, faktor_skala)`.
+    """
+    with st.expander("🗺️ Peta Sensitivitas Dua Parameter"):
+        st.caption("Seluruh grid dihitung sekaligus secara tervektorisasi, bukan satu titik per klik. Area abu-abu berarti "
+                   "model tidak terdefinisi di sana (misalnya antrian tidak stabil).")
+        if not st.toggle("Tampilkan peta sensitivitas", value=False, key=f"{kunci}_tampil"):
+            return
+        col_metrik, col_resolusi = st.columns(2)
+        label_metrik = col_metrik.selectbox("Metrik", list(pilihan_metrik), key=f"{kunci}_metrik")
+        resolusi = col_resolusi.select_slider("Titik per Sumbu", [100, 300, 1000], value=300, key=f"{kunci}_resolusi",
+                                              help="1000 titik per sumbu berarti satu juta skenario.")
+        rentang = {}
+        for sumbu, kolom in zip((sumbu_x, sumbu_y), st.columns(2)):
+            nama, label, nilai, minimum, maksimum = sumbu
+            rentang[nama] = kolom.slider(f"Rentang {label}", minimum, maksimum, (minimum, maksimum),
+                                         key=f"{kunci}_{nama}")
+        keluaran, faktor = pilihan_metrik[label_metrik]
+        tampilkan_grafik(grafik_sensitivitas, model=fungsi,
+                         sumbu_x=(sumbu_x[0], *rentang[sumbu_x[0]], resolusi),
+                         sumbu_y=(sumbu_y[0], *rentang[sumbu_y[0]], resolusi), tetap=tetap, keluaran=keluaran,
+                         label_x=sumbu_x[1], label_y=sumbu_y[1], label_nilai=label_metrik, faktor=faktor,
+                         titik=(sumbu_x[2], sumbu_y[2]))
+
 # --- TAB 1: OPTIMASI PRODUKSI ---
+@st.fragment
+@terukur
 def optimasi_produksi():
     st.header("📊 Optimasi Produksi Furnitur")
     st.subheader("Studi Kasus: UKM Mebel Jati 'Jati Indah'")
@@ -80,34 +273,16 @@ def optimasi_produksi():
             st.latex(r'''3. \quad x \ge 0, y \ge 0''')
 
         # --- Perhitungan ---
-        A_matrix = np.array([[jam_meja, jam_kursi], [kayu_meja, kayu_kursi]])
-        b_vector = np.array([total_jam, total_kayu])
-        x_intercept1 = total_jam / jam_meja if jam_meja > 0 else float('inf')
-        y_intercept1 = total_jam / jam_kursi if jam_kursi > 0 else float('inf')
-        x_intercept2 = total_kayu / kayu_meja if kayu_meja > 0 else float('inf')
-        y_intercept2 = total_kayu / kayu_kursi if kayu_kursi > 0 else float('inf')
-        try:
-            intersect_point = np.linalg.solve(A_matrix, b_vector)
-            if intersect_point[0] < 0 or intersect_point[1] < 0: intersect_point = (0, 0)
-        except np.linalg.LinAlgError:
-            intersect_point = (0, 0)
-        
-        corner_points = [(0, 0)]
-        if y_intercept1 != float('inf') and (kayu_meja*0 + kayu_kursi*y_intercept1 <= total_kayu): corner_points.append((0, y_intercept1))
-        if y_intercept2 != float('inf') and (jam_meja*0 + jam_kursi*y_intercept2 <= total_jam): corner_points.append((0, y_intercept2))
-        if x_intercept1 != float('inf') and (kayu_meja*x_intercept1 + kayu_kursi*0 <= total_kayu): corner_points.append((x_intercept1, 0))
-        if x_intercept2 != float('inf') and (jam_meja*x_intercept2 + jam_kursi*0 <= total_jam): corner_points.append((x_intercept2, 0))
-        if intersect_point[0] > 0 and intersect_point[1] > 0: corner_points.append(tuple(intersect_point))
-        
-        corner_points_unique = sorted(list(set(corner_points)), key=lambda k: (k[0], k[1]))
-
-        optimal_profit, optimal_point = 0, (0, 0)
-        profits_at_corners = []
-        for x, y in corner_points_unique:
-            profit = profit_meja * x + profit_kursi * y
-            profits_at_corners.append({'x': round(x, 2), 'y': round(y, 2), 'profit': round(profit, 2)})
-            if profit > optimal_profit:
-                optimal_profit, optimal_point = profit, (math.floor(x), math.floor(y))
+        hasil = cache.hitung(hitung_produksi, profit_meja, profit_kursi, jam_meja, jam_kursi, kayu_meja, kayu_kursi, total_jam, total_kayu)
+
+        corner_points_unique = sorted(set(tuple(map(float, p)) for p, ok in zip(hasil['titik'], hasil['layak']) if ok))
+        profits_at_corners = [{'x': round(x, 2), 'y': round(y, 2), 'profit': round(profit_meja * x + profit_kursi * y, 2)}
+                              for x, y in corner_points_unique]
+        # Solusi bulat dari branch-and-bound; titik sudut di atas hanya untuk penjelasan relaksasi LP
+        lp = cache.hitung(selesaikan_lp, [profit_meja, profit_kursi], [[jam_meja, jam_kursi], [kayu_meja, kayu_kursi]],
+                          [total_jam, total_kayu], integer=True)
+        optimal_profit = float(lp['nilai'])
+        optimal_point = (int(lp['x'][0]), int(lp['x'][1]))
         
         with st.expander("Lihat Proses Perhitungan"):
             st.markdown("**Fungsi Tujuan dengan Angka:**")
@@ -117,8 +292,36 @@ def optimasi_produksi():
             st.latex(f"2. \quad {kayu_meja}x + {kayu_kursi}y \le {total_kayu}")
             st.markdown("**Perhitungan di Titik-Titik Sudut:**")
             for p in profits_at_corners:
-                is_optimal = (math.floor(p['x']) == optimal_point[0] and math.floor(p['y']) == optimal_point[1])
-                st.write(f"- Titik ({p['x']}, {p['y']}): Keuntungan = Rp {p['profit']:,.0f} {'**(Optimal)**' if is_optimal else ''}")
+                is_optimal = (p['x'], p['y']) == (round(float(hasil['x']), 2), round(float(hasil['y']), 2))
+                st.write(f"- Titik ({p['x']}, {p['y']}): Keuntungan = Rp {p['profit']:,.0f} {'**(Optimal LP)**' if is_optimal else ''}")
+            st.markdown("**Solusi Bulat (Branch-and-Bound):**")
+            st.write(f"- Titik {optimal_point}: Keuntungan = Rp {optimal_profit:,.0f} "
+                     f"({lp['node']} node, batas atas relaksasi Rp {lp['nilai_relaksasi']:,.0f})")
+            st.markdown("**Harga Bayangan (Shadow Price):**")
+            st.write(f"- Jam kerja: Rp {lp['shadow_price'][0]:,.0f} per jam tambahan")
+            st.write(f"- Kayu jati: Rp {lp['shadow_price'][1]:,.0f} per unit tambahan")
+
+        with st.expander("📈 Analisis Parametrik: Rentang Rencana Tetap Optimal"):
+            c_lp, A_lp, b_lp = [profit_meja, profit_kursi], [[jam_meja, jam_kursi], [kayu_meja, kayu_kursi]], [total_jam, total_kayu]
+            rentang = cache.hitung(rentang_optimal, c_lp, A_lp, b_lp)
+            if rentang['status'] == 'optimal':
+                st.markdown("Selama parameter tetap di dalam rentang ini (dan parameter lain tidak berubah), rencana "
+                            "produksi relaksasi LP tidak berubah; di rentang ruas kanan, keuntungan berubah tepat sebesar harga bayangan.")
+                def format_rp(v):
+                    return f"{v:,.0f}" if np.isfinite(v) else "tak terbatas"
+                st.dataframe({'Parameter': ["Keuntungan per Meja (Rp)", "Keuntungan per Kursi (Rp)", "Total Jam Kerja", "Total Kayu"],
+                              'Saat Ini': [format_rp(v) for v in c_lp + b_lp],
+                              'Batas Bawah': [format_rp(max(v, 0)) for v in np.concatenate([rentang['c_bawah'], rentang['b_bawah']])],
+                              'Batas Atas': [format_rp(v) for v in np.concatenate([rentang['c_atas'], rentang['b_atas']])]},
+                             hide_index=True, width='stretch')
+                pilihan_parametrik = {"Keuntungan per Meja (Rp)": ('c', 0), "Keuntungan per Kursi (Rp)": ('c', 1),
+                                      "Total Jam Kerja": ('b', 0), "Total Kayu": ('b', 1)}
+                label_parametrik = st.selectbox("Parameter yang Divariasikan", list(pilihan_parametrik))
+                parameter, indeks = pilihan_parametrik[label_parametrik]
+                sekarang = (c_lp if parameter == 'c' else b_lp)[indeks]
+                tampilkan_grafik(grafik_parametrik, c=c_lp, A=A_lp, b=b_lp, parameter=parameter, indeks=indeks,
+                                 batas=(0, 3 * max(sekarang, 1)), label_parameter=label_parametrik)
+                st.caption("Setiap titik patah diselesaikan ulang dengan warm start dari basis sebelumnya, jadi seluruh kurva hanya butuh beberapa pivot simpleks.")
 
     with col2:
         st.subheader("💡 Hasil dan Wawasan Bisnis")
@@ -135,41 +338,21 @@ def optimasi_produksi():
         
         with st.container(border=True):
             st.markdown("**Analisis Sumber Daya (Bottleneck):**")
-            if (total_jam - jam_terpakai) < 1 and (total_kayu - kayu_terpakai) < 1:
+            jam_binding, kayu_binding = (bool(v) for v in lp['binding'])
+            if jam_binding and kayu_binding:
                  st.error("- **Kritis:** Kedua sumber daya (jam dan kayu) habis. Peningkatan kapasitas mutlak diperlukan.")
-            elif (total_jam - jam_terpakai) < 1:
-                st.warning("- **Kendala Utama:** Jam kerja habis. Fokus pada penambahan jam kerja atau efisiensi pengrajin.")
-            elif (total_kayu - kayu_terpakai) < 1:
-                st.warning("- **Kendala Utama:** Stok kayu habis. Prioritaskan mencari pemasok tambahan.")
+            elif jam_binding:
+                st.warning(f"- **Kendala Utama:** Jam kerja habis. Setiap jam tambahan bernilai Rp {lp['shadow_price'][0]:,.0f}. Fokus pada penambahan jam kerja atau efisiensi pengrajin.")
+            elif kayu_binding:
+                st.warning(f"- **Kendala Utama:** Stok kayu habis. Setiap unit kayu tambahan bernilai Rp {lp['shadow_price'][1]:,.0f}. Prioritaskan mencari pemasok tambahan.")
             else:
                 st.info("- **Kapasitas Tersedia:** Sumber daya masih ada. Ada ruang untuk meningkatkan produksi jika permintaan meningkat.")
 
         # Ini code untuk membuat grafiknya
         st.markdown("#### Visualisasi Daerah Produksi yang Layak")
-        fig, ax = plt.subplots(figsize=(10, 5))
-        
-        max_x = max(x_intercept1, x_intercept2) if max(x_intercept1, x_intercept2) > 0 else 50
-        x_vals = np.linspace(0, max_x * 1.1, 400)
-        
-        y1 = (total_jam - jam_meja * x_vals) / jam_kursi if jam_kursi > 0 else np.full_like(x_vals, float('inf'))
-        ax.plot(x_vals, y1, label=f'Batas Jam Kerja')
-        
-        y2 = (total_kayu - kayu_meja * x_vals) / kayu_kursi if kayu_kursi > 0 else np.full_like(x_vals, float('inf'))
-        ax.plot(x_vals, y2, label=f'Batas Stok Kayu')
-        
-        y_feasible = np.minimum(y1, y2)
-        ax.fill_between(x_vals, 0, y_feasible, where=(y_feasible>=0), color='green', alpha=0.2, label='Daerah Produksi Layak')
-        
-        ax.plot(optimal_point[0], optimal_point[1], 'ro', markersize=12, label=f'Titik Optimal ({optimal_point[0]}, {optimal_point[1]})')
-        
-        ax.set_xlabel('Jumlah Meja (x)')
-        ax.set_ylabel('Jumlah Kursi (y)')
-        ax.set_title('Grafik Optimasi Produksi Mebel', fontsize=16)
-        ax.legend()
-        ax.grid(True)
-        ax.set_xlim(left=0)
-        ax.set_ylim(bottom=0)
-        st.pyplot(fig)
+        tampilkan_grafik(grafik_produksi, jam_meja=jam_meja, jam_kursi=jam_kursi, kayu_meja=kayu_meja,
+                         kayu_kursi=kayu_kursi, total_jam=total_jam, total_kayu=total_kayu,
+                         x_optimal=optimal_point[0], y_optimal=optimal_point[1])
 
         with st.container(border=True):
             st.markdown("**🔍 Penjelasan Grafik:**")
@@ -180,7 +363,17 @@ def optimasi_produksi():
             - **Titik Merah (Solusi Optimal):** Dari semua titik di sudut daerah hijau, titik ini adalah yang memberikan **keuntungan tertinggi**. Ini adalah jawaban yang kita cari.
             """)
 
+    peta_sensitivitas('produksi', hitung_produksi,
+                      dict(profit_kursi=profit_kursi, jam_meja=jam_meja, jam_kursi=jam_kursi, kayu_meja=kayu_meja,
+                           kayu_kursi=kayu_kursi, total_kayu=total_kayu),
+                      ('profit_meja', "Keuntungan per Meja (Rp)", profit_meja, 0, max(2 * profit_meja, 100_000)),
+                      ('total_jam', "Total Jam Kerja per Minggu", total_jam, 1, max(2 * total_jam, 10)),
+                      {"Keuntungan Maksimal (Rp)": ('profit', 1.0), "Jumlah Meja (kontinu)": ('x', 1.0),
+                       "Jumlah Kursi (kontinu)": ('y', 1.0)})
+
 # --- TAB 2: MODEL PERSEDIAAN ---
+@st.fragment
+@terukur
 def model_persediaan():
     st.header("📦 Manajemen Persediaan (EOQ)")
     st.subheader("Studi Kasus: Kedai Kopi 'Kopi Kita'")
@@ -193,13 +386,36 @@ def model_persediaan():
         'Kopi Kita' perlu menentukan jumlah pesanan biji kopi impor yang optimal untuk meminimalkan total biaya persediaan (biaya pesan dan biaya simpan).
         """)
         
+        with st.expander("📂 Estimasi Parameter dari Log Historis"):
+            st.caption("Log dibaca per potongan (streaming/memory-map) sekali saja; hasilnya di-cache per sidik jari berkas.")
+            log_permintaan = statistik_log('log_permintaan', "Log Transaksi Penjualan", "tanggal, jumlah",
+                                           statistik_permintaan)
+            log_lead_time = statistik_log('log_lead_time', "Log Pesanan Pemasok", "tanggal_pesan, tanggal_terima",
+                                          statistik_lead_time)
+            if log_permintaan:
+                st.success(f"{log_permintaan['n_transaksi']:,} transaksi selama {log_permintaan['n_hari']:,} hari: "
+                           f"rata-rata {log_permintaan['rata_harian']:.2f} kg/hari (SD {log_permintaan['sd_harian']:.2f}).")
+            if log_lead_time:
+                st.success(f"{log_lead_time['n']:,} pesanan: lead time rata-rata {log_lead_time['rata']:.1f} hari "
+                           f"(SD {log_lead_time['sd']:.1f}, {log_lead_time['minimum']:.0f}–{log_lead_time['maksimum']:.0f} hari).")
+
         with st.container(border=True):
             st.subheader("⚙️ Parameter Model")
-            D = st.number_input("Permintaan Tahunan (kg)", min_value=1, value=1200)
+            D = st.number_input("Permintaan Tahunan (kg)", min_value=1,
+                                value=max(round(log_permintaan['D']), 1) if log_permintaan else 1200)
             S = st.number_input("Biaya Pemesanan per Pesanan (Rp)", min_value=0, value=500000)
             H = st.number_input("Biaya Penyimpanan per kg per Tahun (Rp)", min_value=0, value=25000)
-            lead_time = st.number_input("Lead Time Pengiriman (hari)", min_value=1, value=14)
+            lead_time = st.number_input("Lead Time Pengiriman (hari)", min_value=1,
+                                        value=max(round(log_lead_time['rata']), 1) if log_lead_time else 14)
             safety_stock = st.number_input("Stok Pengaman (Safety Stock) (kg)", min_value=0, value=10, help="Stok tambahan untuk mengantisipasi ketidakpastian permintaan atau keterlambatan.")
+
+        with st.container(border=True):
+            st.subheader("🎲 Ketidakpastian (Simulasi Monte Carlo)")
+            sd_permintaan = st.number_input("Simpangan Baku Permintaan Harian (kg)", min_value=0.0, step=0.5,
+                                            value=round(log_permintaan['sd_harian'], 2) if log_permintaan else 1.0)
+            sd_lead_time = st.number_input("Simpangan Baku Lead Time (hari)", min_value=0.0, step=0.5,
+                                           value=round(log_lead_time['sd'], 2) if log_lead_time else 2.0)
+            target_layanan = st.slider("Target Tingkat Layanan", 0.80, 0.99, 0.95, 0.01, help="Peluang tidak kehabisan stok dalam satu siklus pemesanan.")
         
         with st.expander("Penjelasan Rumus Model: Economic Order Quantity (EOQ)"):
             st.markdown("""
@@ -221,17 +437,11 @@ def model_persediaan():
             st.latex(r'''ROP = (\text{Permintaan Harian}) \times \text{Lead Time} + \text{Stok Pengaman}''')
             st.latex(r''' TC = \left(\frac{D}{Q}\right)S + \left(\frac{Q}{2}\right)H ''')
 
-        if H > 0 and D > 0:
-            eoq = math.sqrt((2 * D * S) / H)
-            frekuensi_pesanan = D / eoq if eoq > 0 else 0
-            biaya_pemesanan = (D/eoq) * S if eoq > 0 else 0
-            biaya_penyimpanan = (eoq/2) * H
-            total_biaya = biaya_pemesanan + biaya_penyimpanan
-            permintaan_harian = D / 360
-            rop = (permintaan_harian * lead_time) + safety_stock
-            siklus_pemesanan = 360 / frekuensi_pesanan if frekuensi_pesanan > 0 else 0
-        else:
-            eoq = 0; total_biaya = 0; rop = 0; siklus_pemesanan = 0
+        hasil = {k: float(v) for k, v in cache.hitung(hitung_persediaan, D, S, H, lead_time, safety_stock).items()}
+        eoq = hasil['eoq']; total_biaya = hasil['total_biaya']; rop = hasil['rop']
+        siklus_pemesanan = hasil['siklus_pemesanan']
+        simulasi = cache.hitung(simulasi_persediaan, D, eoq, rop, safety_stock, lead_time, sd_permintaan, sd_lead_time,
+                                target_layanan=target_layanan)
 
         # Proses Perhitungan EOQ, ROP, dan TC    
         with st.expander("Lihat Proses Perhitungan"):
@@ -262,30 +472,22 @@ def model_persediaan():
                 st.info("- **Frekuensi Tinggi:** Pesanan dalam jumlah kecil tapi sering. Ini hemat biaya simpan, tapi boros biaya administrasi pemesanan.")
             else:
                 st.success("- **Kebijakan Seimbang:** Kuantitas pesanan Anda menyeimbangkan biaya pesan dan biaya simpan dengan baik.")
+
+        with st.container(border=True):
+            st.markdown("**Hasil Simulasi Monte Carlo (2.000 replikasi × 360 hari):**")
+            col1_sim, col2_sim, col3_sim = st.columns(3)
+            col1_sim.metric(label="📈 Fill Rate", value=f"{simulasi['fill_rate']:.2%}")
+            col2_sim.metric(label="⚠️ Peluang Kehabisan per Siklus", value=f"{simulasi['prob_kehabisan_siklus']:.1%}")
+            col3_sim.metric(label="🛡️ Safety Stock Dibutuhkan", value=f"{simulasi['safety_stock_target']:.1f} kg",
+                            help=f"Untuk target tingkat layanan {target_layanan:.0%} per siklus.")
+            if safety_stock < simulasi['safety_stock_target']:
+                st.warning(f"- **Stok Pengaman Kurang:** Dengan ketidakpastian ini, stok pengaman {safety_stock} kg belum cukup. Naikkan menjadi sekitar **{simulasi['safety_stock_target']:.0f} kg**.")
+            else:
+                st.success(f"- **Stok Pengaman Cukup:** Stok pengaman {safety_stock} kg sudah memenuhi target tingkat layanan {target_layanan:.0%}.")
         
         # Ini code untuk membuat grafik visualisasi analisis biaya
         st.markdown("#### Visualisasi Analisis Biaya")
-        q = np.linspace(max(1, eoq * 0.1), eoq * 2 if eoq > 0 else 200, 100)
-        holding_costs = (q / 2) * H
-        ordering_costs = (D / q) * S
-        total_costs = holding_costs + ordering_costs
-        
-        fig, ax = plt.subplots(figsize=(10, 5))
-        ax.plot(q, holding_costs, 'b-', label='Biaya Penyimpanan')
-        ax.plot(q, ordering_costs, 'g-', label='Biaya Pemesanan')
-        ax.plot(q, total_costs, 'r-', linewidth=3, label='Total Biaya')
-        if eoq > 0:
-            ax.axvline(x=eoq, color='purple', linestyle='--', label=f'EOQ')
-            ax.annotate(f'Biaya Terendah\nRp {total_biaya:,.0f}', xy=(eoq, total_biaya), xytext=(eoq*1.3, total_biaya*0.6),
-                        arrowprops=dict(facecolor='black', shrink=0.05), fontsize=12)
-
-        ax.set_xlabel('Kuantitas Pemesanan (kg)')
-        ax.set_ylabel('Biaya Tahunan (Rp)')
-        ax.set_title('Analisis Biaya Persediaan (EOQ)', fontsize=16)
-        ax.legend()
-        ax.grid(True)
-        ax.ticklabel_format(style='plain', axis='y')
-        st.pyplot(fig)
+        tampilkan_grafik(grafik_biaya_persediaan, D=D, S=S, H=H)
 
         with st.container(border=True):
              st.markdown("**🔍 Penjelasan Grafik Analisis Biaya:**")
@@ -299,33 +501,8 @@ def model_persediaan():
 
         # Ini code untuk membuat grafik visualisasi siklus persediaan
         st.markdown("#### Visualisasi Siklus Persediaan")
-        fig2, ax2 = plt.subplots(figsize=(10, 5))
-        if siklus_pemesanan > 0 and eoq > 0:
-            t_total = siklus_pemesanan * 2
-            t = np.linspace(0, t_total, 200)
-            stok_level = []
-            for time_point in t:
-                sisa_waktu_siklus = time_point % siklus_pemesanan
-                stok = (eoq + safety_stock) - permintaan_harian * sisa_waktu_siklus
-                stok_level.append(max(stok, safety_stock))
-            
-            ax2.plot(t, stok_level, label='Tingkat Persediaan')
-            ax2.axhline(y=rop, color='orange', linestyle='--', label=f'ROP ({rop:.1f} kg)')
-            ax2.axhline(y=safety_stock, color='red', linestyle=':', label=f'Stok Pengaman ({safety_stock} kg)')
-            
-            t_pesan = siklus_pemesanan - lead_time
-            if t_pesan > 0:
-                ax2.scatter(t_pesan, rop, color='red', s=100, zorder=5)
-                ax2.annotate('Pesan Ulang!', xy=(t_pesan, rop), xytext=(t_pesan, rop + eoq*0.3),
-                             arrowprops=dict(facecolor='red', shrink=0.05))
-
-        ax2.set_xlabel('Waktu (Hari)')
-        ax2.set_ylabel('Jumlah Stok (kg)')
-        ax2.set_title('Simulasi Siklus Persediaan', fontsize=16)
-        ax2.legend()
-        ax2.grid(True)
-        ax2.set_ylim(bottom=0)
-        st.pyplot(fig2)
+        tampilkan_grafik(grafik_siklus_persediaan, D=D, S=S, H=H, lead_time=lead_time, safety_stock=safety_stock,
+                         sd_permintaan=sd_permintaan, sd_lead_time=sd_lead_time)
 
         with st.container(border=True):
              st.markdown("**🔍 Penjelasan Grafik Siklus:**")
@@ -335,9 +512,61 @@ def model_persediaan():
              - **Garis Oranye (ROP):** Ketika stok menyentuh garis ini, inilah saatnya untuk memesan barang baru.
              - **Garis Merah (Stok Pengaman):** Stok minimum yang harus dijaga untuk menghindari kehabisan barang jika terjadi keterlambatan pengiriman.
              - **Siklus:** Stok akan kembali penuh (ke level EOQ + Stok Pengaman) setelah pesanan baru tiba.
+             - **Garis Abu-abu:** Contoh hasil simulasi dengan permintaan dan lead time acak. Jika garis menyentuh nol, terjadi kehabisan stok.
              """)
 
+    with st.expander("🏬 EOQ Katalog Multi-SKU dengan Kapasitas Gudang dan Modal Bersama"):
+        st.caption(f"Unggah CSV dengan kolom {', '.join(KOLOM_KATALOG)} (tiga pertama wajib), atau pakai katalog contoh.")
+        berkas = st.file_uploader("Katalog SKU (CSV)", type='csv', key='katalog_csv')
+        col_kat1, col_kat2, col_kat3 = st.columns(3)
+        if berkas is None:
+            n_sku = col_kat1.select_slider("Jumlah SKU Contoh", [1_000, 10_000, 100_000], value=10_000)
+            katalog = katalog_contoh(n_sku)
+        else:
+            try:
+                katalog = baca_katalog(berkas.getvalue())
+            except ValueError as e:
+                st.error(str(e))
+                katalog = None
+        persen_ruang = col_kat2.slider("Kapasitas Gudang (% kebutuhan tanpa batas)", 10, 100, 70, 5)
+        persen_modal = col_kat3.slider("Anggaran Modal Kerja (% kebutuhan tanpa batas)", 10, 100, 80, 5)
+
+        if katalog is not None:
+            with pengukur.ukur('hitung'):
+                katalog_hasil = persediaan_katalog(katalog, persen_ruang, persen_modal)
+            if katalog_hasil['status'] != 'optimal':
+                st.error("Safety stock saja sudah melebihi kapasitas gudang atau anggaran modal. Longgarkan batasnya.")
+            else:
+                col_m1, col_m2, col_m3 = st.columns(3)
+                col_m1.metric("💰 Total Biaya Persediaan", f"Rp {katalog_hasil['total_biaya']:,.0f}",
+                              delta=f"{katalog_hasil['total_biaya'] / katalog_hasil['total_biaya_bebas'] - 1:+.1%} vs tanpa batas",
+                              delta_color="inverse")
+                col_m2.metric("📦 Harga Bayangan Ruang", f"Rp {katalog_hasil['harga_bayangan_ruang']:,.0f} per m³",
+                              help="Penghematan biaya tahunan jika kapasitas gudang bertambah 1 m³.")
+                col_m3.metric("🏦 Harga Bayangan Modal", f"Rp {katalog_hasil['harga_bayangan_modal']:,.3f} per Rp",
+                              help="Penghematan biaya tahunan jika anggaran modal kerja bertambah Rp 1.")
+                teratas = np.argsort(katalog_hasil['biaya'])[::-1][:20]
+                st.markdown("**20 SKU dengan Biaya Persediaan Terbesar:**")
+                st.dataframe({'SKU': teratas + 1, 'Permintaan (kg/tahun)': katalog['D'][teratas].round(0),
+                              'EOQ Tanpa Batas (kg)': katalog_hasil['eoq_bebas'][teratas].round(1),
+                              'EOQ Berkendala (kg)': katalog_hasil['eoq'][teratas].round(1),
+                              'ROP (kg)': katalog_hasil['rop'][teratas].round(1),
+                              'Biaya (Rp/tahun)': katalog_hasil['biaya'][teratas].round(0)}, hide_index=True, width='stretch')
+                hasil_csv = io.StringIO()
+                np.savetxt(hasil_csv, np.column_stack([np.arange(1, katalog_hasil['eoq'].size + 1), katalog_hasil['eoq'],
+                                                       katalog_hasil['rop'], katalog_hasil['biaya']]),
+                           delimiter=',', header='sku,eoq,rop,biaya', comments='', fmt=['%d', '%.4f', '%.4f', '%.2f'])
+                st.download_button("⬇️ Unduh EOQ dan ROP Semua SKU (CSV)", hasil_csv.getvalue(), 'eoq_katalog.csv', 'text/csv')
+
+    peta_sensitivitas('persediaan', hitung_persediaan, dict(S=S, lead_time=lead_time, safety_stock=safety_stock),
+                      ('D', "Permintaan Tahunan (kg)", D, 1, max(2 * D, 10)),
+                      ('H', "Biaya Simpan per kg per Tahun (Rp)", H, 1, max(2 * H, 10)),
+                      {"Total Biaya Persediaan (Rp/tahun)": ('total_biaya', 1.0), "EOQ (kg)": ('eoq', 1.0),
+                       "Siklus Pemesanan (hari)": ('siklus_pemesanan', 1.0)})
+
 # --- TAB 3: MODEL ANTRIAN ---
+@st.fragment
+@terukur
 def model_antrian():
     st.header("⏳ Analisis Sistem Antrian")
     st.subheader("Studi Kasus: Drive-Thru 'Ayam Goreng Juara' saat Jam Sibuk")
@@ -350,12 +579,44 @@ def model_antrian():
         Manajemen 'Ayam Goreng Juara' ingin menganalisis efisiensi layanan drive-thru untuk menyeimbangkan biaya operasional dan kepuasan pelanggan (waktu tunggu).
         """)
         
+        with st.expander("📂 Estimasi Parameter dari Log Kedatangan"):
+            st.caption("Waktu datang berupa tanggal-waktu ISO atau detik; durasi layanan dalam detik. Log harus terurut menurut waktu datang.")
+            log_kedatangan = statistik_log('log_kedatangan', "Log Kedatangan Drive-Thru", "waktu_datang, durasi_layanan",
+                                           statistik_kedatangan, kolom_layanan='durasi_layanan')
+            if log_kedatangan:
+                st.success(f"{log_kedatangan['n']:,} kedatangan selama {log_kedatangan['rentang_jam']:,.0f} jam: "
+                           f"λ = {log_kedatangan['lmbda']:.1f}/jam (CV {log_kedatangan['cv_kedatangan']:.2f}), "
+                           f"μ = {log_kedatangan['mu']:.1f}/jam (CV {log_kedatangan['cv_layanan']:.2f}).")
+
         with st.container(border=True):
             st.subheader("📈 Parameter Sistem")
-            lmbda = st.slider("Tingkat Kedatangan (λ - mobil/jam)", 1, 100, 30)
-            mu = st.slider("Tingkat Pelayanan (μ - mobil/jam)", 1, 100, 35)
+            lmbda = st.slider("Tingkat Kedatangan (λ - mobil/jam)", 1, 100,
+                              min(max(round(log_kedatangan['lmbda']), 1), 100) if log_kedatangan else 30)
+            mu = st.slider("Tingkat Pelayanan (μ - mobil/jam)", 1, 100,
+                           min(max(round(log_kedatangan['mu']), 1), 100) if log_kedatangan else 35)
+            c = st.slider("Jumlah Jalur Layanan (c - server)", 1, 20, 1)
+            K = st.number_input("Kapasitas Maksimum Sistem (K - mobil, 0 = tak terbatas)", min_value=0, value=0, step=1,
+                                help="Mobil yang datang saat sistem penuh akan pergi (balk). Nilai K minimal sama dengan c.")
+            target_wq = st.number_input("Target Waktu Tunggu Maksimal (menit)", min_value=0.5, value=5.0, step=0.5)
+
+        with st.container(border=True):
+            st.subheader("🎲 Simulasi Distribusi Umum")
+            pakai_simulasi = st.toggle("Hitung dari simulasi (bukan rumus M/M/c)", value=False,
+                                       help="Untuk waktu layanan yang tidak eksponensial atau kedatangan yang bergerombol. Tidak berlaku jika K dibatasi.")
+            if pakai_simulasi:
+                pilihan_layanan = {"Lognormal": 'lognormal', "Eksponensial": 'eksponensial', "Gamma": 'gamma', "Konstan": 'deterministik'}
+                layanan = pilihan_layanan[st.selectbox("Distribusi Waktu Layanan", list(pilihan_layanan))]
+                cv_layanan = st.number_input("Koefisien Variasi Waktu Layanan", min_value=0.0, step=0.1,
+                                             value=round(log_kedatangan['cv_layanan'], 2) if log_kedatangan else 0.5,
+                                             disabled=layanan in ('eksponensial', 'deterministik'))
+                cv_kedatangan = st.number_input("Koefisien Variasi Antar-Kedatangan", min_value=0.1, step=0.1,
+                                                value=max(round(log_kedatangan['cv_kedatangan'], 2), 0.1) if log_kedatangan else 1.0,
+                                                help="1 = Poisson; lebih dari 1 = kedatangan bergerombol (jam sibuk).")
+                # Lebih dari satu jalur memakai loop per pelanggan; 10 juta pelanggan hanya untuk satu jalur (tervektorisasi)
+                pilihan_n = [100_000, 1_000_000, 10_000_000] if c == 1 else [100_000, 1_000_000]
+                n_pelanggan = st.select_slider("Jumlah Pelanggan Disimulasikan", pilihan_n, value=1_000_000)
             
-        with st.expander("Penjelasan Rumus Model: Antrian M/M/1"):
+        with st.expander("Penjelasan Rumus Model: Antrian M/M/1 dan M/M/c"):
             st.markdown("""
             Model antrian M/M/1 digunakan untuk menganalisis sistem dengan satu server (pelayan). Model ini membantu kita memahami metrik kinerja utama:
             - **Utilisasi (ρ):** Seberapa sibuk server? Nilai mendekati 100% berarti sangat sibuk dan berisiko antrian panjang.
@@ -367,19 +628,47 @@ def model_antrian():
             # Rumus yang digunakan
             st.markdown("**Variabel:** $\lambda$ (Tingkat Kedatangan), $\mu$ (Tingkat Pelayanan)")
             st.latex(r''' \rho = \frac{\lambda}{\mu} \quad | \quad L = \frac{\rho}{1 - \rho} \quad | \quad W = \frac{L}{\lambda} ''')
-            
-        if mu <= lmbda:
-            st.error("Tingkat pelayanan (μ) harus lebih besar dari tingkat kedatangan (λ) agar antrian stabil.")
+            st.markdown("Untuk $c$ jalur layanan (M/M/c), peluang harus menunggu dihitung dengan rumus **Erlang C**:")
+            st.latex(r''' \rho = \frac{\lambda}{c\mu} \quad | \quad L_q = C(c, \tfrac{\lambda}{\mu}) \frac{\rho}{1 - \rho} \quad | \quad W_q = \frac{L_q}{\lambda} ''')
+
+        staf = cache.hitung(staf_minimal, lmbda, mu, target_wq / 60)
+        c_disarankan = int(staf['c'])
+
+        if K == 0 and c * mu <= lmbda:
+            st.error("Kapasitas pelayanan total (c × μ) harus lebih besar dari tingkat kedatangan (λ) agar antrian stabil.")
+            st.info(f"**Rekomendasi Staf:** Buka minimal **{c_disarankan} jalur layanan** agar waktu tunggu rata-rata tidak lebih dari {target_wq:.1f} menit.")
             return
-        
-        rho = lmbda / mu; L = rho / (1 - rho); Lq = (rho**2) / (1 - rho); W = L / lmbda; Wq = Lq / lmbda
-        
+
+        if K > 0:
+            hasil = cache.hitung(hitung_mmck, lmbda, mu, c, max(K, c))
+        else:
+            hasil = cache.hitung(hitung_mmc, lmbda, mu, c)
+        rho, L, Lq, W, Wq, p_tunggu = (float(hasil[k]) for k in ('rho', 'L', 'Lq', 'W', 'Wq', 'p_tunggu'))
+        p_blok = float(hasil['p_blok']) if K > 0 else 0.0
+
+        simulasi = None
+        if pakai_simulasi and K == 0:
+            simulasi = cache.hitung(simulasi_antrian, lmbda, mu, c, 'gamma' if cv_kedatangan != 1 else 'eksponensial',
+                                    cv_kedatangan, layanan, cv_layanan, n_pelanggan)
+            # Metrik empiris menggantikan rumus; L dan Lq mengikuti hukum Little
+            Wq, W, p_tunggu = simulasi['Wq'], simulasi['W'], simulasi['p_tunggu']
+            Lq, L = lmbda * Wq, lmbda * W
+
         with st.expander("Lihat Proses Perhitungan"):
-            st.latex(fr"\rho = \frac{{{lmbda}}}{{{mu}}} = {rho:.2f} \quad (Utilisasi)")
-            st.latex(fr"L = \frac{{{rho:.2f}}}{{1 - {rho:.2f}}} = {L:.2f} \text{{ mobil di sistem}}")
-            st.latex(fr"L_q = \frac{{{rho:.2f}^2}}{{1 - {rho:.2f}}} = {Lq:.2f} \text{{ mobil di antrian}}")
-            st.latex(fr"W = \frac{{{L:.2f}}}{{{lmbda}}} = {W:.3f} \text{{ jam, atau }} {W*60:.2f} \text{{ menit}}")
-            st.latex(fr"W_q = \frac{{{Lq:.2f}}}{{{lmbda}}} = {Wq:.3f} \text{{ jam, atau }} {Wq*60:.2f} \text{{ menit}}")
+            # Rumus M/M/1 hanya ditulis bila angkanya memang dari rumus, bukan dari simulasi
+            if c == 1 and K == 0 and simulasi is None:
+                st.latex(fr"\rho = \frac{{{lmbda}}}{{{mu}}} = {rho:.2f} \quad (Utilisasi)")
+                st.latex(fr"L = \frac{{{rho:.2f}}}{{1 - {rho:.2f}}} = {L:.2f} \text{{ mobil di sistem}}")
+                st.latex(fr"L_q = \frac{{{rho:.2f}^2}}{{1 - {rho:.2f}}} = {Lq:.2f} \text{{ mobil di antrian}}")
+                st.latex(fr"W = \frac{{{L:.2f}}}{{{lmbda}}} = {W:.3f} \text{{ jam, atau }} {W*60:.2f} \text{{ menit}}")
+                st.latex(fr"W_q = \frac{{{Lq:.2f}}}{{{lmbda}}} = {Wq:.3f} \text{{ jam, atau }} {Wq*60:.2f} \text{{ menit}}")
+            else:
+                st.latex(fr"\rho = \frac{{{lmbda}}}{{{c} \times {mu}}} = {rho:.2f} \quad (Utilisasi)")
+                st.latex(fr"P(\text{{menunggu}}) = {p_tunggu:.2%}" + (fr" \quad | \quad P(\text{{ditolak}}) = {p_blok:.2%}" if K > 0 else ""))
+                st.latex(fr"L = {L:.2f} \text{{ mobil di sistem}} \quad | \quad L_q = {Lq:.2f} \text{{ mobil di antrian}}")
+                st.latex(fr"W = {W*60:.2f} \text{{ menit}} \quad | \quad W_q = {Wq*60:.2f} \text{{ menit}}")
+            if simulasi is not None:
+                st.markdown(f"**Hasil simulasi {simulasi['n_pelanggan']:,} pelanggan:** L dan Lq dihitung dari hukum Little ($L = \lambda W$).")
 
     with col2:
         st.subheader("💡 Hasil dan Wawasan Bisnis")
@@ -393,6 +682,16 @@ def model_antrian():
         with col2_res:
             st.metric(label="🚗 Rata-rata Panjang Antrian (Lq)", value=f"{Lq:.2f} mobil")
             st.metric(label="⏳ Rata-rata Waktu Tunggu (Wq)", value=f"{Wq*60:.2f} menit")
+        col1_res.metric(label="🕒 Peluang Harus Menunggu", value=f"{p_tunggu:.1%}")
+        if K > 0:
+            col2_res.metric(label="🚫 Peluang Mobil Ditolak (Sistem Penuh)", value=f"{p_blok:.1%}")
+
+        if simulasi is not None:
+            with st.container(border=True):
+                st.markdown("**Sebaran Waktu Tunggu (Simulasi):**")
+                for kolom, q in zip(st.columns(3), (50, 95, 99)):
+                    kolom.metric(label=f"⏱️ Wq Persentil ke-{q}", value=f"{simulasi['persentil_Wq'][q]*60:.2f} menit")
+                st.caption(f"{100 - 95}% pelanggan menunggu lebih dari {simulasi['persentil_Wq'][95]*60:.1f} menit.")
         
         with st.container(border=True):
             st.markdown("**Analisis Kinerja Sistem:**")
@@ -402,40 +701,20 @@ def model_antrian():
                 st.warning(f"- **Perlu Diwaspadai ({rho:.1%}):** Sistem cukup sibuk dan berisiko kewalahan jika ada lonjakan pelanggan.")
             else:
                 st.info(f"- **Kinerja Sehat ({rho:.1%}):** Sistem terkendali, namun mungkin ada kapasitas layanan yang belum termanfaatkan.")
+            if c_disarankan > c:
+                st.warning(f"- **Rekomendasi Staf:** Buka **{c_disarankan} jalur layanan** agar waktu tunggu rata-rata tidak lebih dari {target_wq:.1f} menit.")
+            else:
+                st.success(f"- **Rekomendasi Staf:** {c_disarankan} jalur layanan sudah cukup untuk target waktu tunggu {target_wq:.1f} menit.")
 
         # Ini code untuk membuat grafik visualisasi kinerja antrian    
         st.markdown("#### Visualisasi Kinerja Antrian")
         
-        fig1, ax1 = plt.subplots(figsize=(8, 4))
-        waktu_pelayanan_menit = (1/mu) * 60
-        waktu_tunggu_menit = Wq * 60
-        labels = ['Waktu Menunggu di Antrian', 'Waktu Dilayani']
-        sizes = [waktu_tunggu_menit, waktu_pelayanan_menit]
-        colors = ['#ff6347','#90ee90']
-        explode = (0.1, 0)
-        
-        ax1.pie(sizes, explode=explode, labels=labels, autopct='%1.1f%%', startangle=90, colors=colors)
-        ax1.axis('equal')
-        ax1.set_title("Bagaimana Pelanggan Menghabiskan Waktunya?")
-        st.pyplot(fig1)
+        tampilkan_grafik(grafik_komposisi_waktu, lmbda=lmbda, mu=mu, c=c, K=K, Wq=None if simulasi is None else Wq)
 
         # Ini code untuk membuat grafik visualisasi probabilitas panjang antrian
         st.markdown("#### Probabilitas Panjang Antrian")
-        n_values = np.arange(0, 15)
-        p_n_values = [(1 - rho) * (rho ** n) for n in n_values]
-        
-        fig2, ax2 = plt.subplots(figsize=(10, 4))
-        ax2.bar(n_values, p_n_values, color='skyblue')
-        for i, v in enumerate(p_n_values):
-            ax2.text(i, v, f"{v:.1%}", ha='center', va='bottom', fontsize=9)
-
-        ax2.set_xlabel('Jumlah Mobil dalam Sistem (n)')
-        ax2.set_ylabel('Probabilitas P(n)')
-        ax2.set_title('Seberapa Mungkin Antrian Menjadi Panjang?')
-        ax2.set_xticks(n_values)
-        ax2.grid(True, axis='y', linestyle='--')
-        ax2.set_yticklabels([])
-        st.pyplot(fig2)
+        p_n = None if simulasi is None else simulasi['p_n']
+        tampilkan_grafik(grafik_probabilitas_antrian, lmbda=lmbda, mu=mu, c=c, K=K, p_n=p_n)
 
         with st.container(border=True):
             st.markdown("**🔍 Penjelasan Grafik:**")
@@ -443,8 +722,36 @@ def model_antrian():
             - **Grafik Pie:** Membagi total waktu pelanggan menjadi dua bagian: waktu yang dihabiskan untuk benar-benar dilayani (hijau) dan waktu yang terbuang untuk menunggu dalam antrian (merah). Persentase waktu tunggu yang besar menandakan pengalaman pelanggan yang buruk.
             - **Grafik Batang:** Menunjukkan probabilitas (kemungkinan) ada sejumlah mobil di dalam sistem. Jika bar di sebelah kanan (misalnya, 5 mobil atau lebih) memiliki nilai yang signifikan, itu berarti antrian panjang sering terjadi.
             """)
+
+        # Analisis transien: λ berubah per jam sepanjang hari operasional
+        st.markdown("#### Analisis Jam Sibuk Sepanjang Hari")
+        with st.expander("Atur Profil Kedatangan dan Jadwal Jalur Layanan per Jam", expanded=False):
+            st.caption("Nilai awal mengikuti pola makan siang dan makan malam dengan puncak sebesar λ di atas.")
+            profil_awal = {'Jam': list(range(JAM_BUKA, JAM_BUKA + len(POLA_JAM_SIBUK))),
+                           'λ (mobil/jam)': [round(lmbda * f) for f in POLA_JAM_SIBUK],
+                           'c (jalur)': [c] * len(POLA_JAM_SIBUK)}
+            profil = st.data_editor(profil_awal, disabled=['Jam'], hide_index=True, key='profil_jam_sibuk')
+        lmbda_per_jam = [float(v) for v in profil['λ (mobil/jam)']]
+        c_per_jam = [max(int(v), 1) for v in profil['c (jalur)']]
+        transien = cache.hitung(antrian_transien, profil_per_jam(lmbda_per_jam), mu, profil_per_jam(c_per_jam), 1 / 12)
+        puncak = int(transien['Wq'].argmax())
+        # Grafik memakai deret yang sudah dihitung, agar uniformisasi hanya berjalan sekali per parameter
+        tampilkan_grafik(grafik_antrian_transien, jam_mulai=JAM_BUKA, lmbda_per_jam=lmbda_per_jam,
+                         c_per_jam=c_per_jam, mu=mu, hasil={k: transien[k] for k in ('t', 'Wq', 'Lq')})
+        col1_tr, col2_tr = st.columns(2)
+        col1_tr.metric(label="⏰ Waktu Tunggu Terlama", value=f"{transien['Wq'][puncak]*60:.1f} menit",
+                       help=f"Sekitar pukul {JAM_BUKA + transien['t'][puncak]:.1f}")
+        col2_tr.metric(label="🚗 Antrian Terpanjang", value=f"{transien['Lq'].max():.1f} mobil")
+        st.caption("Dihitung secara transien (uniformisasi rantai lahir-mati), sehingga antrian yang menumpuk saat jam sibuk terbawa ke jam berikutnya. Ubah kolom c untuk membandingkan jadwal staf.")
+
+    peta_sensitivitas('antrian', hitung_mmc, dict(c=c), ('lmbda', "Tingkat Kedatangan λ (mobil/jam)", lmbda, 1, 100),
+                      ('mu', "Tingkat Pelayanan μ (mobil/jam)", mu, 1, 100),
+                      {"Waktu Tunggu Wq (menit)": ('Wq', 60.0), "Panjang Antrian Lq (mobil)": ('Lq', 1.0),
+                       "Peluang Menunggu": ('p_tunggu', 1.0), "Utilisasi ρ": ('rho', 1.0)})
             
 # --- TAB 4: KEANDALAN LINI PRODUKSI ---
+@st.fragment
+@terukur
 def model_keandalan_produksi():
     st.header("🔗 Analisis Keandalan Lini Produksi")
     st.subheader("Studi Kasus: Lini Perakitan Otomotif 'Nusantara Motor'")
@@ -454,39 +761,89 @@ def model_keandalan_produksi():
     with col1:
         st.markdown("""
         **Skenario Bisnis:**
-        Sebuah lini perakitan terdiri dari beberapa mesin yang beroperasi secara seri. Jika satu mesin berhenti, seluruh lini terhenti. Analisis ini menghitung keandalan total dan mengidentifikasi 'mata rantai terlemah'.
+        Sebuah lini perakitan terdiri dari beberapa stasiun yang beroperasi secara seri. Jika satu stasiun berhenti, seluruh lini terhenti. Stasiun dapat diberi mesin cadangan yang bekerja paralel. Analisis ini menghitung keandalan total dan mengidentifikasi komponen yang paling kritis.
         """)
         
         with st.container(border=True):
             st.subheader("🔧 Keandalan per Mesin")
-            r1 = st.slider("Stamping (R1)", 0.80, 1.00, 0.98, 0.01)
-            r2 = st.slider("Welding (R2)", 0.80, 1.00, 0.99, 0.01)
-            r3 = st.slider("Painting (R3)", 0.80, 1.00, 0.96, 0.01)
-            r4 = st.slider("Assembly (R4)", 0.80, 1.00, 0.97, 0.01)
-        
-        with st.expander("Penjelasan Rumus Model: Keandalan Sistem Seri"):
+            keandalan_mesin, unit_paralel = {}, {}
+            for i, (nama, nilai_awal) in enumerate(KEANDALAN_MESIN_BAWAAN.items(), start=1):
+                col_r, col_n = st.columns([3, 1])
+                with col_r:
+                    keandalan_mesin[nama] = st.slider(f"{nama} (R{i})", 0.80, 1.00, nilai_awal, 0.01)
+                with col_n:
+                    unit_paralel[nama] = st.number_input(f"Unit {nama}", min_value=1, max_value=4, value=1, step=1,
+                                                         help="Jumlah mesin identik yang bekerja paralel di stasiun ini.")
+
+        with st.container(border=True):
+            st.subheader("🎲 Simulasi Ketersediaan")
+            pakai_simulasi = st.toggle("Simulasikan kegagalan dan perbaikan sepanjang waktu", value=False,
+                                       help="Keandalan R di atas dibaca sebagai peluang mesin bertahan selama satu periode misi.")
+            if pakai_simulasi:
+                periode_misi = st.number_input("Periode Misi untuk R (jam)", min_value=1.0, value=8.0, step=1.0,
+                                               help="Misalnya satu shift: R = peluang mesin tidak rusak selama periode ini.")
+                horizon_hari = st.number_input("Horizon Simulasi (hari)", min_value=1, value=30, step=1)
+                laju_produksi = st.number_input("Laju Produksi Lini (unit/jam)", min_value=0.0, value=20.0, step=1.0)
+                st.caption("Bentuk β > 1 berarti mesin makin sering rusak seiring umurnya (aus); β = 1 berarti kegagalan acak.")
+                parameter_awal = {'Mesin': list(keandalan_mesin), 'Bentuk β': [1.5] * len(keandalan_mesin),
+                                  'MTTR (jam)': [4.0] * len(keandalan_mesin), 'CV Perbaikan': [0.5] * len(keandalan_mesin)}
+                parameter_mesin = st.data_editor(parameter_awal, disabled=['Mesin'], hide_index=True,
+                                                 key='parameter_ketersediaan')
+        
+        with st.expander("Penjelasan Rumus Model: Keandalan Sistem Seri-Paralel"):
             st.markdown("""
-            Keandalan sistem seri dihitung dengan mengalikan keandalan dari setiap komponennya.
+            Keandalan sistem seri dihitung dengan mengalikan keandalan dari setiap stasiunnya.
             - **Keandalan (R):** Adalah probabilitas sebuah komponen atau sistem akan berfungsi dengan baik selama periode waktu tertentu.
             - **Sistem Seri:** Komponen-komponen yang tersusun berurutan. Jika salah satu saja gagal, maka seluruh sistem akan gagal. Akibatnya, keandalan sistem seri **selalu lebih rendah** daripada keandalan komponen terlemahnya.
+            - **Redundansi Paralel:** Stasiun dengan $n$ mesin paralel hanya gagal bila semua mesinnya gagal.
+            - **Kepentingan Birnbaum:** $I_B(i) = \\partial R_s / \\partial R_i$, kenaikan keandalan sistem per kenaikan keandalan komponen $i$.
+            - **Kepentingan Kritikalitas:** $I_C(i) = I_B(i)\\,(1 - R_i)/(1 - R_s)$, peluang komponen $i$ menjadi penyebab kegagalan lini.
             """)
 
             # Rumus yang digunakan
-            st.latex(r''' R_s = R_1 \times R_2 \times \dots \times R_n = \prod_{i=1}^{n} R_i ''')
-
-        reliabilities = {'Stamping': r1, 'Welding': r2, 'Painting': r3, 'Assembly': r4}
-        keandalan_sistem = np.prod(list(reliabilities.values()))
-        weakest_link_name = min(reliabilities, key=reliabilities.get)
-        weakest_link_value = reliabilities[weakest_link_name]
+            st.latex(r''' R_s = \prod_{i=1}^{n} \left[1 - (1 - R_i)^{m_i}\right] ''')
+
+        # Setiap stasiun adalah satu mesin atau blok paralel berisi mesin identik "Nama #1", "Nama #2", ...
+        komponen_stasiun = {nama: [nama] if unit_paralel[nama] == 1 else
+                            [f"{nama} #{j}" for j in range(1, unit_paralel[nama] + 1)] for nama in keandalan_mesin}
+        definisi = ('seri', [daftar[0] if len(daftar) == 1 else ('paralel', daftar)
+                             for daftar in komponen_stasiun.values()])
+        keandalan_komponen = {komponen: keandalan_mesin[nama]
+                              for nama, daftar in komponen_stasiun.items() for komponen in daftar}
+        hasil = cache.hitung(hitung_diagram, definisi, keandalan_komponen)
+        keandalan_sistem = float(hasil['keandalan'])
+        keandalan_stasiun = {nama: 1 - (1 - r) ** unit_paralel[nama] for nama, r in keandalan_mesin.items()}
+        # Mesin paralel yang identik sama kritisnya dengan stasiunnya, jadi ambil nilai maksimum per stasiun
+        kritikalitas = dict(zip(hasil['komponen'], hasil['kritikalitas']))
+        kritikalitas_stasiun = {nama: max(kritikalitas[k] for k in daftar) for nama, daftar in komponen_stasiun.items()}
+        stasiun_kritis = max(kritikalitas_stasiun, key=kritikalitas_stasiun.get)
+
+        simulasi = None
+        if pakai_simulasi:
+            mesin = {}
+            for nama, bentuk, mttr, cv in zip(parameter_mesin['Mesin'], parameter_mesin['Bentuk β'],
+                                              parameter_mesin['MTTR (jam)'], parameter_mesin['CV Perbaikan']):
+                bentuk, mttr = max(float(bentuk), 0.1), max(float(mttr), 0.01)
+                mttf = float(mttf_dari_keandalan(min(keandalan_mesin[nama], 0.9999), periode_misi, bentuk))
+                for komponen in komponen_stasiun[nama]:
+                    mesin[komponen] = {'mttf': mttf, 'bentuk': bentuk, 'mttr': mttr, 'cv_perbaikan': max(float(cv), 0.0)}
+            # Dijalankan di proses ini: fork pool proses dari thread skrip Streamlit bisa macet
+            simulasi = cache.hitung(simulasi_ketersediaan, definisi, mesin, horizon=horizon_hari * 24.0,
+                                    laju_produksi=laju_produksi, n_proses=1)
         
         with st.expander("Lihat Proses Perhitungan"):
-            st.latex(fr"R_s = R_{{Stamping}} \times R_{{Welding}} \times R_{{Painting}} \times R_{{Assembly}}")
-            st.latex(fr"R_s = {r1} \times {r2} \times {r3} \times {r4} = {keandalan_sistem:.4f}")
+            st.latex(r"R_s = " + r" \times ".join(fr"[1 - (1 - {keandalan_mesin[nama]})^{{{unit_paralel[nama]}}}]"
+                                                  for nama in keandalan_mesin) + fr" = {keandalan_sistem:.4f}")
             st.markdown(f"**Keandalan Sistem ($R_s$)** adalah **{keandalan_sistem:.2%}**.")
+            st.dataframe({'Komponen': hasil['komponen'],
+                          'Keandalan': [keandalan_komponen[k] for k in hasil['komponen']],
+                          'Birnbaum': hasil['birnbaum'], 'Kritikalitas': hasil['kritikalitas']},
+                         hide_index=True, width='stretch')
+            st.caption("Dihitung eksak dengan diagram keputusan biner (BDD) dari diagram blok lini.")
 
     with col2:
         st.subheader("💡 Hasil dan Wawasan Bisnis")
-        st.warning(f"**Mata Rantai Terlemah:** Mesin **{weakest_link_name}** ({weakest_link_value:.1%}) adalah komponen paling berisiko. Prioritaskan perawatan dan perbaikan pada mesin ini untuk dampak terbesar.")
+        st.warning(f"**Stasiun Paling Kritis:** **{stasiun_kritis}** menyebabkan {kritikalitas_stasiun[stasiun_kritis]:.1%} dari kegagalan lini. Prioritaskan perawatan, perbaikan, atau mesin cadangan pada stasiun ini untuk dampak terbesar.")
 
         col1_res, col2_res = st.columns(2)
         with col1_res:
@@ -500,60 +857,134 @@ def model_keandalan_produksi():
             if dampak > 10:
                 st.error(f"- **Sangat Berisiko ({dampak:.1f}%):** Lini produksi kemungkinan besar akan sering berhenti, menyebabkan kerugian signifikan.")
             elif dampak > 5:
-                st.warning(f"- **Risiko Menengah ({dampak:.1f}%):** Probabilitas kegagalan cukup tinggi. Perbaikan pada mesin terlemah sangat disarankan.")
+                st.warning(f"- **Risiko Menengah ({dampak:.1f}%):** Probabilitas kegagalan cukup tinggi. Perbaikan pada stasiun paling kritis sangat disarankan.")
             else:
                 st.info(f"- **Risiko Rendah ({dampak:.1f}%):** Probabilitas kegagalan terkendali. Fokus pada perawatan rutin untuk mempertahankan kinerja.")
 
         # Ini code untuk membuat grafik visualisasi dampak keandalan komponen
         st.markdown("#### Visualisasi Dampak Keandalan Komponen")
         
-        labels = list(reliabilities.keys())
-        values = list(reliabilities.values())
-        labels.append("SISTEM TOTAL")
-        values.append(keandalan_sistem)
-        
-        fig, ax = plt.subplots(figsize=(10, 5))
-        
-        bar_colors = ['#87CEEB'] * len(reliabilities)
-        weakest_idx = list(reliabilities.keys()).index(weakest_link_name)
-        bar_colors[weakest_idx] = '#FF6347'
-        bar_colors.append('#9370DB')
-
-        bars = ax.bar(labels, values, color=bar_colors)
-        
-        ax.set_ylabel('Tingkat Keandalan (Reliability)')
-        ax.set_title('Perbandingan Keandalan Komponen dan Sistem', fontsize=16)
-        ax.set_ylim(min(0.75, min(values) * 0.95 if values else 0.75), 1.01)
-
-        for bar in bars:
-            yval = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2.0, yval, f'{yval:.2%}', ha='center', va='bottom', fontsize=10, color='black')
-            
-        st.pyplot(fig)
+        tampilkan_grafik(grafik_keandalan, nama_mesin=list(keandalan_stasiun),
+                         keandalan=list(keandalan_stasiun.values()), keandalan_sistem=keandalan_sistem,
+                         indeks_terlemah=list(keandalan_stasiun).index(stasiun_kritis))
         
         with st.container(border=True):
             st.markdown("**🔍 Penjelasan Grafik:**")
             st.markdown("""
-            Grafik ini menunjukkan bagaimana keandalan setiap mesin mempengaruhi keandalan seluruh lini produksi.
-            - **Bar Biru & Merah:** Menunjukkan keandalan setiap mesin. Bar **merah** adalah mesin dengan keandalan terendah, yang menjadi **mata rantai terlemah**.
-            - **Bar Ungu:** Menunjukkan keandalan total sistem. Perhatikan bagaimana nilainya selalu **lebih rendah** dari komponen terlemah sekalipun.
+            Grafik ini menunjukkan bagaimana keandalan setiap stasiun (termasuk mesin cadangannya) mempengaruhi keandalan seluruh lini produksi.
+            - **Bar Biru & Merah:** Menunjukkan keandalan setiap stasiun. Bar **merah** adalah stasiun dengan kepentingan kritikalitas tertinggi, yaitu yang paling sering menjadi penyebab lini berhenti.
+            - **Bar Ungu:** Menunjukkan keandalan total sistem. Perhatikan bagaimana nilainya selalu **lebih rendah** dari stasiun terlemah sekalipun.
             
-            **Kesimpulan:** Dalam sistem seri, keandalan keseluruhan sangat dipengaruhi oleh komponen yang paling tidak andal. Meningkatkan keandalan 'mata rantai terlemah' akan memberikan dampak terbesar pada peningkatan keandalan seluruh lini produksi.
+            **Kesimpulan:** Tanpa redundansi, stasiun paling kritis adalah mesin dengan keandalan terendah. Setelah mesin cadangan ditambahkan, keandalan mesin saja tidak lagi cukup; kepentingan kritikalitas menunjukkan di mana perbaikan memberi dampak terbesar pada keandalan lini.
             """)
 
+        if simulasi is not None:
+            st.markdown("#### Ketersediaan Lini Sepanjang Waktu (Simulasi)")
+            col1_sim, col2_sim, col3_sim = st.columns(3)
+            col1_sim.metric(label="⚙️ Ketersediaan Rata-rata", value=f"{simulasi['ketersediaan']:.2%}",
+                            help=f"Persentil 5%–95% antar replikasi: {simulasi['persentil_ketersediaan'][5]:.1%}–{simulasi['persentil_ketersediaan'][95]:.1%}")
+            col2_sim.metric(label="⏱️ Jam Henti Lini", value=f"{simulasi['jam_henti']:.1f} jam",
+                            help=f"Rata-rata {simulasi['kegagalan_lini']:.1f} kali lini berhenti selama horizon.")
+            col3_sim.metric(label="📉 Kehilangan Produksi", value=f"{simulasi['kehilangan_throughput']:,.0f} unit")
+            tampilkan_grafik(grafik_ketersediaan, jam=simulasi['t'], kurva_ketersediaan=simulasi['kurva_ketersediaan'],
+                             ketersediaan=simulasi['ketersediaan'],
+                             persentil_5=simulasi['persentil_ketersediaan'][5])
+            kontribusi = dict(zip(simulasi['komponen'], simulasi['kontribusi_henti']))
+            penyebab = max(komponen_stasiun, key=lambda nama: max(kontribusi[k] for k in komponen_stasiun[nama]))
+            st.caption(f"Dari 2.000 replikasi {horizon_hari} hari. Stasiun **{penyebab}** sedang rusak pada "
+                       f"{max(kontribusi[k] for k in komponen_stasiun[penyebab]):.0%} dari waktu henti lini. "
+                       "Ketersediaan menurun dari 100% karena semua mesin mulai dalam kondisi baru.")
+
+    with st.expander("🧮 Alokasi Mesin Cadangan Optimal dalam Anggaran"):
+        st.markdown("Stasiun mana yang sebaiknya diberi mesin paralel tambahan? Optimasi ini memilih jumlah unit per "
+                    "stasiun yang memaksimalkan keandalan lini tanpa melampaui anggaran investasi dan luas lantai.")
+        col_biaya, col_anggaran = st.columns([2, 1])
+        with col_biaya:
+            biaya_awal = {'Mesin': list(keandalan_mesin),
+                          'Harga per Unit (juta Rp)': [HARGA_MESIN_BAWAAN[nama] for nama in keandalan_mesin],
+                          'Luas per Unit (m²)': [LUAS_MESIN_BAWAAN[nama] for nama in keandalan_mesin],
+                          'Maks Unit': [4] * len(keandalan_mesin)}
+            biaya_mesin = st.data_editor(biaya_awal, disabled=['Mesin'], hide_index=True, key='biaya_redundansi')
+        with col_anggaran:
+            anggaran = st.number_input("Anggaran Investasi (juta Rp)", min_value=0.0, value=1500.0, step=50.0)
+            luas_tersedia = st.number_input("Luas Lantai Tersedia (m²)", min_value=0.0, value=120.0, step=10.0,
+                                            help="Isi 0 jika luas lantai tidak membatasi.")
+        unit_awal = [unit_paralel[nama] for nama in keandalan_mesin]
+        opsi = opsi_paralel(list(keandalan_mesin.values()), [float(v) for v in biaya_mesin['Harga per Unit (juta Rp)']],
+                            [float(v) for v in biaya_mesin['Luas per Unit (m²)']],
+                            maks_unit=[int(v) for v in biaya_mesin['Maks Unit']], unit_awal=unit_awal)
+        alokasi = cache.hitung(alokasi_redundansi, *opsi[:2], anggaran, ruang=opsi[2],
+                               kapasitas_ruang=luas_tersedia if luas_tersedia > 0 else None)
+        if alokasi['status'] != 'optimal':
+            st.error("Tidak ada alokasi yang memenuhi anggaran dan luas lantai.")
+        else:
+            unit_optimal = alokasi['pilihan'] + 1
+            col_r, col_b, col_l = st.columns(3)
+            col_r.metric("Keandalan Lini Setelah Alokasi", f"{alokasi['keandalan']:.2%}",
+                         f"{(alokasi['keandalan'] - keandalan_sistem) * 100:+.2f} poin")
+            col_b.metric("Biaya Investasi", f"Rp {alokasi['biaya']:,.0f} juta")
+            col_l.metric("Luas Tambahan", f"{alokasi['ruang']:,.0f} m²")
+            st.dataframe({'Stasiun': list(keandalan_mesin), 'Unit Saat Ini': unit_awal,
+                          'Unit Optimal': unit_optimal.tolist(),
+                          'Keandalan Stasiun': [f"{r:.3%}" for r in alokasi['keandalan_stasiun']]},
+                         hide_index=True, width='stretch')
+            frontier = alokasi['frontier']
+            tampilkan_grafik(grafik_frontier_redundansi, biaya=frontier['biaya'], keandalan=frontier['keandalan'],
+                             keandalan_awal=keandalan_sistem, biaya_terpilih=alokasi['biaya'],
+                             keandalan_terpilih=alokasi['keandalan'])
+            st.caption("Setiap titik frontier adalah alokasi terbaik untuk anggaran sebesar itu, dihitung sekaligus "
+                       "dengan pemrograman dinamis. Anggaran di antara dua titik tidak menaikkan keandalan.")
+
 # --- KONTROL TAB UTAMA ---
 st.header("Pilih Model Matematika", divider='rainbow')
-tab1, tab2, tab3, tab4 = st.tabs([
-    "📊 Optimasi Produksi", 
-    "📦 Model Persediaan", 
-    "⏳ Model Antrian", 
-    "🔗 Keandalan Lini Produksi"
-])
-
-with tab1: optimasi_produksi()
-with tab2: model_persediaan()
-with tab3: model_antrian()
-with tab4: model_keandalan_produksi()
+DAFTAR_MODEL = {
+    "📊 Optimasi Produksi": optimasi_produksi,
+    "📦 Model Persediaan": model_persediaan,
+    "⏳ Model Antrian": model_antrian,
+    "🔗 Keandalan Lini Produksi": model_keandalan_produksi,
+}
+
+# Setiap model adalah fragment: perubahan widget di dalamnya hanya menjalankan ulang panel itu saja
+if semua_tab:
+    for tab, tampilkan_model in zip(st.tabs(list(DAFTAR_MODEL)), DAFTAR_MODEL.values()):
+        with tab: tampilkan_model()
+else:
+    model_aktif = st.segmented_control("Model", list(DAFTAR_MODEL), default=list(DAFTAR_MODEL)[0],
+                                       key="model_aktif", label_visibility="collapsed")
+    DAFTAR_MODEL[model_aktif or list(DAFTAR_MODEL)[0]]()
+
+# --- PANEL DEBUG KINERJA ---
+# Fragment dengan refresh berkala, karena rerun fragment model tidak menggambar ulang sidebar
+@st.fragment(run_every=5)
+def panel_debug():
+    st.subheader("🛠️ Kinerja")
+    rss = rss_byte()
+    col_rss, col_grafik = st.columns(2)
+    col_rss.metric("RSS Proses", f"{rss / 2**20:,.0f} MiB" if rss is not None else "–")
+    col_grafik.metric("Cache Grafik", f"{CACHE.hit} hit", f"{CACHE.miss} miss", delta_color='off')
+    for nama in DAFTAR_MODEL.values():
+        rekaman = st.session_state.get(f"rerun_{nama.__name__}")
+        if rekaman is None or 'durasi' not in rekaman:
+            continue
+        st.markdown(f"**Rerun terakhir `{rekaman['model']}`: {rekaman['durasi'] * 1000:.0f} ms**")
+        rincian = ([f"{tahap} {durasi * 1000:.0f} ms" for tahap, durasi in rekaman['tahap'].items()] +
+                   [f"{n} {jenis}" for jenis, n in rekaman['jumlah'].items()])
+        st.caption(" · ".join(rincian))
+    ringkasan = pengukur.ringkasan()
+    if ringkasan:
+        n_rerun = sum(baris['rerun'] for baris in ringkasan if baris['tahap'] == 'total')
+        st.markdown(f"**Semua sesi di proses ini ({n_rerun} rerun terakhir)**")
+        st.dataframe(ringkasan, hide_index=True, column_config={
+            kolom: st.column_config.NumberColumn(format="%.1f") for kolom in ('rata_ms', 'p95_ms', 'maks_ms')})
+        st.download_button("⬇️ Log JSON Lines", data=pengukur.json_lines, file_name="kinerja.jsonl",
+                           mime='application/x-ndjson', type='tertiary')
+    if os.environ.get('MODEL_METRICS_PORT'):
+        st.caption(f"Metrik Prometheus: `http://{os.environ.get('MODEL_METRICS_HOST', '127.0.0.1')}:"
+                   f"{os.environ['MODEL_METRICS_PORT']}/metrics`")
+
+if mode_debug:
+    with st.sidebar:
+        panel_debug()
 
 # --- FOOTER ---
 st.divider()
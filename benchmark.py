@@ -0,0 +1,317 @@
+"""Benchmark jalur hitung dan render dashboard, dengan perbandingan terhadap baseline.
+
+Mengukur throughput model (skenario/detik, atau soal/detik untuk LP dan alokasi redundansi)
+pada ukuran yang membesar, latensi render setiap grafik (PNG matplotlib dan spesifikasi
+Vega-Lite), memori puncak, serta waktu rerun penuh `app.py` lewat AppTest Streamlit. Hasil disimpan sebagai JSON datar
+`{nama_metrik: {nilai, satuan, arah}}` agar dua berkas dapat dibandingkan langsung:
+
+    python benchmark.py -o baseline.json
+    python benchmark.py -o baru.json --baseline baseline.json --ambang 0.2 --ambang-metrik 'rerun.*=0.5'
+
+Dengan `--baseline`, keluar dengan kode 1 bila ada metrik yang memburuk melebihi ambangnya.
+"""
+
+import argparse
+import fnmatch
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+
+import numpy as np
+
+from model_industri import (alokasi_redundansi, hitung_mm1, hitung_mmc, hitung_persediaan, keandalan_seri, opsi_paralel,
+                            selesaikan_lp)
+
+FOLDER = os.path.dirname(os.path.abspath(__file__))
+
+# Ukuran batch per model; LP diukur per soal dengan (jumlah variabel, jumlah kendala) yang membesar
+UKURAN = (1_000, 100_000, 1_000_000)
+UKURAN_CEPAT = (1_000, 100_000)
+UKURAN_LP = ((10, 5), (50, 25), (200, 100))
+UKURAN_LP_CEPAT = ((10, 5), (50, 25))
+# Alokasi redundansi: (jumlah stasiun, jumlah opsi unit paralel per stasiun)
+UKURAN_REDUNDANSI = ((10, 4), (100, 10), (300, 30))
+UKURAN_REDUNDANSI_CEPAT = ((10, 4), (100, 10))
+
+MODEL_APP = {
+    'produksi': "📊 Optimasi Produksi",
+    'persediaan': "📦 Model Persediaan",
+    'antrian': "⏳ Model Antrian",
+    'keandalan': "🔗 Keandalan Lini Produksi",
+}
+
+# 'naik' berarti nilai lebih besar lebih baik (throughput), 'turun' berarti lebih kecil lebih baik (waktu, memori)
+SATUAN = {'skenario/s': 'naik', 'soal/s': 'naik', 'ms': 'turun', 'MiB': 'turun'}
+
+
+def waktu_terbaik(fungsi, ulang=5):
+    """Waktu tercepat satu panggilan `fungsi()` (detik) dari `ulang` pengulangan timeit."""
+    timer = timeit.Timer(fungsi)
+    n, _ = timer.autorange()
+    return min(timer.repeat(repeat=ulang, number=n)) / n
+
+
+def memori_puncak(fungsi):
+    """Puncak memori (MiB) yang dialokasikan selama satu panggilan `fungsi()`, menurut tracemalloc."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fungsi()
+        _, puncak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return puncak / 2**20
+
+
+def _skenario(n, rng):
+    """Fungsi tanpa argumen per model untuk `n` skenario acak yang semuanya valid (antrian stabil)."""
+    D, S, H = rng.uniform(100, 5000, n), rng.uniform(1e5, 1e6, n), rng.uniform(1e4, 5e4, n)
+    lt, ss = rng.uniform(1, 30, n), rng.uniform(0, 50, n)
+    mu = rng.uniform(10, 60, n)
+    lmbda = mu * rng.uniform(0.1, 0.95, n)
+    R = rng.uniform(0.9, 0.999, (n, 10))
+    return {
+        'eoq': lambda: hitung_persediaan(D, S, H, lt, ss),
+        'mm1': lambda: hitung_mm1(lmbda, mu),
+        'mmc': lambda: hitung_mmc(lmbda * 3, mu, 3),
+        'seri': lambda: keandalan_seri(R),
+    }
+
+
+def bench_hitung(cepat, ulang):
+    hasil = {}
+    rng = np.random.default_rng(0)
+    for n in (UKURAN_CEPAT if cepat else UKURAN):
+        for nama, fungsi in _skenario(n, rng).items():
+            hasil[f'hitung.{nama}.n={n}'] = (n / waktu_terbaik(fungsi, ulang), 'skenario/s')
+            hasil[f'memori.{nama}.n={n}'] = (memori_puncak(fungsi), 'MiB')
+    for n, m in (UKURAN_LP_CEPAT if cepat else UKURAN_LP):
+        # Koefisien positif menjamin LP layak dan terbatas; soal yang sama di setiap mesin karena seed tetap
+        rng = np.random.default_rng(n)
+        c, A, b = rng.uniform(1, 10, n), rng.uniform(1, 10, (m, n)), rng.uniform(50, 100, m) * n
+
+        def fungsi(c=c, A=A, b=b):
+            return selesaikan_lp(c, A, b)
+
+        hasil[f'hitung.lp.{n}x{m}'] = (1 / waktu_terbaik(fungsi, ulang), 'soal/s')
+        hasil[f'memori.lp.{n}x{m}'] = (memori_puncak(fungsi), 'MiB')
+    for n, m in (UKURAN_REDUNDANSI_CEPAT if cepat else UKURAN_REDUNDANSI):
+        rng = np.random.default_rng(n)
+        keandalan, biaya, ruang = opsi_paralel(rng.uniform(0.85, 0.999, n), rng.uniform(5, 50, n),
+                                               rng.uniform(1, 5, n), maks_unit=m)
+
+        def fungsi(keandalan=keandalan, biaya=biaya, ruang=ruang, n=n):
+            return alokasi_redundansi(keandalan, biaya, 10 * n, ruang=ruang, kapasitas_ruang=1.5 * n)
+
+        hasil[f'hitung.redundansi.{n}x{m}'] = (1 / waktu_terbaik(fungsi, ulang), 'soal/s')
+        hasil[f'memori.redundansi.{n}x{m}'] = (memori_puncak(fungsi), 'MiB')
+    return hasil
+
+
+def _parameter_grafik():
+    """Parameter representatif (nilai bawaan dashboard) untuk setiap fungsi grafik."""
+    import grafik
+
+    jam = np.linspace(0, 90 * 24, 2000)
+    pola = [0.5, 0.8, 1.0, 0.9, 0.6, 0.5, 0.6, 0.9, 1.0, 0.8, 0.6, 0.4]
+    keandalan = [0.98, 0.99, 0.96, 0.97]
+    return {
+        'produksi': (grafik.grafik_produksi, dict(jam_meja=6.0, jam_kursi=2.0, kayu_meja=4.0, kayu_kursi=1.5,
+                                                  total_jam=240, total_kayu=120, x_optimal=30, y_optimal=0)),
+        'parametrik': (grafik.grafik_parametrik, dict(c=[750000, 300000], A=[[6.0, 2.0], [4.0, 1.5]], b=[240, 120],
+                                                      parameter='b', indeks=0, batas=(0, 720),
+                                                      label_parameter="Total Jam Kerja")),
+        'biaya_persediaan': (grafik.grafik_biaya_persediaan, dict(D=1200, S=500000, H=25000)),
+        'siklus_persediaan': (grafik.grafik_siklus_persediaan, dict(D=1200, S=500000, H=25000, lead_time=14,
+                                                                    safety_stock=10, sd_permintaan=1.0,
+                                                                    sd_lead_time=2.0)),
+        'komposisi_waktu': (grafik.grafik_komposisi_waktu, dict(lmbda=30, mu=35, c=1, K=0)),
+        'probabilitas_antrian': (grafik.grafik_probabilitas_antrian, dict(lmbda=30, mu=35, c=1, K=0)),
+        'antrian_transien': (grafik.grafik_antrian_transien, dict(jam_mulai=10, lmbda_per_jam=[30 * f for f in pola],
+                                                                  c_per_jam=[2] * len(pola), mu=35)),
+        'keandalan': (grafik.grafik_keandalan, dict(nama_mesin=['Stamping', 'Welding', 'Painting', 'Assembly'],
+                                                    keandalan=keandalan, keandalan_sistem=float(np.prod(keandalan)),
+                                                    indeks_terlemah=2)),
+        'ketersediaan': (grafik.grafik_ketersediaan, dict(jam=jam, kurva_ketersediaan=0.92 + 0.08 * np.exp(-jam / 300),
+                                                          ketersediaan=0.93, persentil_5=0.9)),
+        'frontier_redundansi': (grafik.grafik_frontier_redundansi, dict(
+            biaya=[0, 350, 400, 750, 1100, 1250], keandalan=[0.9035, 0.93, 0.9412, 0.9598, 0.9706, 0.9775],
+            keandalan_awal=0.9035, biaya_terpilih=1250, keandalan_terpilih=0.9775)),
+        'sensitivitas': (grafik.grafik_sensitivitas, dict(model=hitung_mmc, sumbu_x=('lmbda', 1, 100, 300),
+                                                          sumbu_y=('mu', 1, 100, 300), tetap=dict(c=3), keluaran='Wq',
+                                                          label_x="λ", label_y="μ", label_nilai="Wq (menit)",
+                                                          faktor=60, titik=(30, 35))),
+    }
+
+
+def bench_grafik(ulang):
+    from grafik import CacheGrafik, gambar_png
+    from grafik_klien import spek_grafik
+
+    # Cache berkapasitas nol: setiap panggilan benar-benar menggambar ulang
+    tanpa_cache = CacheGrafik(maks_item=0)
+    hasil = {}
+    for nama, (fungsi, params) in _parameter_grafik().items():
+        for jenis, render in (('png', gambar_png), ('spek', spek_grafik)):
+            def gambar(render=render, fungsi=fungsi, params=params):
+                return render(fungsi, cache=tanpa_cache, **params)
+            gambar()
+            hasil[f'grafik.{jenis}.{nama}'] = (1000 * waktu_terbaik(gambar, ulang), 'ms')
+            hasil[f'memori.grafik.{jenis}.{nama}'] = (memori_puncak(gambar), 'MiB')
+    return hasil
+
+
+def bench_rerun(ulang):
+    """Rerun penuh app.py per model: sesi baru dengan semua cache kosong ('dingin') dan rerun berikutnya ('hangat')."""
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    import grafik
+    import grafik_klien
+
+    hasil = {}
+    os.environ.pop('MODEL_METRICS_PORT', None)
+    with tempfile.TemporaryDirectory() as folder:
+        for i, (nama, label) in enumerate(MODEL_APP.items()):
+            os.environ['MODEL_CACHE_PATH'] = os.path.join(folder, f'{i}.sqlite')
+            st.cache_data.clear()
+            st.cache_resource.clear()
+            grafik.CACHE.kosongkan()
+            grafik_klien.CACHE_SPEK.kosongkan()
+            at = AppTest.from_file(os.path.join(FOLDER, 'app.py'), default_timeout=600)
+            at.session_state['model_aktif'] = label
+            mulai = time.perf_counter()
+            at.run()
+            hasil[f'rerun.{nama}.dingin'] = (1000 * (time.perf_counter() - mulai), 'ms')
+            if at.exception:
+                raise RuntimeError(f'app.py gagal pada model {nama}: {at.exception[0].message}')
+            durasi = []
+            for _ in range(ulang):
+                mulai = time.perf_counter()
+                at.run()
+                durasi.append(time.perf_counter() - mulai)
+            hasil[f'rerun.{nama}.hangat'] = (1000 * float(np.median(durasi)), 'ms')
+    return hasil
+
+
+def rss_puncak():
+    """Puncak RSS seluruh proses benchmark (MiB), atau None jika `resource` tidak tersedia."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    puncak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return puncak / 2**20 if sys.platform == 'darwin' else puncak / 2**10
+
+
+def metadata():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=FOLDER, capture_output=True,
+                                text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {'waktu': time.strftime('%Y-%m-%dT%H:%M:%S%z'), 'commit': commit, 'python': platform.python_version(),
+            'numpy': np.__version__, 'platform': platform.platform(), 'cpu': os.cpu_count(),
+            'prosesor': platform.processor() or platform.machine()}
+
+
+def jalankan(grup, cepat=False, ulang=5, progres=print):
+    hasil = {}
+    for nama in grup:
+        mulai = time.perf_counter()
+        if nama == 'hitung':
+            hasil.update(bench_hitung(cepat, ulang))
+        elif nama == 'grafik':
+            hasil.update(bench_grafik(ulang))
+        elif nama == 'rerun':
+            hasil.update(bench_rerun(ulang))
+        progres(f'{nama}: selesai dalam {time.perf_counter() - mulai:.1f} s')
+    rss = rss_puncak()
+    if rss is not None:
+        hasil['memori.proses.rss_puncak'] = (rss, 'MiB')
+    return {nama: {'nilai': nilai, 'satuan': satuan, 'arah': SATUAN[satuan]}
+            for nama, (nilai, satuan) in sorted(hasil.items())}
+
+
+def ambang_untuk(nama, ambang, ambang_metrik):
+    """Ambang relatif metrik `nama`: pola `--ambang-metrik` terakhir yang cocok, atau `ambang` bawaan."""
+    for pola, nilai in reversed(ambang_metrik):
+        if fnmatch.fnmatchcase(nama, pola):
+            return nilai
+    return ambang
+
+
+def bandingkan(baru, lama, ambang=0.2, ambang_metrik=()):
+    """Baris perbandingan `(nama, lama, baru, perubahan, status)` untuk metrik yang ada di kedua hasil.
+
+    `perubahan` positif berarti lebih baik (throughput naik atau waktu/memori turun), dan
+    status 'REGRESI' diberikan bila metrik memburuk lebih dari ambang relatifnya.
+    """
+    baris = []
+    for nama in sorted(baru.keys() & lama.keys()):
+        nilai_lama, nilai_baru = lama[nama]['nilai'], baru[nama]['nilai']
+        rasio = nilai_baru / nilai_lama if nilai_lama else float('inf')
+        perubahan = rasio - 1 if baru[nama]['arah'] == 'naik' else 1 - rasio
+        batas = ambang_untuk(nama, ambang, ambang_metrik)
+        status = 'REGRESI' if perubahan < -batas else 'lebih baik' if perubahan > batas else 'ok'
+        baris.append((nama, nilai_lama, nilai_baru, perubahan, status))
+    return baris
+
+
+def _pola_ambang(teks):
+    pola, _, nilai = teks.rpartition('=')
+    if not pola:
+        raise argparse.ArgumentTypeError(f'format harus POLA=AMBANG, bukan {teks!r}')
+    return pola, float(nilai)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('-o', '--keluaran', help='simpan hasil ke berkas JSON ini')
+    parser.add_argument('--baseline', help='hasil JSON sebelumnya untuk dibandingkan')
+    parser.add_argument('--ambang', type=float, default=0.2,
+                        help='perburukan relatif maksimum sebelum dianggap regresi (bawaan 0.2 = 20%%)')
+    parser.add_argument('--ambang-metrik', type=_pola_ambang, action='append', default=[], metavar='POLA=AMBANG',
+                        help="ambang khusus untuk metrik yang cocok dengan pola glob, mis. 'rerun.*=0.5'")
+    parser.add_argument('-g', '--grup', nargs='+', choices=('hitung', 'grafik', 'rerun'),
+                        default=['hitung', 'grafik', 'rerun'], help='kelompok benchmark yang dijalankan')
+    parser.add_argument('--ulang', type=int, default=5, help='jumlah pengulangan per pengukuran (bawaan 5)')
+    parser.add_argument('--cepat', action='store_true', help='lewati ukuran terbesar (1 juta skenario, LP 200x100)')
+    args = parser.parse_args(argv)
+
+    hasil = {'meta': {**metadata(), 'grup': args.grup, 'cepat': args.cepat},
+             'hasil': jalankan(args.grup, args.cepat, args.ulang)}
+    for nama, metrik in hasil['hasil'].items():
+        print(f"{nama:<45} {metrik['nilai']:>14,.2f} {metrik['satuan']}")
+    if args.keluaran:
+        with open(args.keluaran, 'w', encoding='utf-8') as f:
+            json.dump(hasil, f, indent=2, ensure_ascii=False)
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as f:
+        lama = json.load(f)
+    print(f"\nDibandingkan dengan {args.baseline} (commit {lama['meta'].get('commit')}, {lama['meta'].get('waktu')}):")
+    if (lama['meta'].get('grup'), lama['meta'].get('cepat')) != (args.grup, args.cepat):
+        # RSS puncak bergantung pada kelompok benchmark yang ikut dijalankan dalam proses yang sama
+        for metrik in (hasil['hasil'], lama['hasil']):
+            metrik.pop('memori.proses.rss_puncak', None)
+    baris = bandingkan(hasil['hasil'], lama['hasil'], args.ambang, args.ambang_metrik)
+    for nama, nilai_lama, nilai_baru, perubahan, status in baris:
+        print(f'{nama:<45} {nilai_lama:>14,.2f} -> {nilai_baru:>14,.2f} {perubahan:>+8.1%}  {status}')
+    regresi = [b[0] for b in baris if b[4] == 'REGRESI']
+    if regresi:
+        print(f"\n{len(regresi)} metrik mengalami regresi: {', '.join(regresi)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
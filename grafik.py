@@ -0,0 +1,401 @@
+"""Definisi grafik statis dashboard dan cache LRU untuk PNG hasil render.
+
+Setiap fungsi `grafik_*` hanya menerima parameter model (bukan objek Streamlit)
+dan mengembalikan `matplotlib.figure.Figure` yang tidak terdaftar di pyplot,
+sehingga figur langsung dibebaskan setelah dirender oleh `gambar_png`.
+matplotlib baru diimpor saat PNG pertama dirender; grafik interaktif di browser
+dibuat oleh `grafik_klien` tanpa matplotlib.
+"""
+
+import io
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import numpy as np
+
+from model_industri import (antrian_transien, distribusi_mmck, hitung_mmc, hitung_mmck, hitung_persediaan, kurva_biaya,
+                            kurva_parametrik, level_stok, normalisasi_parameter, probabilitas_n_mmc, profil_per_jam,
+                            sapuan_parameter, simulasi_persediaan)
+
+# Opsi savefig yang sama dengan bawaan st.pyplot
+OPSI_SIMPAN = {'format': 'png', 'bbox_inches': 'tight', 'dpi': 200}
+
+
+_KANVAS = ContextVar('kanvas', default=None)
+
+
+def _figur(figsize):
+    kanvas = _KANVAS.get()
+    if kanvas is not None:
+        return kanvas
+    # Impor lambat: server yang hanya mengirim grafik ke browser tidak pernah memuat matplotlib
+    from matplotlib.figure import Figure
+    return Figure(figsize=figsize)
+
+
+@contextmanager
+def gambar_di(kanvas):
+    """Selama blok ini, fungsi `grafik_*` menggambar ke `kanvas` (mis. `SubFigure` satu halaman) alih-alih
+    membuat figur baru, sehingga beberapa grafik dapat disusun vektor dalam satu halaman PDF."""
+    token = _KANVAS.set(kanvas)
+    try:
+        yield kanvas
+    finally:
+        _KANVAS.reset(token)
+
+
+def grafik_produksi(jam_meja, jam_kursi, kayu_meja, kayu_kursi, total_jam, total_kayu, x_optimal, y_optimal):
+    x_intercept1 = total_jam / jam_meja if jam_meja > 0 else float('inf')
+    x_intercept2 = total_kayu / kayu_meja if kayu_meja > 0 else float('inf')
+
+    fig = _figur((10, 5))
+    ax = fig.subplots()
+
+    max_x = max(x_intercept1, x_intercept2) if max(x_intercept1, x_intercept2) > 0 else 50
+    x_vals = np.linspace(0, max_x * 1.1, 400)
+
+    y1 = (total_jam - jam_meja * x_vals) / jam_kursi if jam_kursi > 0 else np.full_like(x_vals, float('inf'))
+    ax.plot(x_vals, y1, label='Batas Jam Kerja')
+
+    y2 = (total_kayu - kayu_meja * x_vals) / kayu_kursi if kayu_kursi > 0 else np.full_like(x_vals, float('inf'))
+    ax.plot(x_vals, y2, label='Batas Stok Kayu')
+
+    y_feasible = np.minimum(y1, y2)
+    ax.fill_between(x_vals, 0, y_feasible, where=(y_feasible >= 0), color='green', alpha=0.2, label='Daerah Produksi Layak')
+
+    ax.plot(x_optimal, y_optimal, 'ro', markersize=12, label=f'Titik Optimal ({x_optimal}, {y_optimal})')
+
+    ax.set_xlabel('Jumlah Meja (x)')
+    ax.set_ylabel('Jumlah Kursi (y)')
+    ax.set_title('Grafik Optimasi Produksi Mebel', fontsize=16)
+    ax.legend()
+    ax.grid(True)
+    ax.set_xlim(left=0)
+    ax.set_ylim(bottom=0)
+    return fig
+
+
+def grafik_parametrik(c, A, b, parameter, indeks, batas, label_parameter):
+    kurva = kurva_parametrik(c, A, b, parameter, indeks, batas)
+    sekarang = (c if parameter == 'c' else b)[indeks]
+
+    fig = _figur((10, 5))
+    ax = fig.subplots()
+    ax.plot(kurva['theta'], kurva['nilai'], 'b-', linewidth=2, label='Keuntungan Optimal (relaksasi LP)')
+    ax.plot(kurva['theta'][1:-1], kurva['nilai'][1:-1], 'ko', label='Titik Patah (rencana berganti)')
+    for s in kurva['segmen']:
+        if s['dari'] <= sekarang <= s['sampai']:
+            ax.axvspan(s['dari'], s['sampai'], color='green', alpha=0.12, label='Rentang Rencana Saat Ini')
+            break
+    ax.axvline(sekarang, color='r', linestyle='--', label='Nilai Saat Ini')
+    ax.set_xlabel(label_parameter)
+    ax.set_ylabel('Keuntungan (Rp)')
+    ax.set_title(f'Keuntungan Optimal terhadap {label_parameter}', fontsize=16)
+    ax.grid(True)
+    ax.legend(loc='upper left')
+    return fig
+
+
+def grafik_biaya_persediaan(D, S, H):
+    hasil = hitung_persediaan(D, S, H)
+    eoq, total_biaya = float(hasil['eoq']), float(hasil['total_biaya'])
+    q = np.linspace(max(1, eoq * 0.1), eoq * 2 if eoq > 0 else 200, 100)
+    holding_costs, ordering_costs, total_costs = kurva_biaya(D, S, H, q)
+
+    fig = _figur((10, 5))
+    ax = fig.subplots()
+    ax.plot(q, holding_costs, 'b-', label='Biaya Penyimpanan')
+    ax.plot(q, ordering_costs, 'g-', label='Biaya Pemesanan')
+    ax.plot(q, total_costs, 'r-', linewidth=3, label='Total Biaya')
+    if eoq > 0:
+        ax.axvline(x=eoq, color='purple', linestyle='--', label='EOQ')
+        ax.annotate(f'Biaya Terendah\nRp {total_biaya:,.0f}', xy=(eoq, total_biaya), xytext=(eoq*1.3, total_biaya*0.6),
+                    arrowprops=dict(facecolor='black', shrink=0.05), fontsize=12)
+
+    ax.set_xlabel('Kuantitas Pemesanan (kg)')
+    ax.set_ylabel('Biaya Tahunan (Rp)')
+    ax.set_title('Analisis Biaya Persediaan (EOQ)', fontsize=16)
+    ax.legend()
+    ax.grid(True)
+    ax.ticklabel_format(style='plain', axis='y')
+    return fig
+
+
+def grafik_siklus_persediaan(D, S, H, lead_time, safety_stock, sd_permintaan=0.0, sd_lead_time=0.0, n_jalur=5):
+    hasil = {k: float(v) for k, v in hitung_persediaan(D, S, H, lead_time, safety_stock).items()}
+    eoq, rop, siklus_pemesanan = hasil['eoq'], hasil['rop'], hasil['siklus_pemesanan']
+
+    fig = _figur((10, 5))
+    ax = fig.subplots()
+    if siklus_pemesanan > 0 and eoq > 0:
+        t = np.linspace(0, siklus_pemesanan * 2, 200)
+        stok_level = level_stok(t, eoq, safety_stock, hasil['permintaan_harian'], siklus_pemesanan)
+
+        if sd_permintaan > 0 or sd_lead_time > 0:
+            hari = int(np.ceil(siklus_pemesanan * 2))
+            jalur = simulasi_persediaan(D, eoq, rop, safety_stock, lead_time, sd_permintaan, sd_lead_time,
+                                        horizon=hari, replikasi=n_jalur, n_jalur=n_jalur)['jalur']
+            for i, stok_simulasi in enumerate(jalur):
+                ax.step(np.arange(hari), stok_simulasi, where='post', color='gray', alpha=0.4, linewidth=1,
+                        label='Contoh Simulasi Stokastik' if i == 0 else None)
+        ax.plot(t, stok_level, label='Tingkat Persediaan')
+        ax.axhline(y=rop, color='orange', linestyle='--', label=f'ROP ({rop:.1f} kg)')
+        ax.axhline(y=safety_stock, color='red', linestyle=':', label=f'Stok Pengaman ({safety_stock} kg)')
+
+        t_pesan = siklus_pemesanan - lead_time
+        if t_pesan > 0:
+            ax.scatter(t_pesan, rop, color='red', s=100, zorder=5)
+            ax.annotate('Pesan Ulang!', xy=(t_pesan, rop), xytext=(t_pesan, rop + eoq*0.3),
+                        arrowprops=dict(facecolor='red', shrink=0.05))
+
+    ax.set_xlabel('Waktu (Hari)')
+    ax.set_ylabel('Jumlah Stok (kg)')
+    ax.set_title('Simulasi Siklus Persediaan', fontsize=16)
+    ax.legend()
+    ax.grid(True)
+    ax.set_ylim(bottom=0)
+    return fig
+
+
+def _hasil_antrian(lmbda, mu, c, K):
+    return hitung_mmck(lmbda, mu, c, max(K, c)) if K > 0 else hitung_mmc(lmbda, mu, c)
+
+
+def grafik_komposisi_waktu(lmbda, mu, c=1, K=0, Wq=None):
+    # Wq empiris dari simulasi, jika ada, menggantikan rumus M/M/c
+    Wq = float(_hasil_antrian(lmbda, mu, c, K)['Wq']) if Wq is None else float(Wq)
+
+    fig = _figur((8, 4))
+    ax = fig.subplots()
+    sizes = [Wq * 60, (1/mu) * 60]
+    ax.pie(sizes, explode=(0.1, 0), labels=['Waktu Menunggu di Antrian', 'Waktu Dilayani'], autopct='%1.1f%%',
+           startangle=90, colors=['#ff6347', '#90ee90'])
+    ax.axis('equal')
+    ax.set_title("Bagaimana Pelanggan Menghabiskan Waktunya?")
+    return fig
+
+
+def grafik_probabilitas_antrian(lmbda, mu, c=1, K=0, p_n=None):
+    n_values = np.arange(0, 15)
+    if p_n is not None:
+        # P(n) empiris dari simulasi
+        p_n_values = np.asarray(p_n, dtype=float)[:n_values.size]
+    elif K > 0:
+        p_n_values = np.zeros(n_values.size)
+        distribusi = distribusi_mmck(lmbda, mu, c, max(K, c))[:n_values.size]
+        p_n_values[:distribusi.size] = distribusi
+    else:
+        p_n_values = probabilitas_n_mmc(lmbda, mu, c, n_values)
+
+    fig = _figur((10, 4))
+    ax = fig.subplots()
+    ax.bar(n_values, p_n_values, color='skyblue')
+    for i, v in enumerate(p_n_values):
+        ax.text(i, v, f"{v:.1%}", ha='center', va='bottom', fontsize=9)
+
+    ax.set_xlabel('Jumlah Mobil dalam Sistem (n)')
+    ax.set_ylabel('Probabilitas P(n)')
+    ax.set_title('Seberapa Mungkin Antrian Menjadi Panjang?')
+    ax.set_xticks(n_values)
+    ax.grid(True, axis='y', linestyle='--')
+    ax.set_yticklabels([])
+    return fig
+
+
+def grafik_antrian_transien(jam_mulai, lmbda_per_jam, c_per_jam, mu, langkah_per_jam=12, hasil=None):
+    # `hasil` adalah keluaran antrian_transien yang sudah dihitung pemanggil (t, Wq, Lq); dihitung di sini jika kosong
+    if hasil is None:
+        hasil = antrian_transien(profil_per_jam(lmbda_per_jam, langkah_per_jam), mu,
+                                 profil_per_jam(c_per_jam, langkah_per_jam), 1 / langkah_per_jam)
+    jam = jam_mulai + np.concatenate([[0.0], hasil['t']])
+    jam_profil = jam_mulai + np.arange(len(lmbda_per_jam) + 1)
+
+    fig = _figur((10, 5))
+    ax = fig.subplots()
+    ax.plot(jam, np.concatenate([[0.0], hasil['Wq']]) * 60, 'r-', linewidth=2, label='Waktu Tunggu Wq(t) (menit)')
+    ax.plot(jam, np.concatenate([[0.0], hasil['Lq']]), 'b--', label='Panjang Antrian Lq(t) (mobil)')
+    ax.set_xlabel('Jam Operasional')
+    ax.set_ylabel('Menit / Mobil')
+    ax.set_title('Kinerja Antrian Sepanjang Hari', fontsize=16)
+    ax.grid(True)
+
+    ax_lmbda = ax.twinx()
+    ax_lmbda.step(jam_profil, np.append(lmbda_per_jam, lmbda_per_jam[-1]), where='post', color='gray', alpha=0.6,
+                  label='Tingkat Kedatangan λ(t)')
+    ax_lmbda.step(jam_profil, np.append(np.asarray(c_per_jam) * mu, c_per_jam[-1] * mu), where='post', color='green',
+                  alpha=0.6, label='Kapasitas Layanan c(t)·μ')
+    ax_lmbda.set_ylabel('Mobil per Jam')
+    ax_lmbda.set_ylim(bottom=0)
+
+    garis, label = ax.get_legend_handles_labels()
+    garis_lmbda, label_lmbda = ax_lmbda.get_legend_handles_labels()
+    ax.legend(garis + garis_lmbda, label + label_lmbda, loc='upper left')
+    return fig
+
+
+def grafik_keandalan(nama_mesin, keandalan, keandalan_sistem, indeks_terlemah):
+    labels = list(nama_mesin) + ["SISTEM TOTAL"]
+    values = list(keandalan) + [keandalan_sistem]
+
+    bar_colors = ['#87CEEB'] * len(nama_mesin)
+    bar_colors[indeks_terlemah] = '#FF6347'
+    bar_colors.append('#9370DB')
+
+    fig = _figur((10, 5))
+    ax = fig.subplots()
+    bars = ax.bar(labels, values, color=bar_colors)
+
+    ax.set_ylabel('Tingkat Keandalan (Reliability)')
+    ax.set_title('Perbandingan Keandalan Komponen dan Sistem', fontsize=16)
+    ax.set_ylim(min(0.75, min(values) * 0.95 if values else 0.75), 1.01)
+
+    for bar in bars:
+        yval = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2.0, yval, f'{yval:.2%}', ha='center', va='bottom', fontsize=10, color='black')
+    return fig
+
+
+def grafik_ketersediaan(jam, kurva_ketersediaan, ketersediaan, persentil_5):
+    fig = _figur((10, 5))
+    ax = fig.subplots()
+    hari = np.asarray(jam) / 24
+    ax.plot(hari, kurva_ketersediaan, 'b-', linewidth=2, label='Ketersediaan Lini A(t)')
+    ax.axhline(ketersediaan, color='#9370DB', linestyle='--', label=f'Rata-rata Horizon ({ketersediaan:.2%})')
+    ax.axhline(persentil_5, color='#FF6347', linestyle=':', label=f'Persentil 5% per Replikasi ({persentil_5:.2%})')
+    ax.set_xlabel('Hari')
+    ax.set_ylabel('Peluang Lini Beroperasi')
+    ax.set_title('Ketersediaan Lini Sepanjang Horizon', fontsize=16)
+    ax.set_ylim(min(0.75, min(np.min(kurva_ketersediaan), persentil_5) * 0.95), 1.01)
+    ax.grid(True)
+    ax.legend(loc='lower left')
+    return fig
+
+
+def grafik_frontier_redundansi(biaya, keandalan, keandalan_awal, biaya_terpilih, keandalan_terpilih):
+    fig = _figur((10, 5))
+    ax = fig.subplots()
+    ax.step(biaya, keandalan, 'b-', where='post', marker='o', markersize=4, label='Frontier Efisien')
+    ax.axhline(keandalan_awal, color='gray', linestyle='--', label=f'Keandalan Saat Ini ({keandalan_awal:.2%})')
+    ax.plot([biaya_terpilih], [keandalan_terpilih], '*', color='#FF6347', markersize=18,
+            label=f'Alokasi Terpilih ({keandalan_terpilih:.2%})')
+    ax.set_xlabel('Biaya Mesin Cadangan (juta Rp)')
+    ax.set_ylabel('Keandalan Lini')
+    ax.set_title('Anggaran vs Keandalan Lini Terbaik', fontsize=16)
+    ax.yaxis.set_major_formatter(lambda v, _: f'{v:.1%}')
+    ax.grid(True)
+    ax.legend(loc='lower right')
+    return fig
+
+
+def grafik_sensitivitas(model, sumbu_x, sumbu_y, tetap, keluaran, label_x, label_y, label_nilai, faktor=1.0,
+                        titik=None):
+    """Heatmap dan kontur `keluaran` dari fungsi `model` di seluruh grid `sumbu_x` × `sumbu_y`.
+
+    Setiap sumbu berupa `(nama_argumen, minimum, maksimum, jumlah_titik)`; `titik` (x, y) menandai
+    parameter yang sedang dipilih di dashboard.
+    """
+    (nama_x, *rentang_x), (nama_y, *rentang_y) = sumbu_x, sumbu_y
+    x, y = np.linspace(*rentang_x), np.linspace(*rentang_y)
+    # Dirender dari thread skrip Streamlit: grid dihitung di proses ini, tanpa fork pool proses
+    hasil = sapuan_parameter(model, {nama_y: y, nama_x: x}, tetap, keluaran=[keluaran], n_proses=1)
+    nilai = np.asarray(hasil[keluaran], dtype=float) * faktor
+    nilai = np.where(np.isfinite(nilai), nilai, np.nan)
+
+    fig = _figur((10, 6))
+    ax = fig.subplots()
+    ax.set_facecolor('#DDDDDD')
+    # Nilai ekstrem di dekat batas (mis. ρ → 1) dipotong agar gradasi di daerah lain tetap terlihat
+    batas_atas = np.nanpercentile(nilai, 98) if np.isfinite(nilai).any() else None
+    peta = ax.pcolormesh(x, y, nilai, shading='auto', cmap='viridis', vmax=batas_atas)
+    if np.isfinite(nilai).sum() > 3 and np.nanmin(nilai) < batas_atas:
+        kontur = ax.contour(x, y, np.minimum(nilai, batas_atas), levels=8, colors='white', linewidths=0.8)
+        ax.clabel(kontur, fontsize=8, fmt='%.3g')
+    fig.colorbar(peta, ax=ax, label=label_nilai, extend='max')
+    if titik is not None:
+        ax.plot(*titik, 'r*', markersize=16, markeredgecolor='white', label='Parameter Saat Ini')
+        ax.legend(loc='upper right')
+    ax.set_xlabel(label_x)
+    ax.set_ylabel(label_y)
+    ax.set_title(f'Peta Sensitivitas: {label_nilai}', fontsize=16)
+    return fig
+
+
+class CacheGrafik:
+    """Cache LRU untuk PNG grafik yang dibatasi jumlah entri dan total byte.
+
+    Aman dipakai bersama oleh banyak sesi Streamlit (thread) dalam satu proses.
+    """
+
+    def __init__(self, maks_item=256, maks_byte=64 * 2**20):
+        self.maks_item = maks_item
+        self.maks_byte = maks_byte
+        self.total_byte = 0
+        self.hit = 0
+        self.miss = 0
+        self._data = OrderedDict()
+        self._kunci = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def ambil(self, kunci):
+        with self._kunci:
+            entri = self._data.get(kunci)
+            if entri is None:
+                self.miss += 1
+                return None
+            self._data.move_to_end(kunci)
+            self.hit += 1
+            return entri[0]
+
+    def simpan(self, kunci, png, ukuran=None):
+        """Simpan `png` (atau objek lain berukuran `ukuran` byte, mis. spesifikasi grafik klien)."""
+        ukuran = len(png) if ukuran is None else ukuran
+        # Entri yang lebih besar dari seluruh anggaran tidak disimpan sama sekali
+        if ukuran > self.maks_byte or self.maks_item <= 0:
+            return
+        with self._kunci:
+            lama = self._data.pop(kunci, None)
+            if lama is not None:
+                self.total_byte -= lama[1]
+            self._data[kunci] = (png, ukuran)
+            self.total_byte += ukuran
+            while len(self._data) > self.maks_item or self.total_byte > self.maks_byte:
+                _, (_, dibuang) = self._data.popitem(last=False)
+                self.total_byte -= dibuang
+
+    def kosongkan(self):
+        with self._kunci:
+            self._data.clear()
+            self.total_byte = 0
+
+
+def kunci_grafik(fungsi, params):
+    return fungsi.__name__, normalisasi_parameter(params)
+
+
+def render_png(fig):
+    """Render figur menjadi PNG lalu kosongkan figur agar memorinya segera dilepas."""
+    buffer = io.BytesIO()
+    try:
+        fig.savefig(buffer, **OPSI_SIMPAN)
+    finally:
+        fig.clear()
+    return buffer.getvalue()
+
+
+CACHE = CacheGrafik(maks_item=int(os.environ.get('GRAFIK_CACHE_ITEM', 256)),
+                    maks_byte=int(float(os.environ.get('GRAFIK_CACHE_MB', 64)) * 2**20))
+
+
+def gambar_png(fungsi, cache=CACHE, **params):
+    """PNG untuk `fungsi(**params)`; diambil dari cache jika parameter yang sama pernah dirender."""
+    kunci = kunci_grafik(fungsi, params)
+    png = cache.ambil(kunci)
+    if png is None:
+        png = render_png(fungsi(**params))
+        cache.simpan(kunci, png)
+    return png
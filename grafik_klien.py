@@ -0,0 +1,515 @@
+"""Spesifikasi Vega-Lite untuk grafik dashboard yang digambar di browser.
+
+Setiap fungsi `spek_*` menerima parameter yang sama dengan `grafik_*` padanannya di
+`grafik.py`, tetapi hanya mengirim deret datanya (sebagai dataset bernama yang
+dikirim Streamlit dalam format Arrow) sehingga server tidak merasterisasi apa pun
+dan tidak perlu memuat matplotlib. Deret panjang dan grid besar dikurangi di server.
+"""
+
+import copy
+import json
+import os
+
+import numpy as np
+
+from grafik import CacheGrafik, kunci_grafik
+from model_industri import (antrian_transien, distribusi_mmck, hitung_mmc, hitung_mmck, hitung_persediaan, kurva_biaya,
+                            kurva_parametrik, level_stok, probabilitas_n_mmc, profil_per_jam, sapuan_parameter,
+                            simulasi_persediaan, titik_sudut_produksi)
+
+# Batas titik per deret garis dan sel per sumbu heatmap yang dikirim ke browser
+MAKS_TITIK = 500
+MAKS_SEL_SUMBU = 100
+TINGGI = 380
+
+# Warna yang sama dengan grafik statis matplotlib
+BIRU, ORANYE, HIJAU, MERAH, UNGU, ABU = '#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9370DB', '#808080'
+
+
+def _kurangi_titik(x, *deret, maks_titik=MAKS_TITIK):
+    """Kurangi titik deret panjang dengan tetap menyimpan minimum dan maksimum setiap ember.
+
+    Ember ditentukan dari deret pertama, jadi puncak dan lembah (mis. penurunan ketersediaan) tidak hilang.
+    """
+    x = np.asarray(x, dtype=float)
+    deret = [np.asarray(y, dtype=float) for y in deret]
+    n = x.size
+    if n <= maks_titik:
+        return (x, *deret)
+    acuan = deret[0]
+    n_ember = maks_titik // 2 - 1
+    tepi = np.linspace(0, n, n_ember + 1).astype(int)
+    ember = np.repeat(np.arange(n_ember), np.diff(tepi))
+    terpilih = [np.array([0, n - 1])]
+    for reduksi in (np.fmin, np.fmax):
+        cocok = np.flatnonzero(acuan == reduksi.reduceat(acuan, tepi[:-1])[ember])
+        _, pertama = np.unique(ember[cocok], return_index=True)
+        terpilih.append(cocok[pertama])
+    indeks = np.unique(np.concatenate(terpilih))
+    return (x[indeks], *(y[indeks] for y in deret))
+
+
+def _kurangi_grid(x, y, z, maks_sel=MAKS_SEL_SUMBU):
+    """Rata-rata blok grid `z` (len(y), len(x)) agar setiap sumbu paling banyak `maks_sel` sel; NaN diabaikan."""
+    (ny, nx), (fy, fx) = z.shape, (-(-n // maks_sel) for n in z.shape)
+    pad = np.full((-(-ny // fy) * fy, -(-nx // fx) * fx), np.nan)
+    pad[:ny, :nx] = z
+    blok = pad.reshape(pad.shape[0] // fy, fy, pad.shape[1] // fx, fx)
+    banyak = np.isfinite(blok).sum(axis=(1, 3))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        rata = np.where(banyak > 0, np.nansum(blok, axis=(1, 3)) / banyak, np.nan)
+
+    def pusat(v, f):
+        return np.nanmean(np.concatenate([v, np.full(-v.size % f, np.nan)]).reshape(-1, f), axis=1)
+
+    return pusat(x, fx), pusat(y, fy), rata
+
+
+def _tepi(pusat):
+    """Batas kiri dan kanan setiap sel dari titik pusatnya."""
+    if pusat.size == 1:
+        return pusat - 0.5, pusat + 0.5
+    tengah = (pusat[1:] + pusat[:-1]) / 2
+    return (np.concatenate([[2 * pusat[0] - tengah[0]], tengah]),
+            np.concatenate([tengah, [2 * pusat[-1] - tengah[-1]]]))
+
+
+def _seri(label, legenda, lapisan):
+    """Beri `lapisan` kolom konstan `seri` = `label` dan warnai dengan skala yang sama di setiap lapisan,
+    sehingga semua garis, area, dan garis bantu masuk ke satu legenda."""
+    lapisan['transform'] = [{'calculate': json.dumps(label), 'as': 'seri'}]
+    lapisan['encoding'] = {**lapisan.get('encoding', {}), 'color': {
+        'field': 'seri', 'type': 'nominal', 'legend': {'title': None, 'orient': 'top'},
+        'scale': {'domain': [l for l, _ in legenda], 'range': [w for _, w in legenda]}}}
+    return lapisan
+
+
+def _sumbu(field, judul, format=None, **skala):
+    kanal = {'field': field, 'type': 'quantitative', 'title': judul}
+    if format:
+        kanal['axis'] = {'format': format}
+    if skala:
+        kanal['scale'] = skala
+    return kanal
+
+
+def _spek(judul, datasets, lapisan, **lain):
+    return {'title': judul, 'height': TINGGI, 'datasets': datasets, 'layer': lapisan, **lain}
+
+
+def _catatan(teks):
+    """Grafik kosong berisi satu pesan, untuk parameter yang tidak menghasilkan kurva."""
+    return {'height': TINGGI, 'data': {'values': [{}]}, 'mark': {'type': 'text', 'fontSize': 14},
+            'encoding': {'text': {'value': teks}}}
+
+
+def spek_produksi(jam_meja, jam_kursi, kayu_meja, kayu_kursi, total_jam, total_kayu, x_optimal, y_optimal):
+    titik, layak = titik_sudut_produksi(jam_meja, jam_kursi, kayu_meja, kayu_kursi, total_jam, total_kayu)
+    sudut = titik[layak]
+    # Batas atas daerah layak: titik sudut terurut menurut x, ambil y terbesar untuk x yang sama
+    sudut = sudut[np.lexsort((-sudut[:, 1], sudut[:, 0]))]
+    sudut = sudut[np.unique(sudut[:, 0], return_index=True)[1]]
+
+    x_potong = [t / a for t, a in ((total_jam, jam_meja), (total_kayu, kayu_meja)) if a > 0]
+    y_potong = [t / b for t, b in ((total_jam, jam_kursi), (total_kayu, kayu_kursi)) if b > 0]
+    x_maks = 1.1 * max(x_potong) if x_potong and max(x_potong) > 0 else 50.0
+    y_maks = 1.1 * max(y_potong) if y_potong and max(y_potong) > 0 else 50.0
+
+    def garis(a, b, t):
+        # Garis kendala lurus, jadi dua titik ujung sudah cukup
+        if b > 0:
+            return {'x': [0.0, x_maks], 'y': [t / b, (t - a * x_maks) / b]}
+        if a > 0:
+            return {'x': [t / a, t / a], 'y': [0.0, y_maks]}
+        return {'x': [], 'y': []}
+
+    label_optimal = f'Titik Optimal ({x_optimal}, {y_optimal})'
+    legenda = [('Batas Jam Kerja', BIRU), ('Batas Stok Kayu', ORANYE), ('Daerah Produksi Layak', HIJAU),
+               (label_optimal, MERAH)]
+    x = _sumbu('x', 'Jumlah Meja (x)', domain=[0, x_maks])
+    y = _sumbu('y', 'Jumlah Kursi (y)', domain=[0, y_maks])
+    return _spek('Grafik Optimasi Produksi Mebel', {
+        'layak': {'x': sudut[:, 0], 'y': sudut[:, 1]},
+        'jam': garis(jam_meja, jam_kursi, total_jam),
+        'kayu': garis(kayu_meja, kayu_kursi, total_kayu),
+        'optimal': {'x': [float(x_optimal)], 'y': [float(y_optimal)]},
+    }, [
+        _seri('Daerah Produksi Layak', legenda,
+              {'data': {'name': 'layak'}, 'mark': {'type': 'area', 'opacity': 0.2, 'clip': True},
+               'encoding': {'x': x, 'y': y}}),
+        _seri('Batas Jam Kerja', legenda,
+              {'data': {'name': 'jam'}, 'mark': {'type': 'line', 'clip': True},
+               'encoding': {'x': x, 'y': y}}),
+        _seri('Batas Stok Kayu', legenda,
+              {'data': {'name': 'kayu'}, 'mark': {'type': 'line', 'clip': True},
+               'encoding': {'x': x, 'y': y}}),
+        _seri(label_optimal, legenda,
+              {'data': {'name': 'optimal'}, 'mark': {'type': 'point', 'filled': True, 'size': 200},
+               'encoding': {'x': x, 'y': y,
+                            'tooltip': [{'field': 'x', 'title': 'Meja'}, {'field': 'y', 'title': 'Kursi'}]}}),
+    ])
+
+
+def spek_parametrik(c, A, b, parameter, indeks, batas, label_parameter):
+    kurva = kurva_parametrik(c, A, b, parameter, indeks, batas)
+    sekarang = float((c if parameter == 'c' else b)[indeks])
+    rentang = next(((s['dari'], s['sampai']) for s in kurva['segmen'] if s['dari'] <= sekarang <= s['sampai']), None)
+
+    legenda = [('Keuntungan Optimal (relaksasi LP)', BIRU), ('Titik Patah (rencana berganti)', 'black'),
+               ('Rentang Rencana Saat Ini', HIJAU), ('Nilai Saat Ini', MERAH)]
+    x = _sumbu('theta', label_parameter)
+    y = _sumbu('nilai', 'Keuntungan (Rp)', ',.0f')
+    lapisan = []
+    if rentang is not None:
+        lapisan.append(_seri('Rentang Rencana Saat Ini', legenda,
+                             {'data': {'values': [{}]}, 'mark': {'type': 'rect', 'opacity': 0.12},
+                              'encoding': {'x': {'datum': float(rentang[0]), 'type': 'quantitative'},
+                                           'x2': {'datum': float(rentang[1])}}}))
+    lapisan += [
+        _seri('Keuntungan Optimal (relaksasi LP)', legenda,
+              {'data': {'name': 'kurva'}, 'mark': {'type': 'line', 'strokeWidth': 2},
+               'encoding': {'x': x, 'y': y,
+                            'tooltip': [{'field': 'theta', 'title': label_parameter, 'format': ',.4g'},
+                                        {'field': 'nilai', 'title': 'Keuntungan', 'format': ',.0f'}]}}),
+        _seri('Titik Patah (rencana berganti)', legenda,
+              {'data': {'name': 'patah'}, 'mark': {'type': 'point', 'filled': True},
+               'encoding': {'x': x, 'y': y}}),
+        _seri('Nilai Saat Ini', legenda,
+              {'data': {'values': [{}]}, 'mark': {'type': 'rule', 'strokeDash': [6, 4]},
+               'encoding': {'x': {'datum': sekarang, 'type': 'quantitative'}}}),
+    ]
+    return _spek(f'Keuntungan Optimal terhadap {label_parameter}', {
+        'kurva': {'theta': kurva['theta'], 'nilai': kurva['nilai']},
+        'patah': {'theta': kurva['theta'][1:-1], 'nilai': kurva['nilai'][1:-1]},
+    }, lapisan)
+
+
+def spek_biaya_persediaan(D, S, H):
+    hasil = hitung_persediaan(D, S, H)
+    eoq, total_biaya = float(hasil['eoq']), float(hasil['total_biaya'])
+    q = np.linspace(max(1, eoq * 0.1), eoq * 2 if eoq > 0 else 200, 100)
+    holding_costs, ordering_costs, total_costs = kurva_biaya(D, S, H, q)
+
+    legenda = [('Biaya Penyimpanan', 'blue'), ('Biaya Pemesanan', 'green'), ('Total Biaya', 'red'), ('EOQ', 'purple')]
+    x = _sumbu('q', 'Kuantitas Pemesanan (kg)')
+    tooltip = [{'field': 'q', 'title': 'Q (kg)', 'format': ',.1f'},
+               {'field': 'total', 'title': 'Total Biaya (Rp)', 'format': ',.0f'}]
+    lapisan = [
+        _seri(label, legenda,
+              {'data': {'name': 'biaya'}, 'mark': {'type': 'line', 'strokeWidth': 3 if kolom == 'total' else 2},
+               'encoding': {'x': x, 'y': _sumbu(kolom, 'Biaya Tahunan (Rp)', ',.0f'), 'tooltip': tooltip}})
+        for kolom, label in (('simpan', 'Biaya Penyimpanan'), ('pesan', 'Biaya Pemesanan'), ('total', 'Total Biaya'))
+    ]
+    if eoq > 0:
+        lapisan += [
+            _seri('EOQ', legenda,
+                  {'data': {'values': [{}]}, 'mark': {'type': 'rule', 'strokeDash': [6, 4]},
+                   'encoding': {'x': {'datum': eoq, 'type': 'quantitative'}}}),
+            {'data': {'values': [{}]}, 'mark': {'type': 'text', 'align': 'left', 'dx': 10, 'dy': -20, 'fontSize': 13},
+             'encoding': {'x': {'datum': eoq, 'type': 'quantitative'},
+                          'y': {'datum': total_biaya, 'type': 'quantitative'},
+                          'text': {'value': ['Biaya Terendah', f'Rp {total_biaya:,.0f}']}}},
+        ]
+    return _spek('Analisis Biaya Persediaan (EOQ)', {
+        'biaya': {'q': q, 'simpan': holding_costs, 'pesan': ordering_costs, 'total': total_costs},
+    }, lapisan)
+
+
+def spek_siklus_persediaan(D, S, H, lead_time, safety_stock, sd_permintaan=0.0, sd_lead_time=0.0, n_jalur=5):
+    hasil = {k: float(v) for k, v in hitung_persediaan(D, S, H, lead_time, safety_stock).items()}
+    eoq, rop, siklus_pemesanan = hasil['eoq'], hasil['rop'], hasil['siklus_pemesanan']
+    if not (siklus_pemesanan > 0 and eoq > 0):
+        return {'title': 'Simulasi Siklus Persediaan', **_catatan('Tidak ada siklus pemesanan untuk parameter ini.')}
+
+    t = np.linspace(0, siklus_pemesanan * 2, 200)
+    stok_level = level_stok(t, eoq, safety_stock, hasil['permintaan_harian'], siklus_pemesanan)
+    label_rop, label_ss = f'ROP ({rop:.1f} kg)', f'Stok Pengaman ({safety_stock} kg)'
+    legenda = [('Tingkat Persediaan', BIRU), (label_rop, 'orange'), (label_ss, 'red'),
+               ('Contoh Simulasi Stokastik', ABU)]
+    x = _sumbu('t', 'Waktu (Hari)')
+    y = _sumbu('stok', 'Jumlah Stok (kg)', ',.0f', domainMin=0)
+    datasets = {'stok': {'t': t, 'stok': stok_level}}
+    lapisan = []
+
+    if sd_permintaan > 0 or sd_lead_time > 0:
+        hari = int(np.ceil(siklus_pemesanan * 2))
+        jalur = simulasi_persediaan(D, eoq, rop, safety_stock, lead_time, sd_permintaan, sd_lead_time,
+                                    horizon=hari, replikasi=n_jalur, n_jalur=n_jalur)['jalur']
+        potongan = [_kurangi_titik(np.arange(hari), stok) for stok in jalur]
+        datasets['simulasi'] = {'t': np.concatenate([p[0] for p in potongan]),
+                                'stok': np.concatenate([p[1] for p in potongan]),
+                                'jalur': np.repeat(np.arange(len(potongan)), [p[0].size for p in potongan])}
+        lapisan.append(_seri('Contoh Simulasi Stokastik', legenda,
+                             {'data': {'name': 'simulasi'},
+                              'mark': {'type': 'line', 'interpolate': 'step-after', 'opacity': 0.4, 'strokeWidth': 1},
+                              'encoding': {'x': x, 'y': y, 'detail': {'field': 'jalur', 'type': 'nominal'}}}))
+
+    lapisan += [
+        _seri('Tingkat Persediaan', legenda,
+              {'data': {'name': 'stok'}, 'mark': {'type': 'line'},
+               'encoding': {'x': x, 'y': y,
+                            'tooltip': [{'field': 't', 'title': 'Hari', 'format': '.1f'},
+                                        {'field': 'stok', 'title': 'Stok (kg)', 'format': ',.1f'}]}}),
+        _seri(label_rop, legenda,
+              {'data': {'values': [{}]}, 'mark': {'type': 'rule', 'strokeDash': [6, 4]},
+               'encoding': {'y': {'datum': rop, 'type': 'quantitative'}}}),
+        _seri(label_ss, legenda,
+              {'data': {'values': [{}]}, 'mark': {'type': 'rule', 'strokeDash': [2, 2]},
+               'encoding': {'y': {'datum': float(safety_stock), 'type': 'quantitative'}}}),
+    ]
+    t_pesan = siklus_pemesanan - lead_time
+    if t_pesan > 0:
+        posisi = {'x': {'datum': t_pesan, 'type': 'quantitative'}, 'y': {'datum': rop, 'type': 'quantitative'}}
+        lapisan += [
+            {'data': {'values': [{}]}, 'mark': {'type': 'point', 'filled': True, 'size': 100, 'color': 'red'},
+             'encoding': posisi},
+            {'data': {'values': [{}]}, 'mark': {'type': 'text', 'dy': -18, 'fontWeight': 'bold', 'color': 'red'},
+             'encoding': {**posisi, 'text': {'value': 'Pesan Ulang!'}}},
+        ]
+    return _spek('Simulasi Siklus Persediaan', datasets, lapisan)
+
+
+def spek_komposisi_waktu(lmbda, mu, c=1, K=0, Wq=None):
+    if Wq is None:
+        hasil = hitung_mmck(lmbda, mu, c, max(K, c)) if K > 0 else hitung_mmc(lmbda, mu, c)
+        Wq = hasil['Wq']
+    Wq = float(Wq)
+    if not np.isfinite(Wq):
+        return {'title': 'Bagaimana Pelanggan Menghabiskan Waktunya?',
+                **_catatan('Antrian tidak stabil: waktu tunggu terus bertambah.')}
+    menit = np.array([Wq * 60, (1 / mu) * 60])
+    bagian = ['Waktu Menunggu di Antrian', 'Waktu Dilayani']
+    theta = {'field': 'menit', 'type': 'quantitative', 'stack': True}
+    return {
+        'title': 'Bagaimana Pelanggan Menghabiskan Waktunya?',
+        'height': TINGGI,
+        'datasets': {'waktu': {'bagian': bagian, 'menit': menit, 'persen': menit / menit.sum()}},
+        'data': {'name': 'waktu'},
+        'encoding': {'theta': theta,
+                     'color': {'field': 'bagian', 'type': 'nominal', 'sort': None, 'legend': {'title': None},
+                               'scale': {'domain': bagian, 'range': ['#ff6347', '#90ee90']}}},
+        'layer': [
+            {'mark': {'type': 'arc', 'outerRadius': 140},
+             'encoding': {'tooltip': [{'field': 'bagian', 'title': 'Bagian'},
+                                      {'field': 'menit', 'title': 'Menit', 'format': '.2f'}]}},
+            {'mark': {'type': 'text', 'radius': 165, 'fontSize': 13},
+             'encoding': {'text': {'field': 'persen', 'type': 'quantitative', 'format': '.1%'}}},
+        ],
+    }
+
+
+def spek_probabilitas_antrian(lmbda, mu, c=1, K=0, p_n=None):
+    n_values = np.arange(0, 15)
+    if p_n is not None:
+        p_n_values = np.zeros(n_values.size)
+        empiris = np.asarray(p_n, dtype=float)[:n_values.size]
+        p_n_values[:empiris.size] = empiris
+    elif K > 0:
+        p_n_values = np.zeros(n_values.size)
+        distribusi = distribusi_mmck(lmbda, mu, c, max(K, c))[:n_values.size]
+        p_n_values[:distribusi.size] = distribusi
+    else:
+        p_n_values = probabilitas_n_mmc(lmbda, mu, c, n_values)
+
+    x = {'field': 'n', 'type': 'ordinal', 'title': 'Jumlah Mobil dalam Sistem (n)', 'axis': {'labelAngle': 0}}
+    y = {'field': 'p', 'type': 'quantitative', 'title': 'Probabilitas P(n)', 'axis': {'labels': False}}
+    return _spek('Seberapa Mungkin Antrian Menjadi Panjang?', {
+        'distribusi': {'n': n_values, 'p': np.nan_to_num(p_n_values)},
+    }, [
+        {'data': {'name': 'distribusi'}, 'mark': {'type': 'bar', 'color': 'skyblue'},
+         'encoding': {'x': x, 'y': y, 'tooltip': [{'field': 'n', 'title': 'n'},
+                                                   {'field': 'p', 'title': 'P(n)', 'format': '.2%'}]}},
+        {'data': {'name': 'distribusi'}, 'mark': {'type': 'text', 'baseline': 'bottom', 'dy': -2, 'fontSize': 10},
+         'encoding': {'x': x, 'y': y, 'text': {'field': 'p', 'type': 'quantitative', 'format': '.1%'}}},
+    ])
+
+
+def spek_antrian_transien(jam_mulai, lmbda_per_jam, c_per_jam, mu, langkah_per_jam=12, hasil=None):
+    # `hasil` adalah keluaran antrian_transien yang sudah dihitung pemanggil (t, Wq, Lq); dihitung di sini jika kosong
+    if hasil is None:
+        hasil = antrian_transien(profil_per_jam(lmbda_per_jam, langkah_per_jam), mu,
+                                 profil_per_jam(c_per_jam, langkah_per_jam), 1 / langkah_per_jam)
+    jam, Wq, Lq = _kurangi_titik(jam_mulai + np.concatenate([[0.0], hasil['t']]),
+                                 np.concatenate([[0.0], hasil['Wq']]) * 60, np.concatenate([[0.0], hasil['Lq']]))
+    jam_profil = jam_mulai + np.arange(len(lmbda_per_jam) + 1)
+
+    legenda = [('Waktu Tunggu Wq(t) (menit)', 'red'), ('Panjang Antrian Lq(t) (mobil)', 'blue'),
+               ('Tingkat Kedatangan λ(t)', ABU), ('Kapasitas Layanan c(t)·μ', 'green')]
+    x = _sumbu('jam', 'Jam Operasional')
+    y_kiri = _sumbu('Wq', 'Menit / Mobil')
+    tooltip = [{'field': 'jam', 'title': 'Jam', 'format': '.2f'},
+               {'field': 'Wq', 'title': 'Wq (menit)', 'format': '.1f'},
+               {'field': 'Lq', 'title': 'Lq (mobil)', 'format': '.1f'}]
+    return _spek('Kinerja Antrian Sepanjang Hari', {
+        'kinerja': {'jam': jam, 'Wq': Wq, 'Lq': Lq},
+        'profil': {'jam': jam_profil, 'lmbda': np.append(lmbda_per_jam, lmbda_per_jam[-1]),
+                   'kapasitas': np.append(np.asarray(c_per_jam) * mu, c_per_jam[-1] * mu)},
+    }, [
+        {'layer': [
+            _seri('Waktu Tunggu Wq(t) (menit)', legenda,
+                  {'data': {'name': 'kinerja'}, 'mark': {'type': 'line', 'strokeWidth': 2},
+                   'encoding': {'x': x, 'y': y_kiri, 'tooltip': tooltip}}),
+            _seri('Panjang Antrian Lq(t) (mobil)', legenda,
+                  {'data': {'name': 'kinerja'}, 'mark': {'type': 'line', 'strokeDash': [6, 4]},
+                   'encoding': {'x': x, 'y': {'field': 'Lq', 'type': 'quantitative'}, 'tooltip': tooltip}}),
+        ]},
+        {'layer': [
+            _seri('Tingkat Kedatangan λ(t)', legenda,
+                  {'data': {'name': 'profil'}, 'mark': {'type': 'line', 'interpolate': 'step-after', 'opacity': 0.6},
+                   'encoding': {'x': x, 'y': _sumbu('lmbda', 'Mobil per Jam', domainMin=0)}}),
+            _seri('Kapasitas Layanan c(t)·μ', legenda,
+                  {'data': {'name': 'profil'}, 'mark': {'type': 'line', 'interpolate': 'step-after', 'opacity': 0.6},
+                   'encoding': {'x': x, 'y': {'field': 'kapasitas', 'type': 'quantitative'}}}),
+        ]},
+    ], resolve={'scale': {'y': 'independent'}})
+
+
+def spek_keandalan(nama_mesin, keandalan, keandalan_sistem, indeks_terlemah):
+    labels = list(nama_mesin) + ["SISTEM TOTAL"]
+    values = [float(v) for v in keandalan] + [float(keandalan_sistem)]
+    bar_colors = ['#87CEEB'] * len(nama_mesin)
+    bar_colors[indeks_terlemah] = '#FF6347'
+    bar_colors.append('#9370DB')
+
+    x = {'field': 'label', 'type': 'nominal', 'sort': None, 'title': None, 'axis': {'labelAngle': 0}}
+    y = _sumbu('nilai', 'Tingkat Keandalan (Reliability)', '.0%',
+               domain=[min(0.75, min(values) * 0.95 if values else 0.75), 1.01], zero=False)
+    return _spek('Perbandingan Keandalan Komponen dan Sistem', {
+        'batang': {'label': labels, 'nilai': values, 'warna': bar_colors},
+    }, [
+        {'data': {'name': 'batang'}, 'mark': {'type': 'bar', 'clip': True},
+         'encoding': {'x': x, 'y': y, 'color': {'field': 'warna', 'type': 'nominal', 'scale': None},
+                      'tooltip': [{'field': 'label', 'title': 'Stasiun'},
+                                  {'field': 'nilai', 'title': 'Keandalan', 'format': '.3%'}]}},
+        {'data': {'name': 'batang'}, 'mark': {'type': 'text', 'baseline': 'bottom', 'dy': -2},
+         'encoding': {'x': x, 'y': y, 'text': {'field': 'nilai', 'type': 'quantitative', 'format': '.2%'}}},
+    ])
+
+
+def spek_ketersediaan(jam, kurva_ketersediaan, ketersediaan, persentil_5):
+    hari, kurva = _kurangi_titik(np.asarray(jam) / 24, kurva_ketersediaan)
+    label_rata = f'Rata-rata Horizon ({ketersediaan:.2%})'
+    label_p5 = f'Persentil 5% per Replikasi ({persentil_5:.2%})'
+    legenda = [('Ketersediaan Lini A(t)', 'blue'), (label_rata, UNGU), (label_p5, '#FF6347')]
+    batas_bawah = min(0.75, min(float(np.min(kurva_ketersediaan)), persentil_5) * 0.95)
+    return _spek('Ketersediaan Lini Sepanjang Horizon', {
+        'kurva': {'hari': hari, 'A': kurva},
+    }, [
+        _seri('Ketersediaan Lini A(t)', legenda,
+              {'data': {'name': 'kurva'}, 'mark': {'type': 'line', 'strokeWidth': 2},
+               'encoding': {'x': _sumbu('hari', 'Hari'),
+                            'y': _sumbu('A', 'Peluang Lini Beroperasi', '.0%', domain=[batas_bawah, 1.01], zero=False),
+                            'tooltip': [{'field': 'hari', 'title': 'Hari', 'format': '.1f'},
+                                        {'field': 'A', 'title': 'A(t)', 'format': '.2%'}]}}),
+        _seri(label_rata, legenda,
+              {'data': {'values': [{}]}, 'mark': {'type': 'rule', 'strokeDash': [6, 4]},
+               'encoding': {'y': {'datum': float(ketersediaan), 'type': 'quantitative'}}}),
+        _seri(label_p5, legenda,
+              {'data': {'values': [{}]}, 'mark': {'type': 'rule', 'strokeDash': [2, 2]},
+               'encoding': {'y': {'datum': float(persentil_5), 'type': 'quantitative'}}}),
+    ])
+
+
+def spek_frontier_redundansi(biaya, keandalan, keandalan_awal, biaya_terpilih, keandalan_terpilih):
+    biaya, keandalan = _kurangi_titik(biaya, keandalan)
+    label_awal = f'Keandalan Saat Ini ({keandalan_awal:.2%})'
+    label_terpilih = f'Alokasi Terpilih ({keandalan_terpilih:.2%})'
+    legenda = [('Frontier Efisien', 'blue'), (label_awal, ABU), (label_terpilih, '#FF6347')]
+    x = _sumbu('biaya', 'Biaya Mesin Cadangan (juta Rp)', ',.0f')
+    y = _sumbu('R', 'Keandalan Lini', '.1%', zero=False)
+    return _spek('Anggaran vs Keandalan Lini Terbaik', {
+        'frontier': {'biaya': biaya, 'R': keandalan},
+    }, [
+        _seri('Frontier Efisien', legenda,
+              {'data': {'name': 'frontier'}, 'mark': {'type': 'line', 'interpolate': 'step-after', 'point': True},
+               'encoding': {'x': x, 'y': y,
+                            'tooltip': [{'field': 'biaya', 'title': 'Biaya (juta Rp)', 'format': ',.1f'},
+                                        {'field': 'R', 'title': 'Keandalan', 'format': '.3%'}]}}),
+        _seri(label_awal, legenda,
+              {'data': {'values': [{}]}, 'mark': {'type': 'rule', 'strokeDash': [6, 4]},
+               'encoding': {'y': {'datum': float(keandalan_awal), 'type': 'quantitative'}}}),
+        _seri(label_terpilih, legenda,
+              {'data': {'values': [{}]}, 'mark': {'type': 'point', 'shape': 'diamond', 'size': 250, 'filled': True},
+               'encoding': {'x': {'datum': float(biaya_terpilih), 'type': 'quantitative'},
+                            'y': {'datum': float(keandalan_terpilih), 'type': 'quantitative'}}}),
+    ])
+
+
+def spek_sensitivitas(model, sumbu_x, sumbu_y, tetap, keluaran, label_x, label_y, label_nilai, faktor=1.0,
+                      titik=None):
+    """Heatmap `keluaran` seperti `grafik_sensitivitas`; grid dihitung penuh lalu dirata-rata per blok sel.
+
+    Kontur tidak digambar: nilai setiap sel dapat dibaca langsung dari tooltip.
+    """
+    (nama_x, *rentang_x), (nama_y, *rentang_y) = sumbu_x, sumbu_y
+    x, y = np.linspace(*rentang_x), np.linspace(*rentang_y)
+    # Dirender dari thread skrip Streamlit: grid dihitung di proses ini, tanpa fork pool proses
+    hasil = sapuan_parameter(model, {nama_y: y, nama_x: x}, tetap, keluaran=[keluaran], n_proses=1)
+    nilai = np.asarray(hasil[keluaran], dtype=float) * faktor
+    x, y, nilai = _kurangi_grid(x, y, np.where(np.isfinite(nilai), nilai, np.nan))
+    x_kiri, x_kanan = _tepi(x)
+    y_bawah, y_atas = _tepi(y)
+
+    # Sel tak terdefinisi tidak dikirim; latar abu-abu menandainya seperti pada grafik statis
+    iy, ix = np.nonzero(np.isfinite(nilai))
+    warna = {'field': 'nilai', 'type': 'quantitative', 'title': label_nilai,
+             'scale': {'scheme': 'viridis', 'clamp': True}}
+    if iy.size:
+        # Nilai ekstrem di dekat batas (mis. ρ → 1) dipotong agar gradasi di daerah lain tetap terlihat
+        warna['scale']['domainMax'] = float(np.percentile(nilai[iy, ix], 98))
+    lapisan = [
+        {'data': {'name': 'grid'}, 'mark': {'type': 'rect'},
+         'encoding': {'x': _sumbu('x0', label_x, domain=[float(x_kiri[0]), float(x_kanan[-1])], nice=False),
+                      'x2': {'field': 'x1'},
+                      'y': _sumbu('y0', label_y, domain=[float(y_bawah[0]), float(y_atas[-1])], nice=False),
+                      'y2': {'field': 'y1'},
+                      'color': warna,
+                      'tooltip': [{'field': 'x', 'title': label_x, 'format': '.3g'},
+                                  {'field': 'y', 'title': label_y, 'format': '.3g'},
+                                  {'field': 'nilai', 'title': label_nilai, 'format': '.4g'}]}},
+    ]
+    if titik is not None:
+        lapisan.append({'data': {'values': [{}]},
+                        'mark': {'type': 'point', 'shape': 'diamond', 'filled': True, 'size': 250, 'color': 'red',
+                                 'stroke': 'white', 'strokeWidth': 1.5, 'tooltip': {'content': 'data'}},
+                        'encoding': {'x': {'datum': float(titik[0]), 'type': 'quantitative'},
+                                     'y': {'datum': float(titik[1]), 'type': 'quantitative'}}})
+    return _spek(f'Peta Sensitivitas: {label_nilai}', {
+        'grid': {'x': x[ix], 'y': y[iy], 'x0': x_kiri[ix], 'x1': x_kanan[ix], 'y0': y_bawah[iy], 'y1': y_atas[iy],
+                 'nilai': nilai[iy, ix]},
+    }, lapisan, config={'view': {'fill': '#DDDDDD'}})
+
+
+# Padanan klien setiap grafik statis, berdasarkan nama fungsi `grafik_*`
+SPEK_KLIEN = {
+    'grafik_produksi': spek_produksi,
+    'grafik_parametrik': spek_parametrik,
+    'grafik_biaya_persediaan': spek_biaya_persediaan,
+    'grafik_siklus_persediaan': spek_siklus_persediaan,
+    'grafik_komposisi_waktu': spek_komposisi_waktu,
+    'grafik_probabilitas_antrian': spek_probabilitas_antrian,
+    'grafik_antrian_transien': spek_antrian_transien,
+    'grafik_keandalan': spek_keandalan,
+    'grafik_ketersediaan': spek_ketersediaan,
+    'grafik_frontier_redundansi': spek_frontier_redundansi,
+    'grafik_sensitivitas': spek_sensitivitas,
+}
+
+CACHE_SPEK = CacheGrafik(maks_item=int(os.environ.get('GRAFIK_CACHE_ITEM', 256)),
+                         maks_byte=int(float(os.environ.get('GRAFIK_CACHE_MB', 64)) * 2**20))
+
+
+def _ukuran_spek(spek):
+    return 4096 + sum(np.asarray(kolom).nbytes for data in spek.get('datasets', {}).values() for kolom in data.values())
+
+
+def spek_grafik(fungsi, cache=CACHE_SPEK, **params):
+    """Spesifikasi Vega-Lite untuk grafik statis `fungsi`; diambil dari cache jika parameternya pernah dipakai."""
+    spek_fungsi = SPEK_KLIEN[fungsi.__name__]
+    kunci = kunci_grafik(spek_fungsi, params)
+    spek = cache.ambil(kunci)
+    if spek is None:
+        spek = spek_fungsi(**params)
+        cache.simpan(kunci, spek, _ukuran_spek(spek))
+    # Streamlit memindahkan `datasets` keluar dari spesifikasi yang diterimanya; entri cache tidak boleh ikut berubah
+    return copy.deepcopy(spek)
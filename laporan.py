@@ -0,0 +1,430 @@
+"""Ekspor laporan keempat analisis (grafik dan angka "Lihat Proses Perhitungan") untuk banyak skenario.
+
+Setiap baris berkas skenario (CSV berheader atau JSON lines) adalah satu pabrik/toko; kolomnya adalah
+parameter dashboard (lihat `PARAMETER_BAWAAN`, kolom yang tidak ada memakai nilai bawaan dashboard).
+Keandalan lini dibaca dari kolom `R_<mesin>` dan `unit_<mesin>`.
+
+    python laporan.py skenario.csv -o laporan/ -j 8
+    python laporan.py skenario.jsonl -o laporan/ --format pdf -a persediaan,antrian
+
+Grafik memakai fungsi `grafik_*` yang sama dengan dashboard dan dirender tanpa pyplot (Agg/PDF, tanpa
+GUI) di pool proses. Format bawaan `png` menyimpan setiap grafik sekali di `grafik/<hash>.png`, dengan
+hash dari nama fungsi dan parameternya, sehingga skenario yang menghasilkan grafik identik tidak
+merender ulang; setiap skenario menjadi `<id>.md` yang merujuk PNG tersebut. Dengan `--format pdf`,
+setiap skenario menjadi satu `<id>.pdf` dengan grafik vektor yang digambar langsung di halamannya:
+berkasnya berdiri sendiri, tetapi setiap grafik digambar ulang untuk setiap skenario (tanpa dedup),
+jadi untuk ribuan skenario dengan banyak grafik kembar `png` jauh lebih cepat. Laporan langsung ditulis
+ke disk, dan `indeks.jsonl` berisi angka ringkasan semua skenario.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from grafik import (gambar_di, grafik_biaya_persediaan, grafik_keandalan, grafik_komposisi_waktu,
+                    grafik_probabilitas_antrian, grafik_produksi, grafik_siklus_persediaan, render_png)
+from model_industri import (bagi_berkas, baca_potongan, hitung_diagram, hitung_mmc, hitung_mmck, hitung_persediaan,
+                            hitung_produksi, kolom_berkas, kunci_hasil, selesaikan_lp, staf_minimal)
+
+# Nilai bawaan dashboard untuk kolom yang tidak ada di berkas skenario
+PARAMETER_BAWAAN = {
+    'produksi': {'profit_meja': 750000, 'profit_kursi': 300000, 'jam_meja': 6.0, 'jam_kursi': 2.0,
+                 'kayu_meja': 4.0, 'kayu_kursi': 1.5, 'total_jam': 240, 'total_kayu': 120},
+    'persediaan': {'D': 1200, 'S': 500000, 'H': 25000, 'lead_time': 14, 'safety_stock': 10,
+                   'sd_permintaan': 1.0, 'sd_lead_time': 2.0},
+    'antrian': {'lmbda': 30, 'mu': 35, 'c': 1, 'K': 0, 'target_wq': 5.0},
+}
+KEANDALAN_BAWAAN = {'Stamping': 0.98, 'Welding': 0.99, 'Painting': 0.96, 'Assembly': 0.97}
+ANALISIS = ('produksi', 'persediaan', 'antrian', 'keandalan')
+
+# Setiap tugas pekerja hanya berisi beberapa skenario: render jauh lebih mahal daripada membaca baris
+UKURAN_CHUNK_BYTE = 4096
+# Detik maksimum menunggu grafik yang sedang dirender pekerja lain sebelum merendernya sendiri
+BATAS_TUNGGU_GRAFIK = 60.0
+# Halaman A4 tegak untuk laporan PDF
+UKURAN_HALAMAN = (8.27, 11.69)
+
+
+def _angka(nilai):
+    nilai = float(nilai)
+    return int(nilai) if nilai == int(nilai) else nilai
+
+
+def _laporan_produksi(p):
+    hasil = hitung_produksi(**p)
+    titik = sorted({tuple(map(float, t)) for t, ok in zip(hasil['titik'], hasil['layak']) if ok})
+    lp = selesaikan_lp([p['profit_meja'], p['profit_kursi']], [[p['jam_meja'], p['jam_kursi']],
+                                                                [p['kayu_meja'], p['kayu_kursi']]],
+                       [p['total_jam'], p['total_kayu']], integer=True)
+    if lp['status'] != 'optimal':
+        return {'baris': [f"Program linear tidak memiliki solusi optimal ({lp['status']})."], 'grafik': [],
+                'ringkasan': {'status': lp['status']}}
+    meja, kursi = int(round(lp['x'][0])), int(round(lp['x'][1]))
+    optimal_lp = (round(float(hasil['x']), 2), round(float(hasil['y']), 2))
+    baris = [f"Fungsi tujuan : Z = {p['profit_meja']:,.0f}x + {p['profit_kursi']:,.0f}y",
+             f"Kendala 1     : {p['jam_meja']}x + {p['jam_kursi']}y <= {p['total_jam']}",
+             f"Kendala 2     : {p['kayu_meja']}x + {p['kayu_kursi']}y <= {p['total_kayu']}",
+             '', 'Perhitungan di titik-titik sudut:']
+    for x, y in titik:
+        tanda = '  (optimal LP)' if (round(x, 2), round(y, 2)) == optimal_lp else ''
+        baris.append(f"  ({x:.2f}, {y:.2f}): Z = Rp {p['profit_meja'] * x + p['profit_kursi'] * y:,.0f}{tanda}")
+    baris += ['', f"Solusi bulat (branch-and-bound): {meja} meja, {kursi} kursi, Z = Rp {lp['nilai']:,.0f}",
+              f"  {lp['node']} node, batas atas relaksasi Rp {lp['nilai_relaksasi']:,.0f}",
+              f"Harga bayangan jam kerja: Rp {lp['shadow_price'][0]:,.0f} per jam",
+              f"Harga bayangan kayu jati: Rp {lp['shadow_price'][1]:,.0f} per unit"]
+    grafik = [(grafik_produksi, {'jam_meja': p['jam_meja'], 'jam_kursi': p['jam_kursi'],
+                                 'kayu_meja': p['kayu_meja'], 'kayu_kursi': p['kayu_kursi'],
+                                 'total_jam': p['total_jam'], 'total_kayu': p['total_kayu'],
+                                 'x_optimal': meja, 'y_optimal': kursi})]
+    return {'baris': baris, 'grafik': grafik,
+            'ringkasan': {'meja': meja, 'kursi': kursi, 'profit': float(lp['nilai'])}}
+
+
+def _laporan_persediaan(p):
+    D, S, H, lead_time, safety_stock = (p[k] for k in ('D', 'S', 'H', 'lead_time', 'safety_stock'))
+    hasil = {k: float(v) for k, v in hitung_persediaan(D, S, H, lead_time, safety_stock).items()}
+    eoq, rop, total_biaya = hasil['eoq'], hasil['rop'], hasil['total_biaya']
+    baris = [f"1. EOQ  : Q* = sqrt(2 x {D} x {S} / {H}) = {eoq:.2f} unit",
+             f"2. ROP  : ({D}/360 x {lead_time}) + {safety_stock} = {rop:.2f} unit",
+             f"3. TC   : ({D}/{eoq:.2f}) x {S} + ({eoq:.2f}/2) x {H} = Rp {total_biaya:,.2f}",
+             f"Siklus pemesanan: ~{hasil['siklus_pemesanan']:.1f} hari"]
+    grafik = [(grafik_biaya_persediaan, {'D': D, 'S': S, 'H': H}),
+              (grafik_siklus_persediaan, {'D': D, 'S': S, 'H': H, 'lead_time': lead_time,
+                                          'safety_stock': safety_stock, 'sd_permintaan': p['sd_permintaan'],
+                                          'sd_lead_time': p['sd_lead_time']})]
+    return {'baris': baris, 'grafik': grafik, 'ringkasan': {'eoq': eoq, 'rop': rop, 'total_biaya': total_biaya}}
+
+
+def _laporan_antrian(p):
+    lmbda, mu, c, K = p['lmbda'], p['mu'], int(p['c']), int(p['K'])
+    c_disarankan = int(staf_minimal(lmbda, mu, p['target_wq'] / 60)['c'])
+    rekomendasi = f"Staf minimal untuk Wq <= {p['target_wq']:.1f} menit: {c_disarankan} jalur"
+    if K == 0 and c * mu <= lmbda:
+        return {'baris': [f"Tidak stabil: c x mu = {c * mu} <= lambda = {lmbda}.", rekomendasi], 'grafik': [],
+                'ringkasan': {'stabil': False, 'c_minimal': c_disarankan}}
+    hasil = hitung_mmck(lmbda, mu, c, max(K, c)) if K > 0 else hitung_mmc(lmbda, mu, c)
+    rho, L, Lq, W, Wq, p_tunggu = (float(hasil[k]) for k in ('rho', 'L', 'Lq', 'W', 'Wq', 'p_tunggu'))
+    baris = [f"rho = {lmbda} / ({c} x {mu}) = {rho:.2f}  (utilisasi)",
+             f"L   = {L:.2f} mobil di sistem    | Lq = {Lq:.2f} mobil di antrian",
+             f"W   = {W * 60:.2f} menit            | Wq = {Wq * 60:.2f} menit",
+             f"P(menunggu) = {p_tunggu:.2%}"]
+    if K > 0:
+        baris.append(f"P(ditolak, sistem penuh K = {max(K, c)}) = {float(hasil['p_blok']):.2%}")
+    baris.append(rekomendasi)
+    grafik = [(grafik_komposisi_waktu, {'lmbda': lmbda, 'mu': mu, 'c': c, 'K': K}),
+              (grafik_probabilitas_antrian, {'lmbda': lmbda, 'mu': mu, 'c': c, 'K': K, 'p_n': None})]
+    return {'baris': baris, 'grafik': grafik,
+            'ringkasan': {'stabil': True, 'rho': rho, 'Wq_menit': Wq * 60, 'c_minimal': c_disarankan}}
+
+
+def _laporan_keandalan(p):
+    keandalan_mesin, unit = p['keandalan'], p['unit']
+    # Sama dengan dashboard: stasiun dengan beberapa unit menjadi blok paralel "Nama #1", "Nama #2", ...
+    komponen_stasiun = {nama: [nama] if unit[nama] == 1 else [f"{nama} #{j}" for j in range(1, unit[nama] + 1)]
+                        for nama in keandalan_mesin}
+    definisi = ('seri', [daftar[0] if len(daftar) == 1 else ('paralel', daftar)
+                         for daftar in komponen_stasiun.values()])
+    keandalan_komponen = {k: keandalan_mesin[nama] for nama, daftar in komponen_stasiun.items() for k in daftar}
+    hasil = hitung_diagram(definisi, keandalan_komponen)
+    keandalan_sistem = float(hasil['keandalan'])
+    kritikalitas = dict(zip(hasil['komponen'], hasil['kritikalitas']))
+    kritikalitas_stasiun = {nama: max(kritikalitas[k] for k in daftar) for nama, daftar in komponen_stasiun.items()}
+    stasiun_kritis = max(kritikalitas_stasiun, key=kritikalitas_stasiun.get)
+    keandalan_stasiun = {nama: 1 - (1 - r) ** unit[nama] for nama, r in keandalan_mesin.items()}
+
+    baris = ['Rs = ' + ' x '.join(f"[1 - (1 - {keandalan_mesin[nama]})^{unit[nama]}]" for nama in keandalan_mesin)
+             + f" = {keandalan_sistem:.4f}", '',
+             f"{'Komponen':<16}{'Keandalan':>11}{'Birnbaum':>11}{'Kritikalitas':>14}"]
+    for komponen, birnbaum, kritis in zip(hasil['komponen'], hasil['birnbaum'], hasil['kritikalitas']):
+        baris.append(f"{komponen:<16}{keandalan_komponen[komponen]:>11.4f}{birnbaum:>11.4f}{kritis:>14.4f}")
+    baris += ['', f"Stasiun paling kritis: {stasiun_kritis} "
+                  f"({kritikalitas_stasiun[stasiun_kritis]:.1%} dari kegagalan lini)"]
+    grafik = [(grafik_keandalan, {'nama_mesin': list(keandalan_stasiun), 'keandalan': list(keandalan_stasiun.values()),
+                                  'keandalan_sistem': keandalan_sistem,
+                                  'indeks_terlemah': list(keandalan_stasiun).index(stasiun_kritis)})]
+    return {'baris': baris, 'grafik': grafik,
+            'ringkasan': {'keandalan': keandalan_sistem, 'stasiun_kritis': stasiun_kritis}}
+
+
+LAPORAN = {
+    'produksi': ("Optimasi Produksi Furnitur (Linear Programming)", _laporan_produksi),
+    'persediaan': ("Manajemen Persediaan (EOQ)", _laporan_persediaan),
+    'antrian': ("Analisis Sistem Antrian (M/M/c)", _laporan_antrian),
+    'keandalan': ("Keandalan Lini Produksi", _laporan_keandalan),
+}
+
+
+def parameter_skenario(baris):
+    """Parameter setiap analisis untuk satu baris skenario `{kolom: nilai}`, dilengkapi nilai bawaan."""
+    parameter = {model: {k: _angka(baris.get(k, v)) for k, v in bawaan.items()}
+                 for model, bawaan in PARAMETER_BAWAAN.items()}
+    mesin = [k[2:] for k in baris if k.startswith('R_')] or list(KEANDALAN_BAWAAN)
+    parameter['keandalan'] = {
+        'keandalan': {nama: float(baris.get(f'R_{nama}', KEANDALAN_BAWAAN.get(nama, 1.0))) for nama in mesin},
+        'unit': {nama: max(int(float(baris.get(f'unit_{nama}', 1))), 1) for nama in mesin},
+    }
+    return parameter
+
+
+def _id_skenario(nilai):
+    # Id numerik dari CSV terbaca sebagai float: 7.0 menjadi 7
+    return int(nilai) if isinstance(nilai, float) and nilai.is_integer() else nilai
+
+
+def _nama_berkas(id_skenario):
+    return re.sub(r'[^\w.-]+', '_', str(id_skenario)).strip('._') or 'skenario'
+
+
+def _nama_unik(id_skenario, nomor, dipakai):
+    """Nama berkas untuk `id_skenario` yang belum ada di `dipakai`; id kembar (termasuk yang baru sama setelah
+    dibersihkan, mis. `a/b` dan `a_b`, atau hanya beda huruf besar) diberi akhiran nomor baris."""
+    dasar = nama = _nama_berkas(id_skenario)
+    ke = 1
+    while nama.casefold() in dipakai:
+        nama = f'{dasar}-{nomor}' if ke == 1 else f'{dasar}-{nomor}-{ke}'
+        ke += 1
+    dipakai.add(nama.casefold())
+    return nama
+
+
+def _render_ke_berkas(fungsi, params, path):
+    png = render_png(fungsi(**params))
+    # Berkas sementara lalu ganti nama: tidak ada yang pernah membaca PNG setengah jadi
+    sementara = f'{path}.{os.getpid()}.tmp'
+    with open(sementara, 'wb') as f:
+        f.write(png)
+    os.replace(sementara, path)
+
+
+def _simpan_grafik(folder, fungsi, params, dikenal, statistik):
+    """Path PNG `fungsi(**params)` di `folder/grafik`; dirender hanya jika hash-nya belum pernah disimpan."""
+    nama = kunci_hasil(fungsi, kwargs=params) + '.png'
+    path = os.path.join(folder, 'grafik', nama)
+    if nama in dikenal or os.path.exists(path):
+        statistik['grafik_dipakai_ulang'] += 1
+        dikenal.add(nama)
+        return path
+    try:
+        # Klaim eksklusif: pekerja lain yang butuh grafik yang sama menunggu, bukan ikut merender
+        klaim = os.open(f'{path}.klaim', os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        batas = time.monotonic() + BATAS_TUNGGU_GRAFIK
+        while not os.path.exists(path) and time.monotonic() < batas:
+            time.sleep(0.01)
+        if os.path.exists(path):
+            statistik['grafik_dipakai_ulang'] += 1
+        else:
+            # Klaim basi (pekerja sebelumnya berhenti di tengah render): render sendiri
+            _render_ke_berkas(fungsi, params, path)
+            statistik['grafik_dirender'] += 1
+    else:
+        try:
+            _render_ke_berkas(fungsi, params, path)
+            statistik['grafik_dirender'] += 1
+        finally:
+            os.close(klaim)
+            os.remove(f'{path}.klaim')
+    dikenal.add(nama)
+    return path
+
+
+def _halaman(judul, id_skenario, baris, grafik):
+    """Satu halaman A4 laporan: angka perhitungan di atas, grafik `(fungsi, params)` di bawahnya."""
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=UKURAN_HALAMAN)
+    fig.text(0.06, 0.965, f'{judul}  |  Skenario {id_skenario}', fontsize=13, weight='bold', va='top')
+    fig.text(0.06, 0.93, '\n'.join(baris), fontsize=8, family='monospace', va='top')
+    if grafik:
+        # Blok teks memakai sepertiga atas (cukup untuk ~20 baris); grafik ditumpuk di bawahnya, masing-masing
+        # digambar vektor ke subfigurnya sendiri
+        kanvas = fig.subfigures(len(grafik) + 1, 1, height_ratios=[0.34] + [0.66 / len(grafik)] * len(grafik))
+        for sub, (fungsi, params) in zip(kanvas[1:], grafik):
+            with gambar_di(sub):
+                fungsi(**params)
+    return fig
+
+
+def _tulis_pdf(path, id_skenario, bagian):
+    from matplotlib.backends.backend_pdf import PdfPages
+
+    # Satu halaman per analisis; PdfPages menulis setiap halaman langsung ke berkas
+    with PdfPages(path, metadata={'Title': f'Laporan Skenario {id_skenario}'}) as pdf:
+        for judul, baris, grafik in bagian:
+            fig = _halaman(judul, id_skenario, baris, grafik)
+            pdf.savefig(fig)
+            fig.clear()
+
+
+def _tulis_md(path, folder, id_skenario, bagian):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f'# Laporan Skenario {id_skenario}\n')
+        for judul, baris, path_grafik in bagian:
+            f.write(f'\n## {judul}\n\n```\n' + '\n'.join(baris) + '\n```\n')
+            for path_png in path_grafik:
+                f.write(f'\n![{judul}]({os.path.relpath(path_png, folder)})\n')
+
+
+def _proses_potongan(path, awal, akhir, kolom, kolom_id, nomor_awal, nama, folder, format_laporan, analisis):
+    """Hitung, render, dan tulis laporan untuk satu potongan berkas skenario; dijalankan di proses pekerja.
+
+    `nama` berisi nama berkas unik setiap baris (dari `buat_laporan`), atau None jika id-nya nomor baris.
+    """
+    data = baca_potongan(path, kolom, awal, akhir)
+    n = len(data[kolom[0]]) if kolom else 0
+    statistik = {'grafik_dirender': 0, 'grafik_dipakai_ulang': 0}
+    dikenal = set()
+    indeks = []
+    for i in range(n):
+        baris = {k: data[k][i].item() for k in kolom}
+        id_skenario = _id_skenario(baris.pop(kolom_id, nomor_awal + i))
+        nama_berkas = _nama_berkas(id_skenario) if nama is None else nama[i]
+        try:
+            parameter = parameter_skenario(baris)
+            bagian, ringkasan = [], {}
+            for model in analisis:
+                judul, fungsi = LAPORAN[model]
+                laporan = fungsi(parameter[model])
+                if format_laporan == 'pdf':
+                    grafik = laporan['grafik']
+                    statistik['grafik_dirender'] += len(grafik)
+                else:
+                    grafik = [_simpan_grafik(folder, g, p, dikenal, statistik) for g, p in laporan['grafik']]
+                bagian.append((judul, laporan['baris'], grafik))
+                ringkasan[model] = laporan['ringkasan']
+            if format_laporan == 'pdf':
+                berkas = nama_berkas + '.pdf'
+                _tulis_pdf(os.path.join(folder, berkas), id_skenario, bagian)
+                rekaman = {'id': id_skenario, 'berkas': berkas}
+            else:
+                berkas = nama_berkas + '.md'
+                _tulis_md(os.path.join(folder, berkas), folder, id_skenario, bagian)
+                rekaman = {'id': id_skenario, 'berkas': berkas,
+                           'grafik': [os.path.basename(p) for _, _, daftar in bagian for p in daftar]}
+            indeks.append({**rekaman, **ringkasan})
+        except (KeyError, TypeError, ValueError, ZeroDivisionError) as e:
+            indeks.append({'id': id_skenario, 'galat': f'{type(e).__name__}: {e}'})
+    return indeks, statistik
+
+
+def buat_laporan(masukan, folder, format_laporan='png', analisis=ANALISIS, kolom_id='id',
+                 ukuran_chunk_byte=UKURAN_CHUNK_BYTE, n_proses=None, progres=None):
+    """Tulis satu laporan per baris `masukan` (CSV berheader atau JSON lines) ke `folder`.
+
+    `format_laporan` 'png' menghasilkan `<id>.md` yang merujuk PNG di `folder/grafik` (grafik kembar
+    dirender sekali); 'pdf' menghasilkan `<id>.pdf` (satu halaman per analisis, grafik vektor tanpa
+    dedup). Kolom `kolom_id` menjadi nama berkas (bawaan: nomor baris); id yang kembar diberi akhiran
+    `-<nomor baris>` agar tidak saling menimpa. Potongan berkas (paling besar `ukuran_chunk_byte`, dan
+    cukup kecil agar setiap proses mendapat beberapa potongan) dikerjakan di `n_proses` proses (bawaan:
+    semua CPU) dengan paling banyak 2×`n_proses` potongan berjalan, dan `indeks.jsonl` ditulis berurutan
+    saat potongan selesai.
+    `progres`, jika ada, dipanggil dengan `(skenario, potongan_selesai, total_potongan)`.
+    Mengembalikan jumlah `skenario`, `gagal`, `grafik_dirender`, `grafik_dipakai_ulang`, dan `detik`.
+    """
+    tidak_dikenal = [a for a in analisis if a not in LAPORAN]
+    if tidak_dikenal:
+        raise ValueError(f"Analisis tidak dikenal: {', '.join(tidak_dikenal)}. Pilih {', '.join(ANALISIS)}.")
+    if format_laporan not in ('pdf', 'png'):
+        raise ValueError(f"Format laporan tidak dikenal: {format_laporan!r}. Pilih pdf atau png.")
+    kolom = kolom_berkas(masukan)
+    os.makedirs(os.path.join(folder, 'grafik') if format_laporan == 'png' else folder, exist_ok=True)
+
+    mulai = time.perf_counter()
+    n_proses = max(n_proses or os.cpu_count() or 1, 1)
+    # Setiap baris mahal dirender, jadi berkas kecil pun dibagi agar ada sekitar 4 potongan per proses
+    ukuran_chunk_byte = max(min(ukuran_chunk_byte, os.path.getsize(masukan) // (4 * n_proses)), 1)
+    potongan = bagi_berkas(masukan, ukuran_chunk_byte)
+    # Nomor baris awal setiap potongan (id skenario bila kolom id tidak ada) dan, jika ada kolom id, nama berkas
+    # setiap baris; nama ditetapkan di sini, berurutan, karena pekerja tidak tahu id di potongan lain
+    argumen, n, dipakai = [], 1, set()
+    with open(masukan, 'rb') as f:
+        for awal, akhir in potongan:
+            if kolom_id in kolom:
+                daftar_id = baca_potongan(masukan, [kolom_id], awal, akhir)[kolom_id].tolist()
+                nama = [_nama_unik(_id_skenario(v), n + i, dipakai) for i, v in enumerate(daftar_id)]
+                jumlah = len(daftar_id)
+            else:
+                f.seek(awal)
+                nama, jumlah = None, f.read(akhir - awal).count(b'\n')
+            argumen.append((masukan, awal, akhir, kolom, kolom_id, n, nama, folder, format_laporan, tuple(analisis)))
+            n += jumlah
+    status = {'skenario': 0, 'gagal': 0, 'grafik_dirender': 0, 'grafik_dipakai_ulang': 0, 'potongan': 0}
+
+    with open(os.path.join(folder, 'indeks.jsonl'), 'w', encoding='utf-8') as berkas_indeks:
+        def tulis(hasil):
+            indeks, statistik = hasil
+            for rekaman in indeks:
+                berkas_indeks.write(json.dumps(rekaman, ensure_ascii=False) + '\n')
+            status['skenario'] += len(indeks)
+            status['gagal'] += sum('galat' in r for r in indeks)
+            for k, v in statistik.items():
+                status[k] += v
+            status['potongan'] += 1
+            if progres:
+                progres(status['skenario'], status['potongan'], len(argumen))
+
+        n_proses = max(min(n_proses, len(argumen)), 1)
+        if n_proses <= 1:
+            for a in argumen:
+                tulis(_proses_potongan(*a))
+        else:
+            with ProcessPoolExecutor(n_proses) as pool:
+                antre = deque()
+                for a in argumen:
+                    if len(antre) >= 2 * n_proses:
+                        tulis(antre.popleft().result())
+                    antre.append(pool.submit(_proses_potongan, *a))
+                while antre:
+                    tulis(antre.popleft().result())
+    del status['potongan']
+    return {**status, 'detik': time.perf_counter() - mulai}
+
+
+def main(argv=None):
+    kolom = '\n'.join(f"  {model:<11} " + ', '.join(f'{k}={v}' for k, v in bawaan.items())
+                      for model, bawaan in PARAMETER_BAWAAN.items())
+    parser = argparse.ArgumentParser(
+        description='Ekspor laporan PDF/PNG analisis produksi, persediaan, antrian, dan keandalan '
+                    'untuk setiap baris berkas skenario.',
+        epilog=f'Kolom skenario (semuanya opsional, nilai bawaan dashboard):\n{kolom}\n'
+               f"  {'keandalan':<11} R_<mesin> (0-1) dan unit_<mesin> per stasiun seri, "
+               f"bawaan {', '.join(f'R_{k}={v}' for k, v in KEANDALAN_BAWAAN.items())}\n"
+               '  (antrian: K = 0 berarti kapasitas tak terbatas; target_wq dalam menit)',
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('masukan', help='CSV berheader atau JSON lines (.jsonl/.ndjson), satu baris per skenario')
+    parser.add_argument('-o', '--keluaran', default='laporan', help='folder keluaran (bawaan: %(default)s)')
+    parser.add_argument('-f', '--format', choices=['png', 'pdf'], default='png',
+                        help='png (bawaan): PNG di grafik/, grafik kembar dirender sekali, dan ringkasan Markdown '
+                             'per skenario; pdf: satu PDF mandiri per skenario, grafik vektor digambar per skenario')
+    parser.add_argument('-a', '--analisis', default=','.join(ANALISIS),
+                        help='analisis yang disertakan, dipisah koma (bawaan: semua)')
+    parser.add_argument('--id', default='id', help='kolom id skenario untuk nama berkas (bawaan: %(default)s)')
+    parser.add_argument('-j', '--proses', type=int, help='jumlah proses pekerja (bawaan: semua CPU)')
+    parser.add_argument('--chunk-kb', type=float, default=UKURAN_CHUNK_BYTE / 1024,
+                        help='ukuran potongan masukan per tugas dalam KiB (bawaan: %(default)g)')
+    parser.add_argument('-q', '--diam', action='store_true', help='jangan tampilkan progres di stderr')
+    args = parser.parse_args(argv)
+
+    def progres(skenario, selesai, total):
+        print(f'\r{selesai}/{total} potongan, {skenario:,} laporan', end='', file=sys.stderr, flush=True)
+
+    try:
+        hasil = buat_laporan(args.masukan, args.keluaran, args.format, [a for a in args.analisis.split(',') if a],
+                             kolom_id=args.id, ukuran_chunk_byte=max(int(args.chunk_kb * 1024), 1),
+                             n_proses=args.proses, progres=None if args.diam else progres)
+    except (OSError, ValueError) as e:
+        parser.exit(1, f"{'' if args.diam else chr(10)}galat: {e}\n")
+    if not args.diam:
+        print(f"\nSelesai: {hasil['skenario']:,} laporan ({hasil['gagal']:,} gagal) dalam {hasil['detik']:.1f} "
+              f"detik; {hasil['grafik_dirender']:,} grafik dirender, {hasil['grafik_dipakai_ulang']:,} dipakai ulang.",
+              file=sys.stderr)
+    return 1 if hasil['gagal'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""Mesin perhitungan model matematika industri tanpa ketergantungan Streamlit/matplotlib.
+
+Setiap fungsi menerima skalar maupun array NumPy sehingga ribuan hingga jutaan
+skenario dapat dievaluasi dalam satu panggilan.
+"""
+
+from .antrian import (distribusi_mmck, erlang_b, erlang_c, hitung_mm1, hitung_mmc, hitung_mmck, probabilitas_n_mm1,
+                      probabilitas_n_mmc, staf_minimal)
+from .antrian_transien import antrian_transien, profil_per_jam
+from .batch import MODEL_BATCH, jalankan_batch
+from .cache import CacheHasil, cache_dari_env, kunci_hasil, normalisasi_parameter
+from .diagram_blok import DiagramBlok, hitung_diagram
+from .instrumentasi import Pengukur, jalankan_server_metrik, pengukur_dari_env, rss_byte
+from .keandalan import keandalan_seri, mata_rantai_terlemah
+from .layanan import LayananModel, jalankan_layanan
+from .log_data import (StatistikOnline, baca_kolom, baca_potongan, bagi_berkas, hitung_berkas, kolom_berkas,
+                       sidik_jari_berkas, statistik_kedatangan, statistik_lead_time, statistik_permintaan)
+from .parametrik import kurva_parametrik, rentang_optimal
+from .persediaan import HARI_PER_TAHUN, hitung_persediaan, kurva_biaya, level_stok
+from .persediaan_katalog import hitung_persediaan_katalog
+from .produksi import hitung_produksi, titik_sudut_produksi
+from .redundansi import alokasi_redundansi, opsi_paralel
+from .sensitivitas import sapuan_parameter
+from .simpleks import selesaikan_lp
+from .simulasi_antrian import HistogramLog, pembangkit, simulasi_antrian
+from .simulasi_ketersediaan import mttf_dari_keandalan, simulasi_ketersediaan, skala_weibull
+from .simulasi_persediaan import simulasi_persediaan
+
+__all__ = [
+    'CacheHasil',
+    'DiagramBlok',
+    'HARI_PER_TAHUN',
+    'HistogramLog',
+    'LayananModel',
+    'MODEL_BATCH',
+    'Pengukur',
+    'StatistikOnline',
+    'alokasi_redundansi',
+    'antrian_transien',
+    'baca_kolom',
+    'baca_potongan',
+    'bagi_berkas',
+    'cache_dari_env',
+    'distribusi_mmck',
+    'erlang_b',
+    'erlang_c',
+    'hitung_berkas',
+    'hitung_diagram',
+    'hitung_mm1',
+    'hitung_mmc',
+    'hitung_mmck',
+    'hitung_persediaan',
+    'hitung_persediaan_katalog',
+    'hitung_produksi',
+    'jalankan_batch',
+    'jalankan_layanan',
+    'jalankan_server_metrik',
+    'keandalan_seri',
+    'kolom_berkas',
+    'kunci_hasil',
+    'kurva_biaya',
+    'kurva_parametrik',
+    'level_stok',
+    'mttf_dari_keandalan',
+    'mata_rantai_terlemah',
+    'normalisasi_parameter',
+    'pembangkit',
+    'opsi_paralel',
+    'pengukur_dari_env',
+    'probabilitas_n_mm1',
+    'probabilitas_n_mmc',
+    'profil_per_jam',
+    'rentang_optimal',
+    'rss_byte',
+    'sapuan_parameter',
+    'selesaikan_lp',
+    'sidik_jari_berkas',
+    'simulasi_antrian',
+    'simulasi_ketersediaan',
+    'simulasi_persediaan',
+    'skala_weibull',
+    'staf_minimal',
+    'statistik_kedatangan',
+    'statistik_lead_time',
+    'statistik_permintaan',
+    'titik_sudut_produksi',
+]
@@ -0,0 +1,10 @@
+import sys
+
+from .batch import main
+from .layanan import main as main_layanan
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['layanan']:
+        main_layanan(sys.argv[2:])
+    else:
+        main()
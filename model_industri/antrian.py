@@ -0,0 +1,161 @@
+import numpy as np
+
+
+def hitung_mm1(lmbda, mu):
+    """Metrik antrian M/M/1 (rho, L, Lq, W, Wq) untuk banyak pasangan (λ, μ) sekaligus.
+
+    Waktu dinyatakan dalam satuan yang sama dengan laju (jam jika laju per jam).
+    Pasangan yang tidak stabil (μ <= λ) ditandai `stabil=False` dan metriknya NaN.
+    """
+    lmbda, mu = np.broadcast_arrays(np.asarray(lmbda, dtype=float), np.asarray(mu, dtype=float))
+    stabil = (mu > lmbda) & (lmbda > 0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rho = np.where(mu > 0, lmbda / mu, np.nan)
+        L = np.where(stabil, rho / (1 - rho), np.nan)
+        Lq = np.where(stabil, rho ** 2 / (1 - rho), np.nan)
+        W = np.where(stabil, L / lmbda, np.nan)
+        Wq = np.where(stabil, Lq / lmbda, np.nan)
+
+    return {'rho': rho, 'L': L, 'Lq': Lq, 'W': W, 'Wq': Wq, 'stabil': stabil}
+
+
+def probabilitas_n_mm1(rho, n):
+    """P(n) = (1 - ρ) ρ^n; hasil berbentuk broadcast antara rho dan n."""
+    rho = np.asarray(rho, dtype=float)
+    n = np.asarray(n)
+    return (1 - rho) * rho ** n
+
+
+def erlang_b(c, a):
+    """Peluang blocking Erlang B untuk c server dan beban a = λ/μ (Erlang).
+
+    Dihitung dengan rekurensi B(k) = a B(k-1) / (k + a B(k-1)) yang stabil secara numerik
+    sampai ribuan server, tanpa faktorial maupun pangkat besar.
+    """
+    c, a = np.broadcast_arrays(np.asarray(c, dtype=int), np.asarray(a, dtype=float))
+    B = np.ones(a.shape)
+    hasil = np.ones(a.shape)
+    for k in range(1, int(c.max(initial=0)) + 1):
+        B = a * B / (k + a * B)
+        hasil = np.where(c == k, B, hasil)
+    return hasil
+
+
+def erlang_c(c, a):
+    """Peluang pelanggan harus menunggu (Erlang C) pada M/M/c; NaN jika a >= c (tidak stabil)."""
+    c, a = np.broadcast_arrays(np.asarray(c, dtype=int), np.asarray(a, dtype=float))
+    B = erlang_b(c, a)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rho = a / c
+        return np.where(rho < 1, B / (1 - rho * (1 - B)), np.nan)
+
+
+def hitung_mmc(lmbda, mu, c):
+    """Metrik antrian M/M/c (rho, L, Lq, W, Wq, p_tunggu) untuk banyak skenario sekaligus.
+
+    Dengan c = 1 hasilnya sama dengan `hitung_mm1`. Skenario dengan λ >= cμ ditandai `stabil=False`.
+    """
+    lmbda, mu, c = np.broadcast_arrays(np.asarray(lmbda, dtype=float), np.asarray(mu, dtype=float),
+                                       np.asarray(c, dtype=int))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        a = np.where(mu > 0, lmbda / mu, np.nan)
+        rho = a / c
+        stabil = (rho < 1) & (lmbda > 0) & (c > 0)
+        p_tunggu = np.where(stabil, erlang_c(c, np.where(stabil, a, 0.0)), np.nan)
+        Lq = np.where(stabil, p_tunggu * rho / (1 - rho), np.nan)
+        Wq = np.where(stabil, Lq / lmbda, np.nan)
+        W = np.where(stabil, Wq + 1 / mu, np.nan)
+        L = np.where(stabil, lmbda * W, np.nan)
+
+    return {'rho': rho, 'L': L, 'Lq': Lq, 'W': W, 'Wq': Wq, 'p_tunggu': p_tunggu, 'stabil': stabil}
+
+
+def _log_suku(a, c, n_maks):
+    """log(a^n / n!) untuk n <= c dan log(a^c / c! · (a/c)^(n-c)) untuk n > c, n = 0..n_maks.
+
+    Hasil berbentuk (..., n_maks + 1); dijumlahkan di ruang log agar tidak overflow.
+    """
+    n = np.arange(1, n_maks + 1)
+    with np.errstate(divide='ignore'):
+        langkah = np.log(a)[..., None] - np.log(np.minimum(n, np.asarray(c)[..., None]))
+    return np.concatenate([np.zeros(a.shape + (1,)), np.cumsum(langkah, axis=-1)], axis=-1)
+
+
+def distribusi_mmck(lmbda, mu, c, K):
+    """Distribusi stasioner P(n), n = 0..max(K), untuk M/M/c/K; nol di luar kapasitas masing-masing skenario."""
+    lmbda, mu, c, K = np.broadcast_arrays(np.asarray(lmbda, dtype=float), np.asarray(mu, dtype=float),
+                                          np.asarray(c, dtype=int), np.asarray(K, dtype=int))
+    log_t = _log_suku(lmbda / mu, c, int(K.max(initial=0)))
+    n = np.arange(log_t.shape[-1])
+    log_t = np.where(n <= K[..., None], log_t, -np.inf)
+    p = np.exp(log_t - log_t.max(axis=-1, keepdims=True))
+    return p / p.sum(axis=-1, keepdims=True)
+
+
+def hitung_mmck(lmbda, mu, c, K):
+    """Metrik antrian M/M/c/K: kapasitas sistem K (termasuk yang sedang dilayani), selalu stabil.
+
+    Selain L, Lq, W, Wq (waktu untuk pelanggan yang masuk) juga mengembalikan `p_blok`
+    (peluang pelanggan ditolak karena sistem penuh), `p_tunggu` (peluang pelanggan yang masuk
+    harus menunggu), dan `lmbda_efektif`.
+    """
+    lmbda, mu, c, K = np.broadcast_arrays(np.asarray(lmbda, dtype=float), np.asarray(mu, dtype=float),
+                                          np.asarray(c, dtype=int), np.asarray(K, dtype=int))
+    K = np.maximum(K, c)
+    p = distribusi_mmck(lmbda, mu, c, K)
+    n = np.arange(p.shape[-1])
+
+    p_blok = np.take_along_axis(p, K[..., None], axis=-1)[..., 0]
+    L = (p * n).sum(axis=-1)
+    Lq = (p * np.maximum(n - c[..., None], 0)).sum(axis=-1)
+    lmbda_efektif = lmbda * (1 - p_blok)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        W = L / lmbda_efektif
+        Wq = Lq / lmbda_efektif
+        p_tunggu = (np.where(n >= c[..., None], p, 0.0).sum(axis=-1) - p_blok) / (1 - p_blok)
+
+    return {
+        'rho': lmbda_efektif / (c * mu), 'L': L, 'Lq': Lq, 'W': W, 'Wq': Wq,
+        'p_tunggu': p_tunggu, 'p_blok': p_blok, 'lmbda_efektif': lmbda_efektif,
+        'stabil': np.ones(lmbda.shape, dtype=bool),
+    }
+
+
+def probabilitas_n_mmc(lmbda, mu, c, n):
+    """P(n) untuk M/M/c tanpa batas kapasitas, dihitung dari P(n = c) = C(c, a)(1 - ρ) di ruang log."""
+    lmbda, mu, c = np.broadcast_arrays(np.asarray(lmbda, dtype=float), np.asarray(mu, dtype=float),
+                                       np.asarray(c, dtype=int))
+    n = np.asarray(n, dtype=int)
+    a = lmbda / mu
+    log_t = _log_suku(a, c, int(max(n.max(initial=0), c.max(initial=0))))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_pc = np.log(erlang_c(c, a) * (1 - a / c))
+        log_tc = np.take_along_axis(log_t, c[..., None], axis=-1)
+        return np.exp(log_pc[..., None] + np.take(log_t, n, axis=-1) - log_tc)
+
+
+def staf_minimal(lmbda, mu, target_wq, c_maks=10_000):
+    """Jumlah server minimal agar Wq M/M/c <= `target_wq`, untuk seluruh array laju kedatangan sekaligus.
+
+    Satu rekurensi Erlang B dijalankan untuk k = 1, 2, ... dan berhenti setelah semua skenario
+    terpenuhi. Skenario yang tidak terpenuhi sampai `c_maks` server bernilai 0.
+    Mengembalikan dict berisi `c` dan `Wq` pada jumlah server tersebut.
+    """
+    lmbda, mu, target_wq = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (lmbda, mu, target_wq)))
+    a = lmbda / mu
+    B = np.ones(a.shape)
+    c = np.zeros(a.shape, dtype=int)
+    Wq = np.full(a.shape, np.nan)
+    for k in range(1, c_maks + 1):
+        B = a * B / (k + a * B)
+        belum = c == 0
+        if not belum.any():
+            break
+        with np.errstate(divide='ignore', invalid='ignore'):
+            stabil = k > a
+            Wq_k = np.where(stabil, B / (1 - (a / k) * (1 - B)) / (k * mu - lmbda), np.inf)
+        cukup = belum & stabil & (Wq_k <= target_wq)
+        c[cukup] = k
+        Wq[cukup] = Wq_k[cukup]
+    return {'c': c, 'Wq': Wq}
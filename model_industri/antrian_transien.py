@@ -0,0 +1,96 @@
+import math
+
+import numpy as np
+
+# Batas Λ·dt per sub-langkah agar bobot Poisson exp(-Λ·dt) tidak underflow
+_MAKS_LAJU_LANGKAH = 50.0
+_TOL_POISSON = 1e-12
+
+
+def _kali_uniformisasi(p, lahir, mati, laju):
+    """p · P untuk rantai lahir-mati dengan P = I + Q/Λ; tridiagonal sehingga O(N) per baris."""
+    hasil = p * (1 - (lahir + mati) / laju[:, None])
+    hasil[:, 1:] += p[:, :-1] * lahir[:, :-1] / laju[:, None]
+    hasil[:, :-1] += p[:, 1:] * mati[:, 1:] / laju[:, None]
+    return hasil
+
+
+def _langkah(p, lmbda, mu, c, dt):
+    """Propagasikan distribusi p (G, N+1) selama dt dengan uniformisasi; λ dan c per baris."""
+    n = np.arange(p.shape[1])
+    lahir = np.where(n < n[-1], lmbda[:, None], 0.0)
+    mati = mu * np.minimum(n, c[:, None]).astype(float)
+    laju = np.maximum((lahir + mati).max(axis=1), 1e-12)
+
+    n_sub = max(1, math.ceil(laju.max() * dt / _MAKS_LAJU_LANGKAH))
+    x = laju * dt / n_sub
+    for _ in range(n_sub):
+        bobot = np.exp(-x)
+        suku = p
+        hasil = bobot[:, None] * suku
+        sisa = 1 - bobot
+        k = 0
+        while sisa.max() > _TOL_POISSON:
+            k += 1
+            suku = _kali_uniformisasi(suku, lahir, mati, laju)
+            bobot = bobot * x / k
+            hasil += bobot[:, None] * suku
+            sisa -= bobot
+        p = hasil
+    return p
+
+
+def antrian_transien(lmbda, mu, c, dt, kapasitas=200, p_awal=None):
+    """Analisis transien antrian M(t)/M/c(t)/K dengan profil λ(t) dan jumlah server c(t) berundak.
+
+    `lmbda` dan `c` berbentuk (T,) atau (B, T): nilai pada setiap langkah waktu sepanjang `dt`
+    (satuan waktu laju, mis. jam). B profil (misalnya jadwal staf berbeda) dihitung sekaligus.
+    Ruang keadaan dipotong di `kapasitas` pelanggan; `massa_batas` yang tidak kecil berarti
+    batas ini perlu dinaikkan (kecuali memang kapasitas nyata sistem).
+
+    Profil yang identik sampai suatu langkah berbagi keadaan yang sama, jadi hanya kombinasi
+    (riwayat, λ, c) yang unik yang dipropagasikan. Membandingkan puluhan jadwal yang hanya
+    berbeda di beberapa jam menjadi hampir semurah menghitung satu jadwal.
+
+    Mengembalikan `t` (akhir setiap langkah), `L`, `Lq`, `p_tunggu` (P(N >= c)), `Wq` (waktu tunggu
+    harapan pelanggan yang datang pada saat itu, FIFO), `p_akhir`, dan `massa_batas`, masing-masing
+    berbentuk (B, T) atau (T,).
+    """
+    satu_profil = np.ndim(lmbda) <= 1 and np.ndim(c) <= 1
+    lmbda = np.atleast_2d(np.asarray(lmbda, dtype=float))
+    c = np.atleast_2d(np.asarray(c, dtype=int))
+    lmbda, c = np.broadcast_arrays(lmbda, c)
+    B, T = lmbda.shape
+    n = np.arange(kapasitas + 1)
+
+    if p_awal is None:
+        p_awal = np.zeros(kapasitas + 1)
+        p_awal[0] = 1.0
+    keadaan = np.atleast_2d(np.asarray(p_awal, dtype=float))
+    kelompok = np.zeros(B, dtype=int) if keadaan.shape[0] == 1 else np.arange(B)
+
+    L, Lq, Wq, p_tunggu, massa_batas = (np.empty((B, T)) for _ in range(5))
+    for t in range(T):
+        kunci = np.column_stack([kelompok, lmbda[:, t], c[:, t]])
+        unik, kelompok = np.unique(kunci, axis=0, return_inverse=True)
+        kelompok = kelompok.ravel()
+        keadaan = _langkah(keadaan[unik[:, 0].astype(int)], unik[:, 1], mu, unik[:, 2].astype(int), dt)
+
+        c_unik = unik[:, 2][:, None]
+        L[:, t] = (keadaan @ n)[kelompok]
+        Lq[:, t] = (keadaan * np.maximum(n - c_unik, 0)).sum(axis=1)[kelompok]
+        p_tunggu[:, t] = np.where(n >= c_unik, keadaan, 0.0).sum(axis=1)[kelompok]
+        # Pelanggan yang datang saat ada n >= c di sistem menunggu n - c + 1 penyelesaian layanan (laju cμ)
+        Wq[:, t] = (keadaan * np.maximum(n - c_unik + 1, 0) / (c_unik * mu)).sum(axis=1)[kelompok]
+        massa_batas[:, t] = keadaan[:, -1][kelompok]
+
+    hasil = {'t': dt * np.arange(1, T + 1), 'L': L, 'Lq': Lq, 'p_tunggu': p_tunggu, 'Wq': Wq,
+             'p_akhir': keadaan[kelompok], 'massa_batas': massa_batas}
+    if satu_profil:
+        hasil.update({k: v[0] for k, v in hasil.items() if k != 't'})
+    return hasil
+
+
+def profil_per_jam(nilai_per_jam, langkah_per_jam=12):
+    """Ubah nilai per jam (λ atau c) berbentuk (..., jam) menjadi nilai per langkah untuk `antrian_transien`."""
+    return np.repeat(np.asarray(nilai_per_jam), langkah_per_jam, axis=-1)
@@ -0,0 +1,269 @@
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .antrian import hitung_mmc, hitung_mmck
+from .diagram_blok import DiagramBlok
+from .log_data import bagi_berkas, baca_potongan, kolom_berkas
+from .persediaan import hitung_persediaan
+from .produksi import hitung_produksi
+
+# Potongan masukan per tugas pekerja; cukup kecil agar array antara (mis. titik sudut produksi) muat di memori
+UKURAN_CHUNK_BYTE = 8 * 2**20
+UKURAN_CHUNK_BARIS = 250_000
+# Batas elemen distribusi P(n) M/M/c/K yang dibentuk sekaligus (baris × (K + 1))
+_MAKS_ELEMEN_MMCK = 5_000_000
+
+
+def _batch_produksi(kolom, opsi):
+    hasil = hitung_produksi(**kolom)
+    return {k: hasil[k] for k in ('x', 'y', 'profit')}
+
+
+def _batch_persediaan(kolom, opsi):
+    return hitung_persediaan(**kolom)
+
+
+def _batch_antrian(kolom, opsi):
+    """M/M/c untuk baris dengan K <= 0 (kapasitas tak terbatas), M/M/c/K untuk sisanya."""
+    lmbda, mu = kolom['lmbda'], kolom['mu']
+    c, K = kolom['c'].astype(int), kolom['K'].astype(int)
+    hasil = hitung_mmc(lmbda, mu, c)
+    hasil['p_blok'] = np.where(hasil['stabil'], 0.0, np.nan)
+    hasil['lmbda_efektif'] = np.where(hasil['stabil'], lmbda, np.nan)
+
+    # Urutkan menurut K agar setiap potongan hanya membentuk distribusi sepanjang K-nya sendiri
+    terbatas = np.flatnonzero(K > 0)
+    terbatas = terbatas[np.argsort(K[terbatas], kind='stable')]
+    K_urut = np.maximum(K[terbatas], c[terbatas])
+    awal = 0
+    while awal < terbatas.size:
+        akhir = min(terbatas.size, awal + max(1, _MAKS_ELEMEN_MMCK // (K_urut[awal] + 1)))
+        akhir = min(akhir, awal + max(1, _MAKS_ELEMEN_MMCK // (K_urut[akhir - 1] + 1)))
+        i = terbatas[awal:akhir]
+        for k, v in hitung_mmck(lmbda[i], mu[i], c[i], K[i]).items():
+            hasil[k][i] = v
+        awal = akhir
+    return hasil
+
+
+def _batch_keandalan(kolom, opsi):
+    diagram = opsi['diagram']
+    hasil = diagram.kepentingan(np.stack([kolom[nama] for nama in diagram.komponen], axis=-1))
+    kritis = np.array(diagram.komponen)[np.argmax(hasil['kritikalitas'], axis=-1)]
+    keluaran = {
+        'keandalan': hasil['keandalan'],
+        'komponen_kritis': np.where(hasil['keandalan'] < 1, kritis, ''),
+    }
+    for i, nama in enumerate(diagram.komponen):
+        keluaran[f'kritikalitas_{nama}'] = hasil['kritikalitas'][:, i]
+    return keluaran
+
+
+# Kolom masukan setiap model: wajib, dan opsional beserta nilai bawaannya jika kolomnya tidak ada
+MODEL_BATCH = {
+    'produksi': {
+        'fungsi': _batch_produksi,
+        'wajib': ['profit_meja', 'profit_kursi', 'jam_meja', 'jam_kursi', 'kayu_meja', 'kayu_kursi',
+                  'total_jam', 'total_kayu'],
+        'opsional': {},
+    },
+    'persediaan': {
+        'fungsi': _batch_persediaan,
+        'wajib': ['D', 'S', 'H'],
+        'opsional': {'lead_time': 0, 'safety_stock': 0},
+    },
+    'antrian': {
+        'fungsi': _batch_antrian,
+        'wajib': ['lmbda', 'mu'],
+        'opsional': {'c': 1, 'K': 0},
+    },
+    # Kolom wajib keandalan adalah komponen diagram blok (bawaan: semua kolom, disusun seri)
+    'keandalan': {
+        'fungsi': _batch_keandalan,
+        'wajib': [],
+        'opsional': {},
+    },
+}
+
+
+def _format_kolom(nilai, jsonl):
+    """`(spesifikasi %, nilai)` satu kolom untuk templat baris; NaN dan ±inf menjadi `null` di JSON lines."""
+    if nilai.dtype.kind == 'b':
+        return ('%s', ['true' if v else 'false' for v in nilai.tolist()]) if jsonl else ('%d', nilai.tolist())
+    if nilai.dtype.kind in 'iu':
+        return '%d', nilai.tolist()
+    if nilai.dtype.kind == 'f':
+        if jsonl and not np.all(np.isfinite(nilai)):
+            return '%s', [format(v, '.12g') if np.isfinite(v) else 'null' for v in nilai.tolist()]
+        return '%.12g', nilai.tolist()
+    teks = nilai.astype(str).tolist()
+    if jsonl:
+        return '%s', list(map(json.dumps, teks))
+    if any(ch in ''.join(teks) for ch in ',"\n'):
+        teks = [f'"{v.replace(chr(34), chr(34) * 2)}"' if any(ch in v for ch in ',"\n') else v for v in teks]
+    return '%s', teks
+
+
+def _proses_potongan(model, path, awal, akhir, kolom, bawaan, bawa, jsonl, opsi):
+    """Baca, hitung, dan format satu potongan berkas; dijalankan di proses pekerja."""
+    data = baca_potongan(path, kolom, awal, akhir)
+    # Kolom yang disalin dibaca terpisah agar kolom teks tidak memaksa kolom model diurai sebagai string
+    salinan = baca_potongan(path, bawa, awal, akhir) if bawa else {}
+    n = len(data[kolom[0]]) if kolom else len(salinan[bawa[0]])
+    masukan = {k: data[k].astype(float) for k in kolom}
+    masukan.update({k: np.full(n, v, dtype=float) for k, v in bawaan.items()})
+
+    keluaran = {}
+    for k in bawa:
+        v = salinan[k]
+        # Id numerik bulat ditulis apa adanya, bukan "17.0"
+        if v.dtype.kind == 'f' and np.all(np.isfinite(v)) and np.all(v == np.round(v)):
+            v = v.astype(np.int64)
+        keluaran[k] = v
+    keluaran.update((k, np.asarray(v)) for k, v in MODEL_BATCH[model]['fungsi'](masukan, opsi).items())
+
+    # Satu templat % per baris: pemformatan seluruh baris terjadi di C, bukan per nilai di Python
+    spesifikasi, nilai = zip(*(_format_kolom(v, jsonl) for v in keluaran.values()))
+    if jsonl:
+        templat = '{' + ', '.join(json.dumps(k).replace('%', '%%') + ': ' + f
+                                  for k, f in zip(keluaran, spesifikasi)) + '}'
+    else:
+        templat = ','.join(spesifikasi)
+    teks = '\n'.join(templat % b for b in zip(*nilai))
+    return list(keluaran), n, teks + '\n' if n else ''
+
+
+def jalankan_batch(model, masukan, keluaran, format_keluaran=None, bawa=(), diagram=None,
+                   ukuran_chunk_byte=UKURAN_CHUNK_BYTE, ukuran_chunk_baris=UKURAN_CHUNK_BARIS, n_proses=None,
+                   progres=None):
+    """Evaluasi `model` ('produksi', 'persediaan', 'antrian', 'keandalan') untuk setiap baris skenario.
+
+    `masukan` berupa CSV berheader, JSON lines (.jsonl/.ndjson), atau .npy terstruktur; kolomnya adalah
+    argumen model (lihat `MODEL_BATCH`). Berkas dibagi per ~`ukuran_chunk_byte` (atau
+    `ukuran_chunk_baris` untuk .npy) dan setiap potongan dibaca, dihitung, dan diformat di salah satu
+    dari `n_proses` proses (bawaan: semua CPU). Hasil ditulis berurutan ke `keluaran` (path atau objek
+    berkas teks) sebagai CSV atau JSON lines, dengan paling banyak 2×`n_proses` potongan di memori.
+
+    Kolom `bawa` (mis. id skenario) disalin ke keluaran. `diagram` adalah definisi `DiagramBlok` untuk
+    model keandalan; tanpanya semua kolom lain dianggap mesin yang tersusun seri. `progres`, jika ada,
+    dipanggil dengan `(baris, potongan_selesai, total_potongan)` setiap potongan selesai ditulis.
+    Mengembalikan jumlah `baris`, `potongan`, dan `detik`.
+    """
+    if model not in MODEL_BATCH:
+        raise ValueError(f"Model tidak dikenal: {model!r}. Pilih {', '.join(sorted(MODEL_BATCH))}.")
+    spek = MODEL_BATCH[model]
+    bawa = list(bawa)
+    tersedia = kolom_berkas(masukan)
+    opsi = {}
+    wajib = list(spek['wajib'])
+    if model == 'keandalan':
+        opsi['diagram'] = DiagramBlok(diagram if diagram is not None else
+                                      ('seri', [k for k in tersedia if k not in bawa]))
+        wajib = opsi['diagram'].komponen
+    hilang = [k for k in wajib + bawa if k not in tersedia]
+    if hilang:
+        raise ValueError(f"Kolom tidak ada di {os.path.basename(masukan)}: {', '.join(hilang)}")
+    kolom = wajib + [k for k in spek['opsional'] if k in tersedia]
+    bawaan = {k: v for k, v in spek['opsional'].items() if k not in tersedia}
+
+    if format_keluaran is None:
+        format_keluaran = 'jsonl' if isinstance(keluaran, str) and keluaran.endswith(('.jsonl', '.ndjson')) else 'csv'
+    jsonl = format_keluaran == 'jsonl'
+
+    mulai = time.perf_counter()
+    potongan = bagi_berkas(masukan, ukuran_chunk_byte, ukuran_chunk_baris)
+    argumen = [(model, masukan, awal, akhir, kolom, bawaan, bawa, jsonl, opsi) for awal, akhir in potongan]
+    berkas = open(keluaran, 'w', encoding='utf-8', newline='') if isinstance(keluaran, str) else keluaran
+    status = {'baris': 0, 'potongan': 0}
+
+    def tulis(hasil):
+        nama, n, teks = hasil
+        if status['potongan'] == 0 and not jsonl:
+            berkas.write(','.join(nama) + '\n')
+        berkas.write(teks)
+        status['baris'] += n
+        status['potongan'] += 1
+        if progres:
+            progres(status['baris'], status['potongan'], len(argumen))
+
+    n_proses = max(min(n_proses or os.cpu_count() or 1, len(argumen)), 1)
+    try:
+        if n_proses <= 1:
+            for a in argumen:
+                tulis(_proses_potongan(*a))
+        else:
+            # Hasil ditulis sesuai urutan masukan; potongan yang sedang dikerjakan dibatasi
+            with ProcessPoolExecutor(n_proses) as pool:
+                antre = deque()
+                for a in argumen:
+                    if len(antre) >= 2 * n_proses:
+                        tulis(antre.popleft().result())
+                    antre.append(pool.submit(_proses_potongan, *a))
+                while antre:
+                    tulis(antre.popleft().result())
+    finally:
+        if berkas is not keluaran:
+            berkas.close()
+        else:
+            berkas.flush()
+    return {'baris': status['baris'], 'potongan': status['potongan'], 'detik': time.perf_counter() - mulai}
+
+
+def _baca_diagram(teks):
+    if teks is None:
+        return None
+    if os.path.exists(teks):
+        with open(teks, encoding='utf-8') as f:
+            return json.load(f)
+    return json.loads(teks)
+
+
+def main(argv=None):
+    daftar_kolom = '\n'.join(
+        f"  {nama:<11} {', '.join(spek['wajib']) or 'satu kolom keandalan (0-1) per mesin'}"
+        + ''.join(f', [{k}={v}]' for k, v in spek['opsional'].items())
+        for nama, spek in MODEL_BATCH.items())
+    parser = argparse.ArgumentParser(
+        prog='python -m model_industri',
+        description='Jalankan model produksi, persediaan, antrian, atau keandalan untuk berkas skenario '
+                    '(satu baris per skenario) tanpa membuka dashboard.',
+        epilog=f'Kolom masukan ([kolom=nilai] opsional):\n{daftar_kolom}\n'
+               '  (antrian: K <= 0 berarti kapasitas tak terbatas, M/M/c)\n\n'
+               'Contoh:\n  python -m model_industri antrian skenario.csv -o hasil.jsonl --bawa id -j 8\n'
+               '  python -m model_industri keandalan lini.csv --diagram \'["seri", ["A", ["paralel", ["B1", "B2"]]]]\'',
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('model', choices=list(MODEL_BATCH))
+    parser.add_argument('masukan', help='CSV berheader, JSON lines (.jsonl/.ndjson), atau .npy terstruktur')
+    parser.add_argument('-o', '--keluaran', default='-',
+                        help="berkas keluaran; .jsonl/.ndjson menjadi JSON lines, selain itu CSV. '-' = stdout")
+    parser.add_argument('-f', '--format', choices=['csv', 'jsonl'], help='paksa format keluaran')
+    parser.add_argument('--bawa', default='', help='kolom masukan (dipisah koma) yang disalin ke keluaran, mis. id')
+    parser.add_argument('--diagram', help='diagram blok keandalan sebagai JSON atau path berkas JSON '
+                                          '(bawaan: semua kolom tersusun seri)')
+    parser.add_argument('-j', '--proses', type=int, help='jumlah proses pekerja (bawaan: semua CPU)')
+    parser.add_argument('--chunk-mb', type=float, default=UKURAN_CHUNK_BYTE / 2**20,
+                        help='ukuran potongan masukan per tugas dalam MiB (bawaan: %(default)g)')
+    parser.add_argument('-q', '--diam', action='store_true', help='jangan tampilkan progres di stderr')
+    args = parser.parse_args(argv)
+
+    def progres(baris, selesai, total):
+        print(f'\r{selesai}/{total} potongan, {baris:,} skenario', end='', file=sys.stderr, flush=True)
+
+    try:
+        hasil = jalankan_batch(
+            args.model, args.masukan, sys.stdout if args.keluaran == '-' else args.keluaran,
+            format_keluaran=args.format, bawa=[k for k in args.bawa.split(',') if k],
+            diagram=_baca_diagram(args.diagram), ukuran_chunk_byte=max(int(args.chunk_mb * 2**20), 1),
+            n_proses=args.proses, progres=None if args.diam else progres)
+    except (OSError, ValueError) as e:
+        parser.exit(1, f"{'' if args.diam else chr(10)}galat: {e}\n")
+    if not args.diam:
+        print(f"\nSelesai: {hasil['baris']:,} skenario dalam {hasil['detik']:.1f} detik "
+              f"({hasil['baris'] / max(hasil['detik'], 1e-9):,.0f}/detik).", file=sys.stderr)
@@ -0,0 +1,133 @@
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+# Lokasi bawaan cache hasil; dapat diganti lewat MODEL_CACHE_PATH
+PATH_BAWAAN = os.path.join(os.path.expanduser('~'), '.cache', 'model_industri', 'hasil.sqlite')
+
+
+def _sidik_jari_paket():
+    """Hash seluruh kode sumber paket, agar hasil lama tidak terpakai setelah rumus diubah."""
+    sha = hashlib.sha1()
+    folder = os.path.dirname(os.path.abspath(__file__))
+    for nama in sorted(os.listdir(folder)):
+        if nama.endswith('.py'):
+            with open(os.path.join(folder, nama), 'rb') as f:
+                sha.update(nama.encode() + f.read())
+    return sha.hexdigest()
+
+
+SIDIK_JARI = _sidik_jari_paket()
+
+
+def normalisasi_parameter(nilai):
+    """Ubah parameter menjadi bentuk hashable yang stabil (1200 dan 1200.0 dianggap sama)."""
+    if isinstance(nilai, dict):
+        return tuple(sorted((k, normalisasi_parameter(v)) for k, v in nilai.items()))
+    if isinstance(nilai, (list, tuple, np.ndarray)):
+        return tuple(normalisasi_parameter(v) for v in nilai)
+    if isinstance(nilai, (bool, np.bool_, str)) or nilai is None:
+        return nilai
+    if isinstance(nilai, (int, float, np.integer, np.floating)):
+        return float(nilai)
+    return nilai
+
+
+def kunci_hasil(fungsi, args=(), kwargs=None):
+    """Kunci cache berupa hash dari versi kode paket, nama fungsi, dan parameternya yang sudah dinormalisasi."""
+    nama = f'{fungsi.__module__}.{fungsi.__qualname__}'
+    isi = repr((SIDIK_JARI, nama, normalisasi_parameter(args), normalisasi_parameter(kwargs or {})))
+    return hashlib.sha1(isi.encode()).hexdigest()
+
+
+class CacheHasil:
+    """Cache hasil model berbasis SQLite yang dipakai bersama antar sesi, proses, dan restart.
+
+    Entri kedaluwarsa setelah `ttl` detik. Jika jumlahnya melebihi `maks_entri`,
+    entri yang paling lama tidak dipakai dibuang. Jika `pengukur` (lihat `instrumentasi.Pengukur`)
+    diberikan, setiap `hitung` dicatat sebagai tahap 'hitung' beserta cache hit/miss-nya.
+    """
+
+    def __init__(self, path=PATH_BAWAAN, ttl=7 * 24 * 3600, maks_entri=10_000, pengukur=None):
+        self.path = path
+        self.ttl = ttl
+        self.maks_entri = maks_entri
+        self.pengukur = pengukur
+        self._lokal = threading.local()
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._koneksi() as kon:
+            kon.execute('CREATE TABLE IF NOT EXISTS hasil '
+                        '(kunci TEXT PRIMARY KEY, nilai BLOB, dibuat REAL, dipakai REAL)')
+            kon.execute('CREATE INDEX IF NOT EXISTS hasil_dipakai ON hasil (dipakai)')
+
+    def _koneksi(self):
+        # Koneksi SQLite tidak boleh dipakai lintas thread, jadi setiap thread punya miliknya sendiri
+        kon = getattr(self._lokal, 'kon', None)
+        if kon is None:
+            kon = sqlite3.connect(self.path, timeout=30)
+            kon.execute('PRAGMA journal_mode=WAL')
+            kon.execute('PRAGMA synchronous=NORMAL')
+            self._lokal.kon = kon
+        return kon
+
+    def ambil(self, kunci):
+        """Kembalikan `(ada, nilai)`; entri kedaluwarsa dianggap tidak ada."""
+        sekarang = time.time()
+        kon = self._koneksi()
+        baris = kon.execute('SELECT nilai, dibuat FROM hasil WHERE kunci = ?', (kunci,)).fetchone()
+        if baris is None or sekarang - baris[1] > self.ttl:
+            return False, None
+        with kon:
+            kon.execute('UPDATE hasil SET dipakai = ? WHERE kunci = ?', (sekarang, kunci))
+        return True, pickle.loads(baris[0])
+
+    def simpan(self, kunci, nilai):
+        sekarang = time.time()
+        with self._koneksi() as kon:
+            kon.execute('INSERT OR REPLACE INTO hasil VALUES (?, ?, ?, ?)',
+                        (kunci, pickle.dumps(nilai, protocol=pickle.HIGHEST_PROTOCOL), sekarang, sekarang))
+            kon.execute('DELETE FROM hasil WHERE dibuat < ?', (sekarang - self.ttl,))
+            kon.execute('DELETE FROM hasil WHERE kunci IN (SELECT kunci FROM hasil ORDER BY dipakai DESC '
+                        'LIMIT -1 OFFSET ?)', (self.maks_entri,))
+
+    def hitung(self, fungsi, *args, **kwargs):
+        """Panggil `fungsi(*args, **kwargs)` atau ambil hasilnya dari cache bila parameternya pernah dihitung."""
+        if self.pengukur is None:
+            return self._hitung(fungsi, args, kwargs)
+        with self.pengukur.ukur('hitung'):
+            return self._hitung(fungsi, args, kwargs)
+
+    def _hitung(self, fungsi, args, kwargs):
+        kunci = kunci_hasil(fungsi, args, kwargs)
+        ada, nilai = self.ambil(kunci)
+        if not ada:
+            nilai = fungsi(*args, **kwargs)
+            self.simpan(kunci, nilai)
+        if self.pengukur is not None:
+            self.pengukur.tambah('cache_hit' if ada else 'cache_miss')
+        return nilai
+
+    def panaskan(self, daftar_panggilan):
+        """Isi cache dari daftar `(fungsi, args, kwargs)`, misalnya skenario bawaan saat startup."""
+        for fungsi, args, kwargs in daftar_panggilan:
+            self.hitung(fungsi, *args, **kwargs)
+
+    def __len__(self):
+        return self._koneksi().execute('SELECT COUNT(*) FROM hasil').fetchone()[0]
+
+    def kosongkan(self):
+        with self._koneksi() as kon:
+            kon.execute('DELETE FROM hasil')
+
+
+def cache_dari_env(pengukur=None):
+    """Buat CacheHasil dari MODEL_CACHE_PATH, MODEL_CACHE_TTL (detik), dan MODEL_CACHE_MAKS."""
+    return CacheHasil(path=os.environ.get('MODEL_CACHE_PATH', PATH_BAWAAN),
+                      ttl=float(os.environ.get('MODEL_CACHE_TTL', 7 * 24 * 3600)),
+                      maks_entri=int(os.environ.get('MODEL_CACHE_MAKS', 10_000)), pengukur=pengukur)
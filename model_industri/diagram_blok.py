@@ -0,0 +1,155 @@
+import numpy as np
+
+# Indeks simpul terminal BDD
+NOL, SATU = 0, 1
+
+
+class DiagramBlok:
+    """Diagram blok keandalan (RBD) yang dikompilasi menjadi BDD tereduksi dan terurut.
+
+    Definisi blok berupa nama komponen (str) atau tuple:
+    `('seri', [blok, ...])`, `('paralel', [blok, ...])`, atau `('k_dari_n', k, [blok, ...])`.
+    Nama yang sama di beberapa tempat adalah komponen bersama (satu kejadian acak), dan tetap
+    dihitung eksak karena BDD memperlakukannya sebagai satu variabel.
+
+    Kompilasi dilakukan sekali; evaluasi keandalan dan ukuran kepentingan untuk banyak
+    skenario sekaligus hanya menelusuri simpul BDD, tidak pernah mengenumerasi 2^n keadaan.
+    """
+
+    def __init__(self, definisi):
+        self.definisi = definisi
+        self.komponen = []
+        self._indeks = {}
+        self._kumpulkan_komponen(definisi)
+        # Simpul 0 dan 1 adalah terminal; variabel terminal = n agar selalu "di bawah" variabel lain
+        n = len(self.komponen)
+        self._var, self._lo, self._hi = [n, n], [NOL, SATU], [NOL, SATU]
+        self._unik = {}
+        self._memo_ite = {}
+        self.akar = self._bangun(definisi)
+
+    def _kumpulkan_komponen(self, blok):
+        if isinstance(blok, str):
+            if blok not in self._indeks:
+                self._indeks[blok] = len(self.komponen)
+                self.komponen.append(blok)
+            return
+        for anak in blok[-1]:
+            self._kumpulkan_komponen(anak)
+
+    def _simpul(self, var, lo, hi):
+        if lo == hi:
+            return lo
+        kunci = (var, lo, hi)
+        u = self._unik.get(kunci)
+        if u is None:
+            u = len(self._var)
+            self._var.append(var)
+            self._lo.append(lo)
+            self._hi.append(hi)
+            self._unik[kunci] = u
+        return u
+
+    def _ite(self, f, g, h):
+        """If-then-else BDD: (f ∧ g) ∨ (¬f ∧ h), dasar semua operasi AND/OR."""
+        if f == SATU:
+            return g
+        if f == NOL:
+            return h
+        if g == h:
+            return g
+        if g == SATU and h == NOL:
+            return f
+        kunci = (f, g, h)
+        u = self._memo_ite.get(kunci)
+        if u is not None:
+            return u
+        v = min(self._var[f], self._var[g], self._var[h])
+        cabang = [(self._lo[x], self._hi[x]) if self._var[x] == v else (x, x) for x in (f, g, h)]
+        lo = self._ite(cabang[0][0], cabang[1][0], cabang[2][0])
+        hi = self._ite(cabang[0][1], cabang[1][1], cabang[2][1])
+        u = self._simpul(v, lo, hi)
+        self._memo_ite[kunci] = u
+        return u
+
+    def _k_dari_n(self, anak, k):
+        # ambang[j]: paling sedikit j dari anak[i:] berfungsi, dibangun mundur dari anak terakhir.
+        # Dari akar hanya j dalam [k - i, n - i] yang terjangkau, jadi seri/paralel cukup O(n) operasi.
+        n = len(anak)
+        if k <= 0:
+            return SATU
+        if k > n:
+            return NOL
+        ambang = {0: SATU}
+        for i in range(n - 1, -1, -1):
+            ambang = {j: SATU if j == 0 else self._ite(anak[i], ambang.get(j - 1, NOL), ambang.get(j, NOL))
+                      for j in range(max(0, k - i), min(k, n - i) + 1)}
+        return ambang[k]
+
+    def _bangun(self, blok):
+        if isinstance(blok, str):
+            return self._simpul(self._indeks[blok], NOL, SATU)
+        jenis = blok[0]
+        anak = [self._bangun(b) for b in blok[-1]]
+        if jenis == 'seri':
+            return self._k_dari_n(anak, len(anak))
+        if jenis == 'paralel':
+            return self._k_dari_n(anak, 1)
+        if jenis == 'k_dari_n':
+            return self._k_dari_n(anak, blok[1])
+        raise ValueError(f"Jenis blok tidak dikenal: {jenis!r}. Pilih 'seri', 'paralel', atau 'k_dari_n'.")
+
+    @property
+    def jumlah_simpul(self):
+        return len(self._var)
+
+    def _matriks_p(self, p):
+        if isinstance(p, dict):
+            p = [p[nama] for nama in self.komponen]
+        return np.asarray(p, dtype=float)
+
+    def _maju(self, p):
+        """P(simpul berfungsi) untuk setiap simpul; anak selalu dibuat sebelum induknya."""
+        P = [None] * self.jumlah_simpul
+        P[NOL], P[SATU] = np.zeros(p.shape[:-1]), np.ones(p.shape[:-1])
+        for u in range(2, self.jumlah_simpul):
+            p_v = p[..., self._var[u]]
+            P[u] = p_v * P[self._hi[u]] + (1 - p_v) * P[self._lo[u]]
+        return P
+
+    def keandalan(self, p):
+        """Keandalan sistem; `p` berbentuk (..., n_komponen) mengikuti `komponen`, atau dict nama -> R."""
+        p = self._matriks_p(p)
+        return self._maju(p)[self.akar]
+
+    def kepentingan(self, p):
+        """Keandalan sistem beserta kepentingan Birnbaum dan kritikalitas semua komponen dalam satu lintasan.
+
+        Birnbaum I_B(i) = ∂R/∂p_i dihitung dengan diferensiasi mundur pada BDD.
+        Kritikalitas I_C(i) = I_B(i)(1 - p_i)/(1 - R): peluang komponen i penyebab kegagalan sistem.
+        """
+        p = self._matriks_p(p)
+        P = self._maju(p)
+        R = P[self.akar]
+
+        adjoin = [0.0] * self.jumlah_simpul
+        adjoin[self.akar] = np.ones(p.shape[:-1])
+        birnbaum = np.zeros(p.shape)
+        for u in range(self.jumlah_simpul - 1, 1, -1):
+            g = adjoin[u]
+            if np.ndim(g) == 0 and g == 0.0:
+                continue
+            v = self._var[u]
+            p_v = p[..., v]
+            birnbaum[..., v] += g * (P[self._hi[u]] - P[self._lo[u]])
+            adjoin[self._hi[u]] = adjoin[self._hi[u]] + g * p_v
+            adjoin[self._lo[u]] = adjoin[self._lo[u]] + g * (1 - p_v)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            kritikalitas = np.where((1 - R)[..., None] > 0, birnbaum * (1 - p) / (1 - R)[..., None], 0.0)
+        return {'keandalan': R, 'birnbaum': birnbaum, 'kritikalitas': kritikalitas, 'komponen': list(self.komponen)}
+
+
+def hitung_diagram(definisi, keandalan_komponen):
+    """Kompilasi `definisi` lalu kembalikan keandalan sistem dan ukuran kepentingan setiap komponen."""
+    return DiagramBlok(definisi).kepentingan(keandalan_komponen)
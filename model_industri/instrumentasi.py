@@ -0,0 +1,230 @@
+"""Pengukuran waktu per rerun dashboard: hitung model, bangun grafik, dan kirim ke browser.
+
+Setiap rerun (atau rerun fragment) satu model dicatat sebagai satu rekaman berisi durasi
+per tahap, jumlah grafik, dan RSS proses. Rekaman terakhir disimpan di memori untuk panel
+debug, ditulis sebagai JSON lines bila `path_log` diisi, dan dirangkum dalam format teks
+Prometheus agar dapat di-scrape dari `jalankan_server_metrik`.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Batas atas bucket histogram durasi rerun (detik), untuk menentukan jumlah worker dan mendeteksi regresi
+BUCKET_DETIK = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def rss_byte():
+    """Resident set size proses saat ini dalam byte, atau None jika tidak dapat dibaca."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    # Tanpa /proc (mis. macOS) hanya puncak RSS yang tersedia; satuannya byte di macOS, KiB di Linux
+    puncak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return puncak if os.uname().sysname == 'Darwin' else puncak * 1024
+
+
+def _escape(nilai):
+    return str(nilai).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _label(**label):
+    """Label Prometheus `{nama="nilai",...}`; kosong jika tidak ada label."""
+    isi = ','.join(f'{k}="{_escape(v)}"' for k, v in label.items())
+    return '{' + isi + '}' if isi else ''
+
+
+class Pengukur:
+    """Pengumpul metrik per rerun yang aman dipakai bersama oleh banyak sesi Streamlit (thread).
+
+    Rerun yang sedang berjalan disimpan per thread, jadi `ukur` dan `tambah` di dalam `rerun`
+    selalu masuk ke rekaman sesi yang memanggilnya. Pengukuran di luar `rerun` (mis. pemanasan
+    cache saat startup) hanya masuk ke total kumulatif dengan model `"-"`.
+    """
+
+    def __init__(self, maks_riwayat=200, path_log=None):
+        self.path_log = path_log
+        self.riwayat = deque(maxlen=maks_riwayat)
+        self._lokal = threading.local()
+        self._kunci = threading.Lock()
+        self._rerun = defaultdict(int)
+        self._bucket = defaultdict(lambda: [0] * len(BUCKET_DETIK))
+        self._durasi_rerun = defaultdict(float)
+        self._tahap = defaultdict(lambda: [0, 0.0])
+        self._penghitung = defaultdict(int)
+
+    def _aktif(self):
+        tumpukan = getattr(self._lokal, 'tumpukan', None)
+        return tumpukan[-1] if tumpukan else None
+
+    @contextmanager
+    def rerun(self, model):
+        """Catat seluruh isi blok `with` sebagai satu rerun `model`."""
+        tumpukan = self._lokal.__dict__.setdefault('tumpukan', [])
+        rekaman = {'model': model, 'waktu': time.time(), 'tahap': defaultdict(float), 'jumlah': defaultdict(int)}
+        tumpukan.append(rekaman)
+        mulai = time.perf_counter()
+        try:
+            yield rekaman
+        finally:
+            rekaman['durasi'] = time.perf_counter() - mulai
+            tumpukan.pop()
+            self._selesai(rekaman)
+
+    @contextmanager
+    def ukur(self, tahap):
+        """Tambahkan lama blok `with` ke `tahap` (mis. 'hitung', 'figur', 'kirim') pada rerun aktif."""
+        mulai = time.perf_counter()
+        try:
+            yield
+        finally:
+            durasi = time.perf_counter() - mulai
+            rekaman = self._aktif()
+            model = rekaman['model'] if rekaman is not None else '-'
+            if rekaman is not None:
+                rekaman['tahap'][tahap] += durasi
+            with self._kunci:
+                total = self._tahap[model, tahap]
+                total[0] += 1
+                total[1] += durasi
+
+    def tambah(self, nama, n=1):
+        """Naikkan penghitung `nama` (mis. 'grafik', 'cache_hit') pada rerun aktif."""
+        rekaman = self._aktif()
+        model = rekaman['model'] if rekaman is not None else '-'
+        if rekaman is not None:
+            rekaman['jumlah'][nama] += n
+        with self._kunci:
+            self._penghitung[model, nama] += n
+
+    def _selesai(self, rekaman):
+        rekaman['tahap'] = dict(rekaman['tahap'])
+        rekaman['jumlah'] = dict(rekaman['jumlah'])
+        # Sisa waktu yang tidak masuk tahap mana pun: widget, teks, dan logika tampilan lainnya
+        rekaman['tahap']['lainnya'] = max(rekaman['durasi'] - sum(rekaman['tahap'].values()), 0.0)
+        rekaman['rss_byte'] = rss_byte()
+        model = rekaman['model']
+        with self._kunci:
+            self.riwayat.append(rekaman)
+            self._rerun[model] += 1
+            self._durasi_rerun[model] += rekaman['durasi']
+            total = self._tahap[model, 'lainnya']
+            total[0] += 1
+            total[1] += rekaman['tahap']['lainnya']
+            bucket = self._bucket[model]
+            for i, batas in enumerate(BUCKET_DETIK):
+                if rekaman['durasi'] <= batas:
+                    bucket[i] += 1
+            if self.path_log:
+                with open(self.path_log, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(rekaman, ensure_ascii=False) + '\n')
+
+    def json_lines(self):
+        """Rekaman di riwayat sebagai JSON lines, format yang sama dengan berkas `path_log`."""
+        with self._kunci:
+            riwayat = list(self.riwayat)
+        return ''.join(json.dumps(rekaman, ensure_ascii=False) + '\n' for rekaman in riwayat)
+
+    def ringkasan(self):
+        """Rata-rata, p95, dan maksimum durasi per model dan tahap dari rekaman di riwayat."""
+        with self._kunci:
+            riwayat = list(self.riwayat)
+        per_model = defaultdict(lambda: defaultdict(list))
+        for rekaman in riwayat:
+            per_model[rekaman['model']]['total'].append(rekaman['durasi'])
+            for tahap, durasi in rekaman['tahap'].items():
+                per_model[rekaman['model']][tahap].append(durasi)
+        baris = []
+        for model, tahap in per_model.items():
+            n = len(tahap['total'])
+            for nama, durasi in tahap.items():
+                durasi = sorted(durasi + [0.0] * (n - len(durasi)))
+                baris.append({'model': model, 'tahap': nama, 'rerun': n, 'rata_ms': 1000 * sum(durasi) / n,
+                              'p95_ms': 1000 * durasi[min(int(0.95 * n), n - 1)], 'maks_ms': 1000 * durasi[-1]})
+        return baris
+
+    def format_prometheus(self):
+        """Seluruh metrik kumulatif dalam format eksposisi teks Prometheus."""
+        with self._kunci:
+            rerun = dict(self._rerun)
+            bucket = {k: list(v) for k, v in self._bucket.items()}
+            durasi_rerun = dict(self._durasi_rerun)
+            tahap = {k: list(v) for k, v in self._tahap.items()}
+            penghitung = dict(self._penghitung)
+        baris = ['# HELP model_rerun_detik Durasi satu rerun model di dashboard.',
+                 '# TYPE model_rerun_detik histogram']
+        for model, n in sorted(rerun.items()):
+            for batas, jumlah in zip(BUCKET_DETIK, bucket[model]):
+                baris.append(f'model_rerun_detik_bucket{_label(model=model, le=batas)} {jumlah}')
+            baris.append(f'model_rerun_detik_bucket{_label(model=model, le="+Inf")} {n}')
+            baris.append(f'model_rerun_detik_sum{_label(model=model)} {durasi_rerun[model]:.6f}')
+            baris.append(f'model_rerun_detik_count{_label(model=model)} {n}')
+        baris += ['# HELP model_tahap_detik Waktu kumulatif per tahap (hitung, figur, kirim, ...).',
+                  '# TYPE model_tahap_detik summary']
+        for (model, nama), (n, total) in sorted(tahap.items()):
+            baris.append(f'model_tahap_detik_sum{_label(model=model, tahap=nama)} {total:.6f}')
+            baris.append(f'model_tahap_detik_count{_label(model=model, tahap=nama)} {n}')
+        baris += ['# HELP model_kejadian_total Penghitung kejadian (grafik, cache_hit, cache_miss, ...).',
+                  '# TYPE model_kejadian_total counter']
+        for (model, nama), n in sorted(penghitung.items()):
+            baris.append(f'model_kejadian_total{_label(model=model, nama=nama)} {n}')
+        rss = rss_byte()
+        if rss is not None:
+            baris += ['# HELP process_resident_memory_bytes Resident memory size in bytes.',
+                      '# TYPE process_resident_memory_bytes gauge', f'process_resident_memory_bytes {rss}']
+        return '\n'.join(baris) + '\n'
+
+
+_SERVER_METRIK = {}
+_KUNCI_SERVER = threading.Lock()
+
+
+def jalankan_server_metrik(pengukur, port, host='127.0.0.1'):
+    """Layani `GET /metrics` dari `pengukur` di thread latar; kembalikan servernya (panggil `shutdown()` untuk berhenti).
+
+    Satu server per `(host, port)` per proses: panggilan berikutnya (mis. setelah `st.cache_resource.clear()`
+    membuat pengukur baru) memakai ulang server yang sudah berjalan dan mengalihkannya ke `pengukur`.
+    Bawaannya hanya lokal; buka ke jaringan (mis. `host='0.0.0.0'`) hanya jika scraper berada di mesin lain.
+    """
+
+    class Penangan(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] != '/metrics':
+                self.send_error(404)
+                return
+            isi = self.server.pengukur.format_prometheus().encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(isi)))
+            self.end_headers()
+            self.wfile.write(isi)
+
+        def log_message(self, *args):
+            pass
+
+    with _KUNCI_SERVER:
+        server = _SERVER_METRIK.get((host, port))
+        if server is None:
+            server = ThreadingHTTPServer((host, port), Penangan)
+            server.daemon_threads = True
+            threading.Thread(target=server.serve_forever, name='server-metrik', daemon=True).start()
+            if port:
+                _SERVER_METRIK[host, port] = server
+        server.pengukur = pengukur
+    return server
+
+
+def pengukur_dari_env():
+    """Buat Pengukur dari MODEL_METRICS_LOG (path JSON lines) dan MODEL_METRICS_RIWAYAT (jumlah rekaman)."""
+    return Pengukur(maks_riwayat=int(os.environ.get('MODEL_METRICS_RIWAYAT', 200)),
+                    path_log=os.environ.get('MODEL_METRICS_LOG') or None)
@@ -0,0 +1,14 @@
+import numpy as np
+
+
+def keandalan_seri(reliabilities):
+    """Keandalan sistem seri: hasil kali keandalan komponen di sumbu terakhir.
+
+    `reliabilities` berbentuk (..., n_mesin) sehingga ribuan lini dapat dihitung sekaligus.
+    """
+    return np.prod(np.asarray(reliabilities, dtype=float), axis=-1)
+
+
+def mata_rantai_terlemah(reliabilities):
+    """Indeks komponen dengan keandalan terendah pada setiap lini."""
+    return np.argmin(np.asarray(reliabilities, dtype=float), axis=-1)
@@ -0,0 +1,509 @@
+"""Layanan HTTP JSON lokal (asyncio, tanpa dependensi tambahan) untuk keempat model.
+
+Permintaan model cepat (produksi, persediaan, antrian, keandalan) yang datang bersamaan
+dikumpulkan menjadi satu micro-batch lalu dihitung sekaligus secara tervektorisasi dengan
+fungsi yang sama dengan `python -m model_industri`. Perhitungan berat (LP, simulasi, alokasi
+redundansi) dikirim ke pool proses. Setiap antrian dibatasi; permintaan yang melebihinya
+langsung ditolak dengan 503 + Retry-After, sehingga latensi tetap terbatas saat beban puncak.
+
+    python -m model_industri layanan --port 8765
+
+    curl -s localhost:8765/v1/persediaan -d '{"D": 1200, "S": 500000, "H": 25000}'
+    curl -s localhost:8765/v1/antrian -d '[{"lmbda": 30, "mu": 35, "target_wq": 0.05}, {"lmbda": 50, "mu": 35, "c": 2}]'
+    curl -s localhost:8765/v1/lp -d '{"c": [750000, 300000], "A": [[6, 2], [4, 1.5]], "b": [240, 120], "integer": true}'
+"""
+
+import argparse
+import asyncio
+import inspect
+import json
+import math
+import time
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from .antrian import staf_minimal
+from .batch import MODEL_BATCH
+from .diagram_blok import DiagramBlok
+from .redundansi import alokasi_redundansi
+from .simpleks import selesaikan_lp
+from .simulasi_antrian import simulasi_antrian
+from .simulasi_ketersediaan import simulasi_ketersediaan
+from .simulasi_persediaan import simulasi_persediaan
+
+# Fungsi berat yang dijalankan satu per permintaan di pool proses; argumennya adalah isi JSON permintaan
+MODEL_BERAT = {
+    'lp': selesaikan_lp,
+    'redundansi': alokasi_redundansi,
+    'simulasi_antrian': simulasi_antrian,
+    'simulasi_ketersediaan': simulasi_ketersediaan,
+    'simulasi_persediaan': simulasi_persediaan,
+}
+
+_STATUS_HTTP = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+                413: 'Payload Too Large', 500: 'Internal Server Error', 503: 'Service Unavailable',
+                504: 'Gateway Timeout'}
+_MAKS_DIAGRAM = 256
+# Rentang kolom batch yang diterima; di luar itu satu baris bisa menghabiskan memori (distribusi P(n)
+# sepanjang K + 1) atau menahan thread batch sangat lama (rekurensi Erlang sampai c)
+_RENTANG = {'c': (1, 1_000), 'K': (0, 100_000)}
+
+
+class GalatPermintaan(Exception):
+    """Galat yang dikembalikan ke klien dengan kode status HTTP tertentu."""
+
+    def __init__(self, status, pesan, header=None):
+        super().__init__(pesan)
+        self.status = status
+        self.header = header or {}
+
+
+def ke_json(nilai):
+    """Ubah hasil model (array NumPy, skalar NumPy, NaN/inf) menjadi nilai yang dapat di-`json.dumps`."""
+    if isinstance(nilai, dict):
+        return {str(k): ke_json(v) for k, v in nilai.items()}
+    if isinstance(nilai, (list, tuple)):
+        return [ke_json(v) for v in nilai]
+    if isinstance(nilai, np.ndarray):
+        return ke_json(nilai.tolist())
+    if isinstance(nilai, np.generic):
+        nilai = nilai.item()
+    if isinstance(nilai, float) and not math.isfinite(nilai):
+        return None
+    return nilai
+
+
+def _kolom_ke_daftar(nilai):
+    nilai = np.asarray(nilai)
+    if nilai.dtype.kind == 'f' and not np.all(np.isfinite(nilai)):
+        return [v if math.isfinite(v) else None for v in nilai.tolist()]
+    return nilai.tolist()
+
+
+def _tolak_konstanta(nama):
+    # NaN/Infinity bukan JSON standar; json.loads menerimanya secara bawaan
+    raise ValueError(f'{nama} tidak diizinkan')
+
+
+def _angka(baris, nama, bawaan=None):
+    nilai = baris.get(nama, bawaan)
+    if nilai is None:
+        raise GalatPermintaan(400, f"kolom '{nama}' wajib diisi")
+    if isinstance(nilai, bool) or not isinstance(nilai, (int, float)):
+        raise GalatPermintaan(400, f"kolom '{nama}' harus berupa angka")
+    if not math.isfinite(nilai):
+        raise GalatPermintaan(400, f"kolom '{nama}' harus berupa angka berhingga")
+    return float(nilai)
+
+
+_DIAGRAM = OrderedDict()
+
+
+def _diagram(definisi):
+    """DiagramBlok untuk `definisi` (JSON), dikompilasi sekali dan disimpan LRU."""
+    kunci = json.dumps(definisi, sort_keys=True)
+    diagram = _DIAGRAM.get(kunci)
+    if diagram is None:
+        try:
+            diagram = DiagramBlok(definisi)
+        except (TypeError, ValueError, IndexError, KeyError) as e:
+            raise GalatPermintaan(400, f'definisi diagram tidak valid: {e}') from e
+        _DIAGRAM[kunci] = diagram
+        while len(_DIAGRAM) > _MAKS_DIAGRAM:
+            _DIAGRAM.popitem(last=False)
+    else:
+        _DIAGRAM.move_to_end(kunci)
+    return kunci, diagram
+
+
+def _validasi_baris(model, baris):
+    """Baris masukan yang sudah diperiksa dan dilengkapi nilai bawaannya; GalatPermintaan 400 jika tidak valid."""
+    if not isinstance(baris, dict):
+        raise GalatPermintaan(400, 'setiap skenario harus berupa objek JSON')
+    if model == 'keandalan':
+        keandalan = baris.get('keandalan')
+        if not isinstance(keandalan, dict) or not keandalan:
+            raise GalatPermintaan(400, "kolom 'keandalan' harus berupa objek {nama_mesin: keandalan}")
+        definisi = baris.get('definisi') or ['seri', list(keandalan)]
+        kunci, diagram = _diagram(definisi)
+        p = [_angka(keandalan, nama) for nama in diagram.komponen]
+        if not all(0 <= r <= 1 for r in p):
+            raise GalatPermintaan(400, 'keandalan setiap komponen harus di antara 0 dan 1')
+        return {'diagram': kunci, 'p': p}
+    spek = MODEL_BATCH[model]
+    hasil = {nama: _angka(baris, nama) for nama in spek['wajib']}
+    hasil.update((nama, _angka(baris, nama, bawaan)) for nama, bawaan in spek['opsional'].items())
+    for nama, (minimum, maksimum) in _RENTANG.items():
+        if nama in hasil and not minimum <= hasil[nama] <= maksimum:
+            raise GalatPermintaan(400, f"kolom '{nama}' harus di antara {minimum} dan {maksimum:,}")
+    if model == 'antrian':
+        hasil['target_wq'] = np.nan if baris.get('target_wq') is None else _angka(baris, 'target_wq')
+    return hasil
+
+
+def _hitung_batch(model, daftar_baris):
+    """Hitung semua baris `model` sekaligus; mengembalikan satu dict hasil per baris."""
+    if model == 'keandalan':
+        return _hitung_batch_keandalan(daftar_baris)
+    kolom = {nama: np.array([b[nama] for b in daftar_baris]) for nama in daftar_baris[0]}
+    target_wq = kolom.pop('target_wq', None)
+    hasil = dict(MODEL_BATCH[model]['fungsi'](kolom, {}))
+    if target_wq is not None:
+        # Staf minimal hanya dihitung untuk baris yang memberi target waktu tunggu
+        c_minimal = np.full(target_wq.size, np.nan)
+        ada = np.isfinite(target_wq)
+        if ada.any():
+            c = staf_minimal(kolom['lmbda'][ada], kolom['mu'][ada], target_wq[ada])['c']
+            # 0 berarti target tidak tercapai sampai c_maks server
+            c_minimal[ada] = np.where(c > 0, c, np.nan)
+        hasil['c_minimal'] = c_minimal
+    nama = list(hasil)
+    return [dict(zip(nama, nilai)) for nilai in zip(*(_kolom_ke_daftar(hasil[k]) for k in nama))]
+
+
+def _hitung_per_baris(model, daftar_baris):
+    """Seperti `_hitung_batch`, tetapi satu baris per panggilan; galat dikembalikan di posisi barisnya."""
+    hasil = []
+    for baris in daftar_baris:
+        try:
+            hasil.append(_hitung_batch(model, [baris])[0])
+        except Exception as e:
+            hasil.append(e)
+    return hasil
+
+
+def _hitung_batch_keandalan(daftar_baris):
+    hasil = [None] * len(daftar_baris)
+    kelompok = defaultdict(list)
+    for i, baris in enumerate(daftar_baris):
+        kelompok[baris['diagram']].append(i)
+    for kunci, indeks in kelompok.items():
+        diagram = _DIAGRAM.get(kunci) or DiagramBlok(json.loads(kunci))
+        kepentingan = diagram.kepentingan(np.array([daftar_baris[i]['p'] for i in indeks]))
+        kritis = np.argmax(kepentingan['kritikalitas'], axis=-1)
+        keandalan = _kolom_ke_daftar(kepentingan['keandalan'])
+        for j, i in enumerate(indeks):
+            R = keandalan[j]
+            hasil[i] = {
+                'keandalan': R,
+                'komponen_kritis': diagram.komponen[kritis[j]] if R is not None and R < 1 else None,
+                'birnbaum': dict(zip(diagram.komponen, _kolom_ke_daftar(kepentingan['birnbaum'][j]))),
+                'kritikalitas': dict(zip(diagram.komponen, _kolom_ke_daftar(kepentingan['kritikalitas'][j]))),
+            }
+    return hasil
+
+
+def _panggil_berat(nama, argumen):
+    """Jalankan model berat di proses pekerja dan kembalikan hasil yang sudah siap di-JSON-kan."""
+    fungsi = MODEL_BERAT[nama]
+    # Pekerja sudah berada di pool proses; simulasi tidak boleh membuka pool sendiri di dalamnya
+    if 'n_proses' in inspect.signature(fungsi).parameters:
+        argumen = {**argumen, 'n_proses': 1}
+    return ke_json(fungsi(**argumen))
+
+
+class _Pengumpul:
+    """Antrian micro-batch satu model: baris yang masuk selama `jeda` detik (atau selama batch
+    sebelumnya masih dihitung) dievaluasi bersama, paling banyak `maks_batch` baris sekaligus."""
+
+    def __init__(self, model, eksekutor, maks_batch, jeda, maks_antrian):
+        self.model = model
+        self.maks_batch = maks_batch
+        self.jeda = jeda
+        self.maks_antrian = maks_antrian
+        self.antrian = deque()
+        self.statistik = {'batch': 0, 'baris': 0, 'batch_terbesar': 0}
+        self._eksekutor = eksekutor
+        self._ada = asyncio.Event()
+
+    def kirim(self, daftar_baris):
+        if len(self.antrian) + len(daftar_baris) > self.maks_antrian:
+            raise GalatPermintaan(503, f"antrian model '{self.model}' penuh", {'Retry-After': '1'})
+        loop = asyncio.get_running_loop()
+        masa_depan = []
+        for baris in daftar_baris:
+            masa_depan.append(loop.create_future())
+            self.antrian.append((baris, masa_depan[-1]))
+        self._ada.set()
+        return masa_depan
+
+    async def putar(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._ada.wait()
+            if len(self.antrian) < self.maks_batch:
+                await asyncio.sleep(self.jeda)
+            ambil = [self.antrian.popleft() for _ in range(min(len(self.antrian), self.maks_batch))]
+            if not self.antrian:
+                self._ada.clear()
+            # Baris yang klien-nya sudah menyerah (timeout/putus) tidak perlu dihitung
+            ambil = [(baris, f) for baris, f in ambil if not f.done()]
+            if not ambil:
+                continue
+            daftar_baris = [b for b, _ in ambil]
+            try:
+                hasil = await loop.run_in_executor(self._eksekutor, _hitung_batch, self.model, daftar_baris)
+            except Exception:
+                # Satu baris bermasalah tidak boleh menggagalkan permintaan lain yang kebetulan satu batch
+                hasil = await loop.run_in_executor(self._eksekutor, _hitung_per_baris, self.model, daftar_baris)
+            self.statistik['batch'] += 1
+            self.statistik['baris'] += len(ambil)
+            self.statistik['batch_terbesar'] = max(self.statistik['batch_terbesar'], len(ambil))
+            for (_, f), h in zip(ambil, hasil):
+                if f.done():
+                    continue
+                if isinstance(h, Exception):
+                    f.set_exception(h)
+                else:
+                    f.set_result(h)
+
+
+class LayananModel:
+    """Server HTTP/1.1 JSON untuk model-model `model_industri`.
+
+    `POST /v1/<model>` dengan badan objek (satu skenario) atau daftar objek (banyak skenario).
+    Model batch: produksi, persediaan, antrian (tambahkan `target_wq` untuk staf minimal), dan
+    keandalan (`{"keandalan": {mesin: R}, "definisi": [...]}`, bawaan seri). Model berat di
+    `MODEL_BERAT` menerima argumen fungsinya sebagai objek JSON. `GET /v1/status` memberi
+    statistik antrian, ukuran batch, penolakan, dan latensi p50/p99 per endpoint.
+
+    Batas beban: `maks_antrian` baris per model batch, `maks_berat` permintaan berat yang
+    menunggu atau berjalan, `maks_koneksi` koneksi terbuka, `maks_badan` byte per permintaan,
+    dan `batas_waktu` detik per permintaan (504 jika terlampaui). Skenario di luar rentang (c 1–1000,
+    K 0–100 000, keandalan 0–1) ditolak 400 sebelum masuk batch.
+    """
+
+    def __init__(self, host='127.0.0.1', port=8765, n_proses=None, maks_batch=4096, jeda_batch=0.002,
+                 maks_antrian=50_000, maks_berat=None, maks_koneksi=1024, maks_badan=8 * 2**20, batas_waktu=30.0):
+        self.host, self.port = host, port
+        self.n_proses = n_proses
+        self.maks_batch, self.jeda_batch, self.maks_antrian = maks_batch, jeda_batch, maks_antrian
+        self.maks_koneksi, self.maks_badan, self.batas_waktu = maks_koneksi, maks_badan, batas_waktu
+        self.maks_berat = maks_berat
+        self.statistik = defaultdict(lambda: {'permintaan': 0, 'skenario': 0, 'ditolak': 0, 'galat': 0,
+                                              'latensi': deque(maxlen=10_000)})
+        self._koneksi = 0
+        self._koneksi_ditolak = 0
+        self._berat = 0
+        self._server = None
+        self._tugas = []
+        self._pool = None
+        self._utas = None
+        self._pengumpul = {}
+
+    async def mulai(self):
+        self._pool = ProcessPoolExecutor(self.n_proses)
+        n_proses = self._pool._max_workers
+        # Pekerja di-fork sekarang, sebelum thread batch ada; fork setelah thread NumPy berjalan bisa macet
+        await asyncio.gather(*(asyncio.get_running_loop().run_in_executor(self._pool, int) for _ in range(n_proses)))
+        if self.maks_berat is None:
+            self.maks_berat = 4 * n_proses
+        self._utas = ThreadPoolExecutor(len(MODEL_BATCH), thread_name_prefix='batch')
+        self._pengumpul = {model: _Pengumpul(model, self._utas, self.maks_batch, self.jeda_batch, self.maks_antrian)
+                           for model in MODEL_BATCH}
+        self._tugas = [asyncio.create_task(p.putar()) for p in self._pengumpul.values()]
+        self._server = await asyncio.start_server(self._tangani_koneksi, self.host, self.port, backlog=1024)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def berhenti(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for tugas in self._tugas:
+            tugas.cancel()
+        await asyncio.gather(*self._tugas, return_exceptions=True)
+        if self._utas is not None:
+            self._utas.shutdown(wait=False, cancel_futures=True)
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    async def __aenter__(self):
+        return await self.mulai()
+
+    async def __aexit__(self, *galat):
+        await self.berhenti()
+
+    def status(self):
+        hasil = {'koneksi': self._koneksi, 'koneksi_ditolak': self._koneksi_ditolak, 'berat_berjalan': self._berat,
+                 'maks_berat': self.maks_berat,
+                 'antrian': {m: len(p.antrian) for m, p in self._pengumpul.items()},
+                 'batch': {m: dict(p.statistik) for m, p in self._pengumpul.items()}, 'endpoint': {}}
+        for nama, s in self.statistik.items():
+            latensi = np.array(s['latensi'])
+            hasil['endpoint'][nama] = {k: v for k, v in s.items() if k != 'latensi'}
+            if latensi.size:
+                hasil['endpoint'][nama].update(
+                    {f'p{q}_ms': float(np.percentile(latensi, q)) * 1000 for q in (50, 99)})
+        return hasil
+
+    async def _jawab(self, metode, path, badan):
+        if path == '/v1/status':
+            return self.status()
+        if path == '/v1/model':
+            return {'batch': {m: {'wajib': s['wajib'], 'opsional': s['opsional']} for m, s in MODEL_BATCH.items()},
+                    'berat': {m: list(inspect.signature(f).parameters) for m, f in MODEL_BERAT.items()}}
+        model = path[len('/v1/'):] if path.startswith('/v1/') else None
+        if model not in MODEL_BATCH and model not in MODEL_BERAT:
+            raise GalatPermintaan(404, f'endpoint tidak dikenal: {path}')
+        if metode != 'POST':
+            raise GalatPermintaan(405, 'gunakan POST dengan badan JSON')
+        try:
+            isi = json.loads(badan or b'null', parse_constant=_tolak_konstanta)
+        except ValueError as e:
+            raise GalatPermintaan(400, f'JSON tidak valid: {e}') from e
+
+        if model in MODEL_BERAT:
+            return await self._jawab_berat(model, isi)
+        daftar = isi if isinstance(isi, list) else [isi]
+        masa_depan = self._pengumpul[model].kirim([_validasi_baris(model, b) for b in daftar])
+        self.statistik[model]['skenario'] += len(daftar)
+        try:
+            hasil = await asyncio.wait_for(asyncio.gather(*masa_depan), self.batas_waktu)
+        except asyncio.TimeoutError as e:
+            raise GalatPermintaan(504, 'batas waktu terlampaui') from e
+        return hasil if isinstance(isi, list) else hasil[0]
+
+    async def _jawab_berat(self, model, argumen):
+        if not isinstance(argumen, dict):
+            raise GalatPermintaan(400, 'badan permintaan harus berupa objek argumen')
+        try:
+            inspect.signature(MODEL_BERAT[model]).bind(**argumen)
+        except TypeError as e:
+            raise GalatPermintaan(400, str(e)) from e
+        if self._berat >= self.maks_berat:
+            raise GalatPermintaan(503, 'pool perhitungan berat penuh', {'Retry-After': '1'})
+        loop = asyncio.get_running_loop()
+        self._berat += 1
+        tugas = self._pool.submit(_panggil_berat, model, argumen)
+        # Slot baru dilepas saat tugas di pool benar-benar selesai (atau batal), bukan saat klien berhenti
+        # menunggu; dengan begitu `maks_berat` tetap membatasi pekerjaan yang ada di pool proses
+        tugas.add_done_callback(lambda _: self._lepas_berat(loop))
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(tugas), self.batas_waktu)
+        except asyncio.TimeoutError as e:
+            # Tugas yang belum mulai dibuang dari antrian pool; yang sedang berjalan dibiarkan selesai
+            tugas.cancel()
+            raise GalatPermintaan(504, 'batas waktu terlampaui') from e
+        except (KeyError, TypeError, ValueError) as e:
+            raise GalatPermintaan(400, f'{type(e).__name__}: {e}') from e
+
+    def _lepas_berat(self, loop):
+        # Dipanggil dari thread pengelola pool proses; perubahan penghitung dijadwalkan ke event loop
+        try:
+            loop.call_soon_threadsafe(self._kurangi_berat)
+        except RuntimeError:  # event loop sudah ditutup saat layanan berhenti
+            pass
+
+    def _kurangi_berat(self):
+        self._berat -= 1
+
+    async def _tangani_koneksi(self, pembaca, penulis):
+        self._koneksi += 1
+        try:
+            tetap = True
+            while tetap:
+                baris = await pembaca.readline()
+                if not baris:
+                    break
+                try:
+                    metode, path, versi = baris.decode('latin-1').split()
+                except ValueError:
+                    break
+                header = {}
+                while True:
+                    h = await pembaca.readline()
+                    if h in (b'\r\n', b'\n', b''):
+                        break
+                    nama, _, nilai = h.decode('latin-1').partition(':')
+                    header[nama.strip().lower()] = nilai.strip()
+                koneksi = header.get('connection', '').lower()
+                tetap = koneksi == 'keep-alive' if versi == 'HTTP/1.0' else koneksi != 'close'
+                panjang = int(header.get('content-length') or 0)
+                if panjang > self.maks_badan:
+                    await self._tulis(penulis, 413, {'galat': 'badan permintaan terlalu besar'}, tetap=False)
+                    break
+                badan = await pembaca.readexactly(panjang) if panjang else b''
+                if self._koneksi > self.maks_koneksi:
+                    self._koneksi_ditolak += 1
+                    # Permintaan dibaca dulu agar klien menerima 503, bukan koneksi yang direset
+                    await self._tulis(penulis, 503, {'galat': 'terlalu banyak koneksi'}, {'Retry-After': '1'},
+                                      tetap=False)
+                    break
+                await self._layani(penulis, metode, path.split('?')[0], badan, tetap)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._koneksi -= 1
+            penulis.close()
+
+    async def _layani(self, penulis, metode, path, badan, tetap):
+        mulai = time.perf_counter()
+        nama = path[len('/v1/'):] if path.startswith('/v1/') else path
+        statistik = self.statistik[nama] if nama in MODEL_BATCH or nama in MODEL_BERAT else None
+        header = {}
+        try:
+            status, hasil = 200, await self._jawab(metode, path, badan)
+        except GalatPermintaan as e:
+            status, hasil, header = e.status, {'galat': str(e)}, e.header
+        except Exception as e:
+            status, hasil = 500, {'galat': f'{type(e).__name__}: {e}'}
+        if statistik is not None:
+            statistik['permintaan'] += 1
+            if status == 503:
+                statistik['ditolak'] += 1
+            elif status != 200:
+                statistik['galat'] += 1
+            else:
+                statistik['latensi'].append(time.perf_counter() - mulai)
+        await self._tulis(penulis, status, hasil, header, tetap)
+
+    @staticmethod
+    async def _tulis(penulis, status, hasil, header=None, tetap=True):
+        isi = json.dumps(hasil, ensure_ascii=False, allow_nan=False).encode()
+        kepala = [f'HTTP/1.1 {status} {_STATUS_HTTP[status]}', 'Content-Type: application/json; charset=utf-8',
+                  f'Content-Length: {len(isi)}', f"Connection: {'keep-alive' if tetap else 'close'}"]
+        kepala += [f'{k}: {v}' for k, v in (header or {}).items()]
+        penulis.write(('\r\n'.join(kepala) + '\r\n\r\n').encode('latin-1') + isi)
+        await penulis.drain()
+
+
+async def _layani_selamanya(**opsi):
+    async with LayananModel(**opsi) as layanan:
+        print(f'Melayani model di http://{layanan.host}:{layanan.port}/v1/ '
+              f'({layanan._pool._max_workers} proses untuk perhitungan berat)', flush=True)
+        await asyncio.Event().wait()
+
+
+def jalankan_layanan(host='127.0.0.1', port=8765, **opsi):
+    """Jalankan `LayananModel` sampai dihentikan (Ctrl+C)."""
+    try:
+        asyncio.run(_layani_selamanya(host=host, port=port, **opsi))
+    except KeyboardInterrupt:
+        pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m model_industri layanan',
+                                     description='Layanan HTTP JSON lokal untuk model produksi, persediaan, antrian, '
+                                                 'dan keandalan, dengan micro-batching dan pool proses.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('-j', '--proses', type=int, help='proses pekerja untuk LP dan simulasi (bawaan: semua CPU)')
+    parser.add_argument('--maks-batch', type=int, default=4096, help='baris maksimum per micro-batch')
+    parser.add_argument('--jeda-ms', type=float, default=2.0, help='waktu tunggu pengumpulan batch (milidetik)')
+    parser.add_argument('--maks-antrian', type=int, default=50_000,
+                        help='baris menunggu per model sebelum permintaan baru ditolak 503')
+    parser.add_argument('--maks-berat', type=int, help='permintaan berat menunggu/berjalan (bawaan: 4 × proses)')
+    parser.add_argument('--maks-koneksi', type=int, default=1024)
+    parser.add_argument('--batas-waktu', type=float, default=30.0, help='detik per permintaan sebelum 504')
+    args = parser.parse_args(argv)
+    jalankan_layanan(args.host, args.port, n_proses=args.proses, maks_batch=args.maks_batch,
+                     jeda_batch=args.jeda_ms / 1000, maks_antrian=args.maks_antrian, maks_berat=args.maks_berat,
+                     maks_koneksi=args.maks_koneksi, batas_waktu=args.batas_waktu)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,292 @@
+import hashlib
+import json
+import math
+import os
+
+import numpy as np
+
+from .cache import kunci_hasil
+from .persediaan import HARI_PER_TAHUN
+
+# Ukuran potongan baca: byte per chunk untuk CSV/JSON lines, baris per chunk untuk .npy (memory-mapped)
+UKURAN_CHUNK_BYTE = 64 * 2**20
+UKURAN_CHUNK_BARIS = 2_000_000
+# Bagian awal dan akhir berkas yang ikut di-hash untuk sidik jari
+_BYTE_SAMPEL = 2**20
+_EKSTENSI_JSONL = ('.jsonl', '.ndjson')
+
+
+class StatistikOnline:
+    """Jumlah, rata-rata, dan variansi satu lintasan yang digabung per chunk (rumus paralel Chan)."""
+
+    def __init__(self):
+        self.n = 0
+        self.rata = 0.0
+        self.m2 = 0.0
+        self.minimum = math.inf
+        self.maksimum = -math.inf
+
+    def tambah(self, x):
+        x = np.asarray(x, dtype=float).ravel()
+        if x.size == 0:
+            return
+        n_b, rata_b = x.size, float(x.mean())
+        m2_b = float(((x - rata_b) ** 2).sum())
+        n = self.n + n_b
+        delta = rata_b - self.rata
+        self.rata += delta * n_b / n
+        self.m2 += m2_b + delta ** 2 * self.n * n_b / n
+        self.n = n
+        self.minimum = min(self.minimum, float(x.min()))
+        self.maksimum = max(self.maksimum, float(x.max()))
+
+    @property
+    def variansi(self):
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    @property
+    def sd(self):
+        return math.sqrt(self.variansi)
+
+
+def sidik_jari_berkas(path):
+    """Hash murah untuk berkas besar: ukuran, waktu modifikasi, serta 1 MiB awal dan akhir isinya."""
+    info = os.stat(path)
+    sha = hashlib.sha1(f'{info.st_size}:{info.st_mtime_ns}'.encode())
+    with open(path, 'rb') as f:
+        sha.update(f.read(_BYTE_SAMPEL))
+        if info.st_size > 2 * _BYTE_SAMPEL:
+            f.seek(-_BYTE_SAMPEL, os.SEEK_END)
+            sha.update(f.read(_BYTE_SAMPEL))
+    return sha.hexdigest()
+
+
+def hitung_berkas(cache, fungsi, path, **kwargs):
+    """`fungsi(path, **kwargs)` lewat `cache` dengan kunci sidik jari isi berkas, bukan path-nya.
+
+    Berkas yang sama tidak dibaca ulang di setiap rerun; berkas yang diubah otomatis dihitung ulang.
+    """
+    kunci = kunci_hasil(fungsi, (sidik_jari_berkas(path),), kwargs)
+    ada, nilai = cache.ambil(kunci)
+    if not ada:
+        nilai = fungsi(path, **kwargs)
+        cache.simpan(kunci, nilai)
+    return nilai
+
+
+def kolom_berkas(path):
+    """Nama kolom CSV berheader, JSON lines (kunci baris pertama), atau .npy terstruktur."""
+    if path.endswith('.npy'):
+        return list(np.load(path, mmap_mode='r').dtype.names or ())
+    with open(path, encoding='utf-8') as f:
+        baris = f.readline()
+    if path.endswith(_EKSTENSI_JSONL):
+        return list(json.loads(baris)) if baris.strip() else []
+    return [h.strip() for h in baris.split(',')]
+
+
+def bagi_berkas(path, ukuran_chunk_byte=UKURAN_CHUNK_BYTE, ukuran_chunk_baris=UKURAN_CHUNK_BARIS):
+    """Batas potongan `(awal, akhir)` berkas: offset byte yang jatuh di awal baris (CSV/JSON lines,
+    setelah header CSV) atau rentang baris (.npy).
+
+    Setiap potongan dapat dibaca terpisah dengan `baca_potongan`, termasuk di proses lain.
+    """
+    if path.endswith('.npy'):
+        n = np.load(path, mmap_mode='r').shape[0]
+        return [(awal, min(awal + ukuran_chunk_baris, n)) for awal in range(0, n, ukuran_chunk_baris)]
+    ukuran = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        if not path.endswith(_EKSTENSI_JSONL):
+            f.readline()
+        batas = [f.tell()]
+        while batas[-1] < ukuran:
+            f.seek(batas[-1] + ukuran_chunk_byte)
+            f.readline()
+            batas.append(min(f.tell(), ukuran))
+    return list(zip(batas[:-1], batas[1:]))
+
+
+def baca_potongan(path, kolom, awal, akhir):
+    """Satu potongan dari `bagi_berkas` sebagai `{nama: array}`.
+
+    Kolom CSV yang isinya angka menjadi float, dengan sel kosong sebagai NaN; kolom lain (mis. tanggal
+    ISO) tetap string. JSON lines mengikuti tipe nilainya.
+    """
+    if path.endswith('.npy'):
+        data = np.load(path, mmap_mode='r')
+        hilang = [k for k in kolom if k not in (data.dtype.names or ())]
+        if hilang:
+            raise ValueError(f"Kolom tidak ada di {os.path.basename(path)}: {', '.join(hilang)}")
+        potongan = data[awal:akhir]
+        return {k: np.asarray(potongan[k]) for k in kolom}
+
+    with open(path, 'rb') as f:
+        header = f.readline().decode('utf-8')
+        f.seek(awal)
+        baris = f.read(akhir - awal).decode('utf-8').splitlines()
+
+    if path.endswith(_EKSTENSI_JSONL):
+        data = [json.loads(b) for b in baris if b.strip()]
+        try:
+            return {k: np.array([d[k] for d in data]) for k in kolom}
+        except KeyError as e:
+            raise ValueError(f"Kolom tidak ada di {os.path.basename(path)}: {e.args[0]}") from None
+
+    header = [h.strip() for h in header.split(',')]
+    hilang = [k for k in kolom if k not in header]
+    if hilang:
+        raise ValueError(f"Kolom tidak ada di {os.path.basename(path)}: {', '.join(hilang)}")
+    indeks = [header.index(k) for k in kolom]
+    baris = [b for b in baris if b.strip()]
+    if not baris:
+        return {k: np.zeros(0) for k in kolom}
+    try:
+        nilai = np.loadtxt(baris, delimiter=',', dtype=float, usecols=indeks, ndmin=2)
+    except ValueError:
+        # Ada sel kosong atau kolom teks: baca sebagai teks lalu ubah per kolom
+        nilai = np.loadtxt(baris, delimiter=',', dtype=str, usecols=indeks, ndmin=2)
+        return {k: _kolom_angka(nilai[:, i]) for i, k in enumerate(kolom)}
+    return {k: nilai[:, i] for i, k in enumerate(kolom)}
+
+
+def _kolom_angka(teks):
+    """Kolom teks CSV sebagai float (sel kosong menjadi NaN) jika semua isinya angka, selain itu tetap teks."""
+    kosong = np.char.str_len(np.char.strip(teks)) == 0
+    try:
+        return np.where(kosong, 'nan', teks).astype(float)
+    except ValueError:
+        return teks
+
+
+def baca_kolom(path, kolom, ukuran_chunk_byte=UKURAN_CHUNK_BYTE, ukuran_chunk_baris=UKURAN_CHUNK_BARIS):
+    """Iterasi chunk `{nama: array}` dari CSV berheader, JSON lines, atau .npy terstruktur tanpa memuat
+    seluruh berkas.
+
+    CSV dan JSON lines dibaca per ~`ukuran_chunk_byte` (baris utuh); .npy dibuka dengan memory map
+    dan dipotong per `ukuran_chunk_baris`.
+    """
+    for awal, akhir in bagi_berkas(path, ukuran_chunk_byte, ukuran_chunk_baris):
+        yield baca_potongan(path, kolom, awal, akhir)
+
+
+def _ke_detik(nilai, satuan_angka):
+    """Waktu sebagai detik float: tanggal/waktu ISO atau datetime64 dikonversi, angka dikalikan `satuan_angka`.
+
+    Waktu yang kosong (NaN/NaT) menjadi NaN.
+    """
+    if nilai.dtype.kind in 'US':
+        try:
+            return nilai.astype(float) * satuan_angka
+        except ValueError:
+            nilai = nilai.astype('datetime64[s]')
+    if nilai.dtype.kind == 'M':
+        nilai = nilai.astype('datetime64[s]')
+        return np.where(np.isnat(nilai), np.nan, nilai.astype(np.int64).astype(float))
+    return nilai.astype(float) * satuan_angka
+
+
+def statistik_permintaan(path, kolom_tanggal='tanggal', kolom_jumlah='jumlah'):
+    """Permintaan harian dari log transaksi (satu baris per transaksi) dalam satu lintasan.
+
+    Tanggal boleh berupa teks ISO, datetime64, atau angka hari. Hari tanpa transaksi di antara tanggal
+    pertama dan terakhir dihitung sebagai permintaan nol. Mengembalikan `D` (per tahun, 360 hari
+    kerja seperti model EOQ), `rata_harian`, `sd_harian`, `n_hari`, dan `n_transaksi`.
+    """
+    total_per_hari = {}
+    n_transaksi = 0
+    for chunk in baca_kolom(path, [kolom_tanggal, kolom_jumlah]):
+        detik = _ke_detik(chunk[kolom_tanggal], 86400.0)
+        jumlah = chunk[kolom_jumlah].astype(float)
+        # Transaksi tanpa tanggal atau jumlah dilewati
+        lengkap = np.isfinite(detik) & np.isfinite(jumlah)
+        hari = np.floor(detik[lengkap] / 86400.0).astype(np.int64)
+        jumlah = jumlah[lengkap]
+        unik, posisi = np.unique(hari, return_inverse=True)
+        for h, total in zip(unik.tolist(), np.bincount(posisi.ravel(), weights=jumlah).tolist()):
+            total_per_hari[h] = total_per_hari.get(h, 0.0) + total
+        n_transaksi += jumlah.size
+
+    if not total_per_hari:
+        raise ValueError("Log permintaan kosong.")
+    total = np.fromiter(total_per_hari.values(), dtype=float)
+    n_hari = max(total_per_hari) - min(total_per_hari) + 1
+    rata = total.sum() / n_hari
+    variansi = ((total ** 2).sum() - n_hari * rata ** 2) / max(n_hari - 1, 1)
+    return {
+        'D': float(rata * HARI_PER_TAHUN),
+        'rata_harian': float(rata),
+        'sd_harian': math.sqrt(max(variansi, 0.0)),
+        'n_hari': int(n_hari),
+        'n_transaksi': n_transaksi,
+    }
+
+
+def statistik_lead_time(path, kolom_pesan='tanggal_pesan', kolom_terima='tanggal_terima'):
+    """Distribusi lead time (hari) dari log pesanan: rata-rata, simpangan baku, dan histogram per hari."""
+    statistik = StatistikOnline()
+    hitungan = np.zeros(0, dtype=np.int64)
+    for chunk in baca_kolom(path, [kolom_pesan, kolom_terima]):
+        lt = (_ke_detik(chunk[kolom_terima], 86400.0) - _ke_detik(chunk[kolom_pesan], 86400.0)) / 86400.0
+        lt = lt[lt >= 0]
+        statistik.tambah(lt)
+        baru = np.bincount(np.rint(lt).astype(np.int64))
+        if baru.size > hitungan.size:
+            hitungan = np.pad(hitungan, (0, baru.size - hitungan.size))
+        hitungan[:baru.size] += baru
+
+    if statistik.n == 0:
+        raise ValueError("Log lead time kosong.")
+    return {
+        'rata': statistik.rata,
+        'sd': statistik.sd,
+        'minimum': statistik.minimum,
+        'maksimum': statistik.maksimum,
+        'hari': np.arange(hitungan.size),
+        'peluang': hitungan / hitungan.sum(),
+        'n': statistik.n,
+    }
+
+
+def statistik_kedatangan(path, kolom_waktu='waktu_datang', kolom_layanan=None, satuan_angka=1.0):
+    """Laju kedatangan λ dan laju layanan μ (per jam) beserta koefisien variasinya dari log kedatangan.
+
+    Log diasumsikan terurut menurut waktu datang; λ dihitung atas seluruh rentang log, jadi log yang
+    mencakup jam tutup sebaiknya dipotong per jam operasional dulu. Waktu berupa teks ISO/datetime64,
+    atau angka dalam detik dikalikan `satuan_angka` (mis. 60 jika dalam menit); durasi layanan memakai
+    satuan yang sama.
+    `cv_kedatangan` dan `cv_layanan` dapat langsung dipakai untuk `simulasi_antrian`.
+    """
+    antar = StatistikOnline()
+    layanan = StatistikOnline()
+    pertama = terakhir = None
+    kolom = [kolom_waktu] + ([kolom_layanan] if kolom_layanan else [])
+    for chunk in baca_kolom(path, kolom):
+        if kolom_layanan:
+            durasi = chunk[kolom_layanan].astype(float) * satuan_angka
+            layanan.tambah(durasi[np.isfinite(durasi)])
+        t = _ke_detik(chunk[kolom_waktu], satuan_angka)
+        t = t[np.isfinite(t)]
+        if t.size == 0:
+            continue
+        # Selisih pertama chunk ini dihitung terhadap kedatangan terakhir chunk sebelumnya
+        antar.tambah(np.diff(t if terakhir is None else np.concatenate([[terakhir], t])))
+        pertama = t[0] if pertama is None else pertama
+        terakhir = t[-1]
+
+    if antar.n == 0:
+        raise ValueError("Log kedatangan berisi kurang dari dua kedatangan.")
+    if terakhir <= pertama:
+        raise ValueError("Rentang waktu log kedatangan nol (semua kedatangan tercatat pada waktu yang sama); "
+                         "λ tidak dapat diestimasi.")
+    if kolom_layanan and not layanan.rata > 0:
+        raise ValueError("Durasi layanan di log kosong atau nol; μ tidak dapat diestimasi.")
+    hasil = {
+        'lmbda': float(3600.0 * antar.n / (terakhir - pertama)),
+        'cv_kedatangan': antar.sd / antar.rata if antar.rata > 0 else 0.0,
+        'n': antar.n + 1,
+        'rentang_jam': float((terakhir - pertama) / 3600.0),
+    }
+    if kolom_layanan:
+        hasil['mu'] = 3600.0 / layanan.rata
+        hasil['cv_layanan'] = layanan.sd / layanan.rata
+    return hasil
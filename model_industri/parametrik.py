@@ -0,0 +1,137 @@
+import numpy as np
+
+from .simpleks import TOL, selesaikan_lp
+
+
+def _bentuk_standar(c, A, b):
+    c = np.asarray(c, dtype=float).ravel()
+    A = np.atleast_2d(np.asarray(A, dtype=float))
+    b = np.asarray(b, dtype=float).ravel()
+    return c, A, b, np.hstack([A, np.eye(A.shape[0])]), np.concatenate([c, np.zeros(A.shape[0])])
+
+
+def rentang_optimal(c, A, b, basis=None, tol=TOL):
+    """Rentang setiap koefisien tujuan dan ruas kanan agar basis optimal tetap optimal (ranging).
+
+    Untuk LP max c·x, A x <= b, x >= 0. Tanpa `basis`, LP diselesaikan dulu. Di dalam `c_bawah..c_atas`
+    rencana produksi `x` tidak berubah; di dalam `b_bawah..b_atas` basis (kendala yang mengikat)
+    tidak berubah dan keuntungan naik tepat `shadow_price` per unit. Semua rentang dihitung dari satu
+    faktorisasi basis, tanpa menyelesaikan ulang LP.
+    """
+    c, A, b, A_s, c_s = _bentuk_standar(c, A, b)
+    if basis is None:
+        hasil = selesaikan_lp(c, A, b, tol=tol)
+        if hasil['status'] != 'optimal' or hasil['basis'] is None:
+            return {'status': hasil['status']}
+        basis = hasil['basis']
+    basis = list(basis)
+    n, m = c.size, b.size
+
+    B = A_s[:, basis]
+    invB = np.linalg.inv(B)
+    x_B = invB @ b
+    y = c_s[basis] @ invB
+    d = c_s - y @ A_s
+    d[basis] = 0.0
+    alpha = invB @ A_s
+    nonbasis = np.setdiff1d(np.arange(n + m), basis)
+
+    # Ruas kanan: x_B + δ·B⁻¹e_i >= 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rasio = -x_B[:, None] / invB
+    b_bawah = b + np.where(invB > tol, rasio, -np.inf).max(axis=0)
+    b_atas = b + np.where(invB < -tol, rasio, np.inf).min(axis=0)
+
+    # Koefisien tujuan: variabel nonbasis hanya boleh naik sampai koefisien tereduksinya nol;
+    # variabel basis di baris r menggeser semua koefisien tereduksi nonbasis sebesar -δ·α_rk
+    c_bawah, c_atas = np.full(n, -np.inf), c - d[:n]
+    posisi = {j: r for r, j in enumerate(basis)}
+    for j in range(n):
+        if j not in posisi:
+            continue
+        baris = alpha[posisi[j], nonbasis]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rasio = d[nonbasis] / baris
+        c_bawah[j] = c[j] + np.where(baris > tol, rasio, -np.inf).max(initial=-np.inf)
+        c_atas[j] = c[j] + np.where(baris < -tol, rasio, np.inf).min(initial=np.inf)
+
+    x = np.zeros(n + m)
+    x[basis] = x_B
+    return {
+        'status': 'optimal',
+        'x': x[:n],
+        'nilai': float(c @ x[:n]),
+        'shadow_price': y,
+        'basis': basis,
+        'c_bawah': c_bawah,
+        'c_atas': c_atas,
+        'b_bawah': b_bawah,
+        'b_atas': b_atas,
+    }
+
+
+def kurva_parametrik(c, A, b, parameter, indeks, batas, maks_segmen=200, tol=TOL):
+    """Nilai optimal LP sebagai fungsi linear sepotong-sepotong dari satu parameter.
+
+    `parameter` adalah 'c' (koefisien tujuan ke-`indeks`) atau 'b' (ruas kanan ke-`indeks`), dan
+    `batas` = (minimum, maksimum) nilai parameter. Mulai dari nilai saat ini, setiap segmen dihitung
+    dengan ranging; di titik patah LP diselesaikan ulang dengan warm start dari basis segmen
+    sebelumnya (simpleks primal untuk 'c', dual untuk 'b'), biasanya hanya satu pivot.
+
+    Mengembalikan `theta` dan `nilai` di setiap titik patah (termasuk kedua ujung `batas`),
+    `segmen` (rentang, `x`, dan `kemiringan` masing-masing), serta total `iterasi` simpleks.
+    Di luar daerah layak (mis. ruas kanan terlalu kecil) kurva berhenti lebih awal.
+    """
+    c, A, b, _, _ = _bentuk_standar(c, A, b)
+    vektor = c if parameter == 'c' else b
+    awal = float(np.clip(vektor[indeks], *batas))
+    lebar = max(batas[1] - batas[0], 1.0)
+
+    def selesaikan(theta, basis):
+        c_t, b_t = c.copy(), b.copy()
+        (c_t if parameter == 'c' else b_t)[indeks] = theta
+        hasil = selesaikan_lp(c_t, A, b_t, tol=tol, basis_awal=basis)
+        if hasil['status'] != 'optimal' or hasil['basis'] is None:
+            return None, hasil['iterasi']
+        rentang = rentang_optimal(c_t, A, b_t, hasil['basis'], tol)
+        bawah = rentang[f'{parameter}_bawah'][indeks]
+        atas = rentang[f'{parameter}_atas'][indeks]
+        kemiringan = rentang['x'][indeks] if parameter == 'c' else rentang['shadow_price'][indeks]
+        return {'dari': max(bawah, batas[0]), 'sampai': min(atas, batas[1]), 'x': rentang['x'],
+                'kemiringan': float(kemiringan), 'nilai_acuan': rentang['nilai'], 'theta_acuan': theta,
+                'basis': hasil['basis']}, hasil['iterasi']
+
+    pertama, iterasi = selesaikan(awal, None)
+    if pertama is None:
+        return {'theta': np.array([]), 'nilai': np.array([]), 'segmen': [], 'iterasi': iterasi}
+    segmen = [pertama]
+    for arah in (1, -1):
+        terakhir = pertama
+        while len(segmen) < maks_segmen:
+            ujung = terakhir['sampai'] if arah > 0 else terakhir['dari']
+            if (arah > 0 and ujung >= batas[1]) or (arah < 0 and ujung <= batas[0]):
+                break
+            # Melangkah sedikit melewati titik patah; diperbesar jika basis baru ternyata degeneratif
+            langkah = 1e-9 * lebar
+            while True:
+                baru, it = selesaikan(ujung + arah * langkah, terakhir['basis'])
+                iterasi += it
+                if baru is None or (baru['sampai'] if arah > 0 else -baru['dari']) > arah * ujung + tol * lebar:
+                    break
+                langkah *= 10
+                if langkah > 1e-3 * lebar:
+                    baru = None
+                    break
+            if baru is None:
+                break
+            baru['dari' if arah > 0 else 'sampai'] = ujung
+            segmen.append(baru)
+            terakhir = baru
+
+    segmen.sort(key=lambda s: s['dari'])
+    theta = np.array([segmen[0]['dari']] + [s['sampai'] for s in segmen])
+    nilai = np.array([s['nilai_acuan'] + s['kemiringan'] * (s['dari'] - s['theta_acuan']) for s in segmen[:1]] +
+                     [s['nilai_acuan'] + s['kemiringan'] * (s['sampai'] - s['theta_acuan']) for s in segmen])
+    for s in segmen:
+        del s['nilai_acuan'], s['theta_acuan']
+    return {'theta': theta, 'nilai': nilai, 'segmen': segmen, 'iterasi': iterasi}
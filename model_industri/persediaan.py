@@ -0,0 +1,52 @@
+import numpy as np
+
+# Jumlah hari kerja per tahun yang dipakai di seluruh model persediaan
+HARI_PER_TAHUN = 360
+
+
+def hitung_persediaan(D, S, H, lead_time=0, safety_stock=0):
+    """Hitung EOQ, ROP, dan TC untuk satu atau banyak skenario sekaligus.
+
+    Semua argumen boleh berupa skalar atau array NumPy yang dapat di-broadcast.
+    Skenario dengan D <= 0 atau H <= 0 menghasilkan nol, sama seperti di dashboard.
+    """
+    D, S, H, lead_time, safety_stock = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (D, S, H, lead_time, safety_stock)))
+    valid = (H > 0) & (D > 0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        eoq = np.where(valid, np.sqrt(np.where(valid, 2 * D * S / H, 0)), 0.0)
+        ada_pesanan = valid & (eoq > 0)
+        frekuensi_pesanan = np.where(ada_pesanan, D / eoq, 0.0)
+        biaya_pemesanan = np.where(ada_pesanan, D / eoq * S, 0.0)
+        biaya_penyimpanan = np.where(valid, eoq / 2 * H, 0.0)
+        permintaan_harian = np.where(valid, D / HARI_PER_TAHUN, 0.0)
+        rop = np.where(valid, permintaan_harian * lead_time + safety_stock, 0.0)
+        siklus_pemesanan = np.where(frekuensi_pesanan > 0, HARI_PER_TAHUN / frekuensi_pesanan, 0.0)
+
+    return {
+        'eoq': eoq,
+        'frekuensi_pesanan': frekuensi_pesanan,
+        'biaya_pemesanan': biaya_pemesanan,
+        'biaya_penyimpanan': biaya_penyimpanan,
+        'total_biaya': biaya_pemesanan + biaya_penyimpanan,
+        'permintaan_harian': permintaan_harian,
+        'rop': rop,
+        'siklus_pemesanan': siklus_pemesanan,
+    }
+
+
+def kurva_biaya(D, S, H, q):
+    """Biaya simpan, biaya pesan, dan total biaya tahunan untuk setiap kuantitas q."""
+    q = np.asarray(q, dtype=float)
+    holding_costs = (q / 2) * H
+    ordering_costs = (D / q) * S
+    return holding_costs, ordering_costs, holding_costs + ordering_costs
+
+
+def level_stok(t, eoq, safety_stock, permintaan_harian, siklus_pemesanan):
+    """Tingkat persediaan deterministik pada waktu t (hari) untuk pola gigi gergaji EOQ."""
+    t = np.asarray(t, dtype=float)
+    sisa_waktu_siklus = np.mod(t, siklus_pemesanan)
+    stok = (eoq + safety_stock) - permintaan_harian * sisa_waktu_siklus
+    return np.maximum(stok, safety_stock)
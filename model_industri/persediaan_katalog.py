@@ -0,0 +1,119 @@
+import numpy as np
+
+from .persediaan import HARI_PER_TAHUN
+
+_TOL_RELATIF = 1e-10
+_MAKS_ITERASI = 200
+
+
+def _akar_menurun(fungsi, skala):
+    """Akar λ >= 0 dari fungsi menurun `fungsi(λ) -> (nilai, turunan)` dengan Newton yang dijaga bracket.
+
+    `fungsi(0)` harus positif. Bracket atas dicari dengan menggandakan `skala` sampai nilainya <= 0.
+    """
+    bawah, atas = 0.0, max(skala, 1e-300)
+    while fungsi(atas)[0] > 0:
+        bawah, atas = atas, 2 * atas
+    lmbda = bawah
+    for _ in range(_MAKS_ITERASI):
+        nilai, turunan = fungsi(lmbda)
+        if nilai > 0:
+            bawah = lmbda
+        else:
+            atas = lmbda
+        if atas - bawah <= _TOL_RELATIF * atas:
+            break
+        langkah = lmbda - nilai / turunan if turunan < 0 else np.nan
+        lmbda = langkah if bawah < langkah < atas else (bawah + atas) / 2
+    return atas
+
+
+def hitung_persediaan_katalog(D, S, H, ruang=0.0, harga=0.0, kapasitas_ruang=np.inf, anggaran_modal=np.inf,
+                              lead_time=0, safety_stock=0):
+    """EOQ dan ROP untuk seluruh katalog SKU dengan kapasitas gudang dan modal kerja bersama.
+
+    Setiap argumen per SKU berupa array kolom (atau skalar yang berlaku untuk semua SKU). Kendala:
+    `Σ ruang·(Q + SS) <= kapasitas_ruang` (semua pesanan bisa tiba bersamaan) dan
+    `Σ harga·(Q/2 + SS) <= anggaran_modal` (rata-rata nilai persediaan).
+
+    Diselesaikan dengan relaksasi Lagrange: Q_i = sqrt(2·D·S / (H + 2·λ_ruang·ruang + λ_modal·harga)).
+    Pengali λ dicari dengan Newton bersarang (λ_modal di luar, λ_ruang di dalam) dan setiap evaluasi
+    tervektorisasi di semua SKU, sehingga 100 ribu SKU selesai dalam puluhan milidetik.
+
+    Mengembalikan `eoq`, `eoq_bebas` (tanpa kendala), `rop`, `biaya` per SKU, `total_biaya`,
+    `total_biaya_bebas`, pemakaian kedua sumber daya, dan `harga_bayangan_ruang`/`harga_bayangan_modal`
+    (penghematan biaya tahunan per tambahan satu unit kapasitas). `status` bernilai 'tidak_layak'
+    jika safety stock saja sudah melebihi kapasitas atau anggaran.
+    """
+    D, S, H, ruang, harga, lead_time, safety_stock = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (D, S, H, ruang, harga, lead_time, safety_stock)))
+    valid = (D > 0) & (H > 0)
+    DS2 = np.where(valid, 2 * D * S, 0.0)
+    H_valid = np.where(valid, H, 1.0)
+
+    sisa_ruang = kapasitas_ruang - (ruang * safety_stock).sum()
+    sisa_modal = anggaran_modal - (harga * safety_stock).sum()
+
+    def eoq(l_ruang, l_modal):
+        return np.sqrt(DS2 / (H_valid + 2 * l_ruang * ruang + l_modal * harga))
+
+    def sisa(Q):
+        return (ruang * Q).sum() - sisa_ruang, (harga * Q).sum() / 2 - sisa_modal
+
+    eoq_bebas = eoq(0.0, 0.0)
+    status = 'optimal'
+    if sisa_ruang < 0 or sisa_modal < 0:
+        status, l_ruang, l_modal = 'tidak_layak', np.nan, np.nan
+        Q = np.zeros_like(eoq_bebas)
+    else:
+        # dQ/dλ_ruang = -Q·ruang/W dan dQ/dλ_modal = -Q·harga/(2W) dengan W = H + 2λ_ruang·ruang + λ_modal·harga
+        def l_ruang_optimal(l_modal):
+            if sisa(eoq(0.0, l_modal))[0] <= 0:
+                return 0.0
+
+            def g(l):
+                Q = eoq(l, l_modal)
+                W = H_valid + 2 * l * ruang + l_modal * harga
+                return sisa(Q)[0], -(ruang ** 2 * Q / W).sum()
+
+            return _akar_menurun(g, H_valid.mean() / max(ruang.mean(), 1e-300))
+
+        def h(l_modal):
+            l = l_ruang_optimal(l_modal)
+            Q = eoq(l, l_modal)
+            W = H_valid + 2 * l * ruang + l_modal * harga
+            J_mm = -(harga ** 2 * Q / W).sum() / 4
+            if l > 0:
+                # λ_ruang ikut bergeser agar kendala ruang tetap aktif (komplemen Schur)
+                J_rr = -(ruang ** 2 * Q / W).sum()
+                J_rm = -(ruang * harga * Q / W).sum() / 2
+                J_mm -= J_rm ** 2 / J_rr
+            return sisa(Q)[1], J_mm
+
+        l_modal = 0.0
+        if h(0.0)[0] > 0:
+            l_modal = _akar_menurun(h, H_valid.mean() / max(harga.mean(), 1e-300))
+        l_ruang = l_ruang_optimal(l_modal)
+        Q = eoq(l_ruang, l_modal)
+
+    Q = np.where(valid, Q, 0.0)
+    eoq_bebas = np.where(valid, eoq_bebas, 0.0)
+
+    def biaya(Q):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(valid & (Q > 0), D / Q * S + Q / 2 * H, 0.0)
+
+    biaya_sku = biaya(Q)
+    return {
+        'status': status,
+        'eoq': Q,
+        'eoq_bebas': eoq_bebas,
+        'rop': np.where(valid, D / HARI_PER_TAHUN * lead_time + safety_stock, 0.0),
+        'biaya': biaya_sku,
+        'total_biaya': float(biaya_sku.sum()),
+        'total_biaya_bebas': float(biaya(eoq_bebas).sum()),
+        'ruang_terpakai': float((ruang * (Q + safety_stock)).sum()),
+        'modal_terpakai': float((harga * (Q / 2 + safety_stock)).sum()),
+        'harga_bayangan_ruang': float(l_ruang),
+        'harga_bayangan_modal': float(l_modal),
+    }
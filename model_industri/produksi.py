@@ -0,0 +1,60 @@
+import numpy as np
+
+
+def titik_sudut_produksi(jam_meja, jam_kursi, kayu_meja, kayu_kursi, total_jam, total_kayu):
+    """Kandidat titik sudut daerah layak untuk LP dua produk dua kendala.
+
+    Mengembalikan `(titik, layak)` dengan `titik` berbentuk (..., 6, 2) berisi
+    (0,0), kedua titik potong sumbu-y, titik potong kedua kendala, dan kedua
+    titik potong sumbu-x. `layak` menandai kandidat yang memenuhi semua kendala.
+    """
+    a11, a12, a21, a22, b1, b2 = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (jam_meja, jam_kursi, kayu_meja, kayu_kursi, total_jam, total_kayu)))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_intercept1 = np.where(a11 > 0, b1 / a11, np.inf)
+        y_intercept1 = np.where(a12 > 0, b1 / a12, np.inf)
+        x_intercept2 = np.where(a21 > 0, b2 / a21, np.inf)
+        y_intercept2 = np.where(a22 > 0, b2 / a22, np.inf)
+        det = a11 * a22 - a12 * a21
+        x_potong = np.where(det != 0, (b1 * a22 - a12 * b2) / det, -1.0)
+        y_potong = np.where(det != 0, (a11 * b2 - b1 * a21) / det, -1.0)
+
+    nol = np.zeros_like(b1)
+    xs = np.stack([nol, nol, nol, x_potong, x_intercept1, x_intercept2], axis=-1)
+    ys = np.stack([nol, y_intercept1, y_intercept2, y_potong, nol, nol], axis=-1)
+
+    with np.errstate(invalid='ignore'):
+        layak = np.isfinite(xs) & np.isfinite(ys) & (xs >= 0) & (ys >= 0)
+        layak &= (a11[..., None] * np.where(layak, xs, 0) + a12[..., None] * np.where(layak, ys, 0)
+                  <= b1[..., None] * (1 + 1e-12))
+        layak &= (a21[..., None] * np.where(layak, xs, 0) + a22[..., None] * np.where(layak, ys, 0)
+                  <= b2[..., None] * (1 + 1e-12))
+    # Titik potong hanya dipakai jika berada di kuadran positif (seperti di dashboard)
+    layak[..., 3] &= (x_potong > 0) & (y_potong > 0)
+
+    return np.stack([np.where(layak, xs, 0.0), np.where(layak, ys, 0.0)], axis=-1), layak
+
+
+def hitung_produksi(profit_meja, profit_kursi, jam_meja, jam_kursi, kayu_meja, kayu_kursi, total_jam, total_kayu):
+    """Selesaikan LP produksi meja/kursi untuk banyak skenario sekaligus.
+
+    Mengembalikan titik optimal kontinu (`x`, `y`), keuntungan maksimal, serta
+    kandidat titik sudut (`titik`, `layak`, `profit_titik`) untuk ditampilkan.
+    """
+    titik, layak = titik_sudut_produksi(jam_meja, jam_kursi, kayu_meja, kayu_kursi, total_jam, total_kayu)
+    profit_meja = np.asarray(profit_meja, dtype=float)[..., None]
+    profit_kursi = np.asarray(profit_kursi, dtype=float)[..., None]
+
+    profit_titik = profit_meja * titik[..., 0] + profit_kursi * titik[..., 1]
+    terbaik = np.argmax(np.where(layak, profit_titik, -np.inf), axis=-1)
+    optimal = np.take_along_axis(titik, terbaik[..., None, None], axis=-2)[..., 0, :]
+
+    return {
+        'x': optimal[..., 0],
+        'y': optimal[..., 1],
+        'profit': np.take_along_axis(profit_titik, terbaik[..., None], axis=-1)[..., 0],
+        'titik': titik,
+        'layak': layak,
+        'profit_titik': profit_titik,
+    }
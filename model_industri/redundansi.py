@@ -0,0 +1,138 @@
+import numpy as np
+
+from .keandalan import keandalan_seri
+
+# Jumlah sel grid bawaan bila satuan biaya/ruang tidak diberikan; grid 2D (dengan kendala ruang) lebih kasar
+_SEL_BIAYA_BAWAAN = 2_000
+_SEL_BIAYA_RUANG_BAWAAN = 500
+_SEL_RUANG_BAWAAN = 50
+
+
+def opsi_paralel(keandalan, biaya_unit, ruang_unit=0.0, maks_unit=5, unit_awal=1):
+    """Opsi redundansi paralel per stasiun: 1..`maks_unit` mesin identik yang bekerja paralel.
+
+    Mengembalikan `(keandalan_opsi, biaya_opsi, ruang_opsi)` berbentuk (n_stasiun, max(maks_unit));
+    opsi j berarti j + 1 unit. Biaya dan ruang dihitung dari unit tambahan di atas `unit_awal`
+    (mesin yang sudah terpasang). Opsi di bawah `unit_awal` atau di atas `maks_unit` stasiun itu bernilai NaN.
+    """
+    keandalan, biaya_unit, ruang_unit, maks_unit, unit_awal = (
+        np.atleast_1d(np.asarray(v, dtype=float))[:, None]
+        for v in np.broadcast_arrays(keandalan, biaya_unit, ruang_unit, maks_unit, unit_awal))
+    unit = np.arange(1, int(max(maks_unit.max(), unit_awal.max())) + 1)
+    # Unit yang sudah terpasang selalu menjadi salah satu opsi meskipun melebihi maks_unit
+    tersedia = (unit >= unit_awal) & (unit <= np.maximum(maks_unit, unit_awal))
+    tambahan = np.where(tersedia, unit - unit_awal, np.nan)
+    keandalan_opsi = np.where(tersedia, 1 - (1 - keandalan) ** unit, np.nan)
+    return keandalan_opsi, tambahan * biaya_unit, tambahan * ruang_unit
+
+
+def _satuan(nilai, batas, n_sel):
+    """Satuan grid: FPB nilai bila semuanya kelipatan bulat yang muat dalam grid, selain itu `batas / n_sel`."""
+    nilai = nilai[np.isfinite(nilai) & (nilai > 0)]
+    if nilai.size and np.all(nilai == np.round(nilai)) and batas == np.round(batas):
+        fpb = np.gcd.reduce(np.append(nilai, batas).astype(np.int64))
+        if fpb > 0 and batas / fpb <= 10 * n_sel:
+            return float(fpb)
+    return batas / n_sel if batas > 0 else 1.0
+
+
+def alokasi_redundansi(keandalan, biaya, anggaran, ruang=None, kapasitas_ruang=None, satuan_biaya=None,
+                       satuan_ruang=None):
+    """Pilih satu opsi redundansi per stasiun lini seri agar keandalan sistem maksimum dalam anggaran.
+
+    `keandalan`, `biaya`, dan `ruang` berbentuk (n_stasiun, n_opsi): keandalan stasiun, biaya, dan
+    ruang untuk setiap opsi (mis. dari `opsi_paralel`). NaN menandai opsi yang tidak tersedia, sehingga
+    jumlah opsi per stasiun boleh berbeda. Kendala: `Σ biaya <= anggaran` dan `Σ ruang <= kapasitas_ruang`.
+
+    Diselesaikan dengan pemrograman dinamis multiple-choice knapsack di grid biaya (dan ruang, bila
+    ada kendala ruang) yang tervektorisasi per stasiun: `f_i(b, s) = max_j f_{i-1}(b - c_ij, s - s_ij) + log r_ij`.
+    Biaya dan ruang dibulatkan ke atas ke kelipatan `satuan_biaya`/`satuan_ruang`, jadi hasilnya eksak
+    bila semuanya kelipatan satuan (bawaan: FPB bila bilangan bulat) dan tetap layak bila tidak.
+    Setiap opsi hanya satu operasi irisan array di seluruh grid, sehingga 300 stasiun × 30 opsi
+    selesai dalam sepersekian detik (grid 2D dengan kendala ruang dibuat lebih kasar secara bawaan).
+
+    Satu kali jalan sekaligus menghasilkan frontier efisien anggaran-keandalan untuk semua anggaran
+    0..`anggaran`: `frontier` berisi `anggaran` (titik grid), `biaya`, `ruang`, `keandalan`, dan
+    `pilihan` (indeks opsi per stasiun) di setiap titik tempat keandalan terbaik naik. Hasil utama
+    untuk `anggaran` penuh: `pilihan`, `keandalan_stasiun`, `keandalan`, `biaya`, `ruang`, dan
+    `status` ('optimal' atau 'tidak_layak' bila opsi termurah pun melanggar kendala).
+    """
+    keandalan = np.atleast_2d(np.asarray(keandalan, dtype=float))
+    biaya = np.broadcast_to(np.asarray(biaya, dtype=float), keandalan.shape)
+    ada_ruang = ruang is not None and kapasitas_ruang is not None and np.isfinite(kapasitas_ruang)
+    ruang = np.zeros(keandalan.shape) if ruang is None else np.broadcast_to(np.asarray(ruang, dtype=float),
+                                                                             keandalan.shape)
+    n_stasiun, n_opsi = keandalan.shape
+    tersedia = np.isfinite(keandalan) & np.isfinite(biaya) & np.isfinite(ruang)
+    # Anggaran/kapasitas di atas total opsi termahal tidak mengubah apa pun, jadi grid dipotong di sana
+    anggaran = min(anggaran, np.where(tersedia, np.maximum(biaya, 0), 0).max(axis=1).sum())
+    if ada_ruang:
+        kapasitas_ruang = min(kapasitas_ruang, np.where(tersedia, np.maximum(ruang, 0), 0).max(axis=1).sum())
+
+    satuan_biaya = satuan_biaya or _satuan(biaya[tersedia], anggaran,
+                                           _SEL_BIAYA_RUANG_BAWAAN if ada_ruang else _SEL_BIAYA_BAWAAN)
+    B = int(np.floor(anggaran / satuan_biaya + 1e-9))
+    c = np.where(tersedia, np.ceil(np.maximum(biaya, 0) / satuan_biaya - 1e-9), B + 1).astype(np.int64)
+    if ada_ruang:
+        satuan_ruang = satuan_ruang or _satuan(ruang[tersedia], kapasitas_ruang, _SEL_RUANG_BAWAAN)
+        S = int(np.floor(kapasitas_ruang / satuan_ruang + 1e-9))
+        s = np.where(tersedia, np.ceil(np.maximum(ruang, 0) / satuan_ruang - 1e-9), S + 1).astype(np.int64)
+    else:
+        S, s = 0, np.zeros((n_stasiun, n_opsi), dtype=np.int64)
+    with np.errstate(divide='ignore'):
+        log_r = np.where(tersedia, np.log(np.clip(np.nan_to_num(keandalan), 0, 1)), -np.inf)
+
+    # f[b, s] = log keandalan terbaik stasiun yang sudah diproses dengan biaya <= b dan ruang <= s (monoton)
+    f = np.zeros((B + 1, S + 1))
+    jenis_pilihan = np.int8 if n_opsi <= np.iinfo(np.int8).max else np.int16
+    pilihan_tahap = np.zeros((n_stasiun, B + 1, S + 1), dtype=jenis_pilihan)
+    for i in range(n_stasiun):
+        baru = np.full_like(f, -np.inf)
+        for j in np.flatnonzero((c[i] <= B) & (s[i] <= S)):
+            # Geser f sejauh biaya dan ruang opsi j: satu operasi irisan untuk seluruh grid
+            cb, cs = c[i, j], s[i, j]
+            kandidat = f[:B + 1 - cb, :S + 1 - cs] + log_r[i, j]
+            lebih_baik = kandidat > baru[cb:, cs:]
+            baru[cb:, cs:][lebih_baik] = kandidat[lebih_baik]
+            pilihan_tahap[i, cb:, cs:][lebih_baik] = j
+        f = baru
+
+    terbaik = f[:, S]
+    layak = np.isfinite(terbaik)
+    # Titik frontier: anggaran terkecil untuk setiap kenaikan keandalan terbaik
+    # (-inf - -inf pada anggaran yang belum layak menghasilkan NaN, yang memang bukan kenaikan)
+    with np.errstate(invalid='ignore'):
+        naik = layak & (np.diff(terbaik, prepend=-np.inf) > 1e-12)
+    titik = np.flatnonzero(naik)
+
+    # Telusur balik semua titik frontier sekaligus
+    b, sisa = titik.copy(), np.full(titik.size, S)
+    pilihan = np.empty((titik.size, n_stasiun), dtype=np.intp)
+    for i in range(n_stasiun - 1, -1, -1):
+        j = pilihan_tahap[i, b, sisa].astype(np.intp)
+        pilihan[:, i] = j
+        b -= c[i, j]
+        sisa -= s[i, j]
+
+    baris = np.arange(n_stasiun)
+    keandalan_frontier = keandalan_seri(keandalan[baris, pilihan]) if titik.size else np.empty(0)
+    frontier = {
+        'anggaran': titik * satuan_biaya,
+        'biaya': biaya[baris, pilihan].sum(axis=-1) if titik.size else np.empty(0),
+        'ruang': ruang[baris, pilihan].sum(axis=-1) if titik.size else np.empty(0),
+        'keandalan': keandalan_frontier,
+        'pilihan': pilihan,
+    }
+    if not titik.size:
+        return {'status': 'tidak_layak', 'frontier': frontier, 'satuan_biaya': satuan_biaya}
+    pilihan_akhir = pilihan[-1]
+    return {
+        'status': 'optimal',
+        'pilihan': pilihan_akhir,
+        'keandalan_stasiun': keandalan[baris, pilihan_akhir],
+        'keandalan': float(keandalan_frontier[-1]),
+        'biaya': float(frontier['biaya'][-1]),
+        'ruang': float(frontier['ruang'][-1]),
+        'frontier': frontier,
+        'satuan_biaya': satuan_biaya,
+    }
@@ -0,0 +1,60 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+def _titik_chunk(rentang, bentuk, awal, akhir):
+    """Nilai parameter untuk titik grid ke-`awal` sampai `akhir` (urutan C) tanpa membuat meshgrid penuh."""
+    indeks = np.unravel_index(np.arange(awal, akhir), bentuk)
+    return {nama: np.asarray(nilai)[i] for (nama, nilai), i in zip(rentang.items(), indeks)}
+
+
+def _hitung_chunk(fungsi, rentang, bentuk, tetap, keluaran, awal, akhir):
+    hasil = fungsi(**tetap, **_titik_chunk(rentang, bentuk, awal, akhir))
+    n = akhir - awal
+    if keluaran is None:
+        keluaran = [k for k, v in hasil.items() if np.ndim(v) >= 1 and np.shape(v)[0] == n]
+    return {k: np.asarray(hasil[k]) for k in keluaran}
+
+
+def sapuan_parameter(fungsi, rentang, tetap=None, keluaran=None, ukuran_chunk=250_000, n_proses=None):
+    """Evaluasi model tervektorisasi `fungsi` pada seluruh grid kombinasi nilai `rentang`.
+
+    `rentang` memetakan nama argumen ke larik nilainya (mis. `{'lmbda': np.linspace(10, 40, 300),
+    'mu': np.linspace(20, 60, 300)}`); argumen lain diambil dari `tetap`. Semua fungsi `hitung_*`
+    paket ini menerima array, jadi satu chunk berisi ratusan ribu titik dihitung dalam satu panggilan.
+
+    Grid dibagi per `ukuran_chunk` titik. Jika ada lebih dari satu chunk, chunk dijalankan di `n_proses`
+    proses (bawaan: semua CPU); `fungsi` harus fungsi tingkat modul agar dapat dikirim ke proses lain.
+    Mengembalikan `sumbu` (nilai setiap parameter) dan setiap `keluaran` sebagai array berbentuk grid
+    (ditambah dimensi ekstra keluaran, jika ada). Tanpa `keluaran`, semua hasil per titik diambil.
+    """
+    rentang = {nama: np.asarray(nilai) for nama, nilai in rentang.items()}
+    tetap = tetap or {}
+    bentuk = tuple(nilai.size for nilai in rentang.values())
+    total = int(np.prod(bentuk))
+    batas = [(awal, min(awal + ukuran_chunk, total)) for awal in range(0, total, ukuran_chunk)]
+
+    n_proses = min(n_proses or os.cpu_count() or 1, len(batas))
+    argumen = [(fungsi, rentang, bentuk, tetap, keluaran, awal, akhir) for awal, akhir in batas]
+    if n_proses <= 1:
+        potongan = (_hitung_chunk(*a) for a in argumen)
+    else:
+        pool = ProcessPoolExecutor(n_proses)
+        potongan = pool.map(_hitung_chunk, *zip(*argumen))
+
+    hasil = {}
+    try:
+        for (awal, akhir), bagian in zip(batas, potongan):
+            for k, v in bagian.items():
+                if k not in hasil:
+                    hasil[k] = np.empty((total,) + v.shape[1:], dtype=v.dtype)
+                hasil[k][awal:akhir] = v
+    finally:
+        if n_proses > 1:
+            pool.shutdown()
+
+    hasil = {k: v.reshape(bentuk + v.shape[1:]) for k, v in hasil.items()}
+    hasil['sumbu'] = rentang
+    return hasil
@@ -0,0 +1,288 @@
+import heapq
+import math
+
+import numpy as np
+
+# Toleransi numerik bawaan untuk uji optimalitas, rasio, dan integralitas
+TOL = 1e-9
+
+
+def _pivot_masuk(d, kandidat, bland):
+    """Pilih kolom masuk: koefisien tereduksi terbesar (Dantzig) atau indeks terkecil (Bland)."""
+    if bland:
+        return int(kandidat[0])
+    return int(kandidat[np.argmax(d[kandidat])])
+
+
+def _simpleks_revisi(A, b, c, basis, boleh_masuk, tol, maks_iterasi):
+    """Simpleks revisi primal untuk max c·x, A x = b, x >= 0 dari basis layak `basis`.
+
+    Mengembalikan (status, basis, x_B, y, iterasi). `y` adalah vektor dual c_B B⁻¹.
+    Aturan Bland dipakai otomatis setelah serangkaian pivot degeneratif agar tidak berputar.
+    """
+    m = A.shape[0]
+    basis = list(basis)
+    degeneratif = 0
+    for iterasi in range(maks_iterasi):
+        B = A[:, basis]
+        x_B = np.linalg.solve(B, b)
+        y = np.linalg.solve(B.T, c[basis])
+        d = c - y @ A
+        d[basis] = 0.0
+        d[~boleh_masuk] = 0.0
+        kandidat = np.flatnonzero(d > tol)
+        if kandidat.size == 0:
+            return 'optimal', basis, x_B, y, iterasi
+
+        j = _pivot_masuk(d, kandidat, bland=degeneratif > m)
+        u = np.linalg.solve(B, A[:, j])
+        positif = u > tol
+        if not positif.any():
+            return 'tak_terbatas', basis, x_B, y, iterasi
+
+        rasio = np.full(m, np.inf)
+        rasio[positif] = np.maximum(x_B[positif], 0.0) / u[positif]
+        theta = rasio.min()
+        seri = np.flatnonzero(rasio <= theta + tol)
+        # Jika seri, keluarkan variabel basis dengan indeks terkecil (Bland)
+        r = int(seri[np.argmin(np.asarray(basis)[seri])])
+        degeneratif = degeneratif + 1 if theta <= tol else 0
+        basis[r] = j
+
+    return 'batas_iterasi', basis, x_B, y, maks_iterasi
+
+
+def _simpleks_dual(A, b, c, basis, tol, maks_iterasi):
+    """Simpleks dual dari basis yang layak-dual (semua d <= 0) tetapi mungkin tidak layak-primal.
+
+    Dipakai untuk warm start setelah ruas kanan berubah: basis lama tetap optimal-dual sehingga
+    biasanya hanya perlu beberapa pivot. Mengembalikan (status, basis, iterasi).
+    """
+    basis = list(basis)
+    for iterasi in range(maks_iterasi):
+        B = A[:, basis]
+        x_B = np.linalg.solve(B, b)
+        r = int(np.argmin(x_B))
+        if x_B[r] >= -tol:
+            return 'optimal', basis, iterasi
+        y = np.linalg.solve(B.T, c[basis])
+        d = np.minimum(c - y @ A, 0.0)
+        baris = np.linalg.solve(B.T, np.eye(len(basis))[r]) @ A
+        baris[basis] = 0.0
+        kandidat = np.flatnonzero(baris < -tol)
+        if kandidat.size == 0:
+            return 'tidak_layak', basis, iterasi
+        rasio = d[kandidat] / baris[kandidat]
+        basis[r] = int(kandidat[np.argmin(rasio)])
+    return 'batas_iterasi', basis, maks_iterasi
+
+
+def _basis_hangat(A, b, c, basis_awal, tol, maks_iterasi):
+    """Basis layak dari `basis_awal`: langsung jika masih layak-primal, lewat simpleks dual jika layak-dual.
+
+    Mengembalikan (status, basis, iterasi); `basis` None berarti basis awal tidak dapat dipakai.
+    """
+    try:
+        B = A[:, basis_awal]
+        x_B = np.linalg.solve(B, b)
+        if np.all(x_B >= -tol):
+            return 'optimal', list(basis_awal), 0
+        y = np.linalg.solve(B.T, c[basis_awal])
+    except np.linalg.LinAlgError:
+        return 'optimal', None, 0
+    if np.all(c - y @ A <= tol):
+        return _simpleks_dual(A, b, c, basis_awal, tol, maks_iterasi)
+    return 'optimal', None, 0
+
+
+def _keluarkan_artifisial(A, b, basis, n_asli, tol):
+    """Ganti variabel artifisial bernilai nol di basis dengan kolom asli (pivot degeneratif).
+
+    Baris yang tidak dapat diganti bersifat redundan dan dibuang.
+    """
+    baris_dipakai = np.ones(A.shape[0], dtype=bool)
+    for r in range(len(basis)):
+        if basis[r] < n_asli:
+            continue
+        baris_r = np.linalg.solve(A[:, basis].T, np.eye(len(basis))[r]) @ A[:, :n_asli]
+        baris_r[[k for k in basis if k < n_asli]] = 0.0
+        pengganti = np.flatnonzero(np.abs(baris_r) > tol)
+        if pengganti.size:
+            basis[r] = int(pengganti[0])
+        else:
+            baris_dipakai[r] = False
+    basis = [k for k, dipakai in zip(basis, baris_dipakai) if dipakai]
+    return A[baris_dipakai][:, :n_asli], b[baris_dipakai], basis
+
+
+def _lp_relaksasi(c, A, b, lb, ub, tol, maks_iterasi, basis_awal=None):
+    """Selesaikan relaksasi LP max c·x, A x <= b, lb <= x <= ub dengan simpleks dua fase."""
+    n = c.size
+    finite_ub = np.flatnonzero(np.isfinite(ub))
+
+    # Substitusi x = lb + x', lalu batas atas menjadi baris kendala tambahan
+    A_full = np.vstack([A, np.eye(n)[finite_ub]]) if finite_ub.size else A
+    b_full = np.concatenate([b - A @ lb, ub[finite_ub] - lb[finite_ub]])
+    m = A_full.shape[0]
+
+    tanda = np.where(b_full < 0, -1.0, 1.0)
+    A_eq = np.hstack([A_full, np.eye(m)]) * tanda[:, None]
+    b_eq = b_full * tanda
+    c_eq = np.concatenate([c, np.zeros(m)])
+    n_asli = n + m
+
+    iterasi_total = 0
+    basis = None
+    A_fase2, b_fase2 = A_eq, b_eq
+    if basis_awal is not None and len(basis_awal) == m:
+        status, basis, iterasi_total = _basis_hangat(A_eq, b_eq, c_eq, basis_awal, tol, maks_iterasi)
+        if status != 'optimal':
+            return {'status': status, 'iterasi': iterasi_total}
+
+    if basis is None:
+        perlu_artifisial = np.flatnonzero(tanda < 0)
+        basis = [n + i for i in range(m)]
+        if perlu_artifisial.size:
+            k = perlu_artifisial.size
+            art = np.zeros((m, k))
+            art[perlu_artifisial, np.arange(k)] = 1.0
+            A1 = np.hstack([A_eq, art])
+            c1 = np.concatenate([np.zeros(n_asli), -np.ones(k)])
+            for idx, i in enumerate(perlu_artifisial):
+                basis[i] = n_asli + idx
+            status, basis, x_B, _, it = _simpleks_revisi(
+                A1, b_eq, c1, basis, np.ones(n_asli + k, dtype=bool), tol, maks_iterasi)
+            iterasi_total += it
+            if status != 'optimal' or c1[basis] @ x_B < -tol * max(1.0, np.abs(b_eq).max()):
+                return {'status': 'tidak_layak', 'iterasi': iterasi_total}
+            A_fase2, b_fase2, basis = _keluarkan_artifisial(A1, b_eq, basis, n_asli, tol)
+
+    status, basis, x_B, y, it = _simpleks_revisi(
+        A_fase2, b_fase2, c_eq, basis, np.ones(n_asli, dtype=bool), tol, maks_iterasi)
+    iterasi_total += it
+    if status != 'optimal':
+        return {'status': status, 'iterasi': iterasi_total}
+
+    x_eq = np.zeros(n_asli)
+    x_eq[basis] = x_B
+    x = lb + x_eq[:n]
+
+    # Dual hanya tersedia untuk baris yang tidak dibuang; baris redundan berharga bayangan nol
+    y_full = np.zeros(m)
+    if A_fase2.shape[0] == m:
+        y_full = y * tanda
+    return {
+        'status': 'optimal',
+        'x': x,
+        'nilai': float(c @ x),
+        'shadow_price': y_full[:A.shape[0]],
+        'iterasi': iterasi_total,
+        'basis': basis if A_fase2.shape[0] == m else None,
+    }
+
+
+def selesaikan_lp(c, A, b, lb=None, ub=None, integer=False, maks_node=100_000, maks_iterasi=50_000, tol=TOL,
+                  basis_awal=None):
+    """Maksimalkan c·x dengan kendala A x <= b dan lb <= x <= ub (bawaan x >= 0).
+
+    Memakai simpleks revisi dua fase di NumPy. Dengan `integer=True` (bool atau
+    mask per variabel) solusi bulat dicari dengan branch-and-bound best-first:
+    node yang batas atas relaksasinya tidak lebih baik dari solusi terbaik dipangkas.
+
+    Mengembalikan dict berisi `status` ('optimal', 'tidak_layak', 'tak_terbatas',
+    'batas_node', 'batas_iterasi'), `x`, `nilai`, `slack`, `shadow_price`, `binding`,
+    `iterasi`, `node`, dan `basis`. Pada mode integer, `shadow_price` dan `binding`
+    berasal dari relaksasi LP di akar, dan `nilai_relaksasi` memberi batas atasnya.
+
+    `basis_awal` (mis. `basis` dari hasil sebelumnya) dipakai sebagai warm start: langsung jika
+    masih layak, atau lewat simpleks dual jika hanya ruas kanan yang berubah.
+    """
+    c = np.asarray(c, dtype=float).ravel()
+    A = np.atleast_2d(np.asarray(A, dtype=float))
+    b = np.asarray(b, dtype=float).ravel()
+    n = c.size
+    lb = np.zeros(n) if lb is None else np.broadcast_to(np.asarray(lb, dtype=float), (n,)).copy()
+    ub = np.full(n, np.inf) if ub is None else np.broadcast_to(np.asarray(ub, dtype=float), (n,)).copy()
+    bulat = np.broadcast_to(np.asarray(integer, dtype=bool), (n,))
+
+    akar = _lp_relaksasi(c, A, b, lb, ub, tol, maks_iterasi, basis_awal)
+    if akar['status'] != 'optimal':
+        return {'status': akar['status'], 'iterasi': akar['iterasi'], 'node': 1}
+
+    hasil = dict(akar)
+    hasil['node'] = 1
+    hasil['nilai_relaksasi'] = akar['nilai']
+    slack_akar = b - A @ akar['x']
+    hasil['binding'] = slack_akar <= tol * (1 + np.abs(b)) * 1e3
+
+    if bulat.any():
+        hasil.update(_branch_and_bound(c, A, b, lb, ub, bulat, akar, tol, maks_iterasi, maks_node))
+        if hasil['status'] == 'tidak_layak':
+            return hasil
+
+    hasil['slack'] = b - A @ hasil['x']
+    return hasil
+
+
+def _branch_and_bound(c, A, b, lb, ub, bulat, akar, tol, maks_iterasi, maks_node):
+    """Branch-and-bound best-first dengan pemangkasan berdasarkan batas relaksasi."""
+    tol_bulat = 1e-6
+    koef_bulat = bulat.all() and np.allclose(c, np.round(c))
+
+    def batas_efektif(nilai):
+        # Jika semua koefisien tujuan bulat, nilai solusi bulat juga bulat
+        return math.floor(nilai + tol_bulat) if koef_bulat else nilai
+
+    terbaik_x, terbaik_nilai = None, -np.inf
+
+    # Heuristik awal: bulatkan ke bawah solusi relaksasi jika masih layak
+    x_bawah = np.where(bulat, np.floor(akar['x'] + tol_bulat), akar['x'])
+    if np.all(x_bawah >= lb - tol) and np.all(A @ x_bawah <= b + tol * (1 + np.abs(b))):
+        terbaik_x, terbaik_nilai = x_bawah, float(c @ x_bawah)
+
+    antrian = [(-batas_efektif(akar['nilai']), 0, lb, ub, akar)]
+    urutan, node, iterasi = 1, 1, akar['iterasi']
+    while antrian:
+        neg_batas, _, lb_node, ub_node, rel = heapq.heappop(antrian)
+        if -neg_batas <= terbaik_nilai + tol_bulat:
+            continue
+
+        pecahan = np.abs(rel['x'] - np.round(rel['x']))
+        pecahan[~bulat] = 0.0
+        if pecahan.max() <= tol_bulat:
+            x_bulat = np.where(bulat, np.round(rel['x']), rel['x'])
+            terbaik_x, terbaik_nilai = x_bulat, float(c @ x_bulat)
+            continue
+        if node >= maks_node:
+            break
+
+        # Cabangkan pada variabel dengan bagian pecahan paling dekat 0.5
+        j = int(np.argmax(np.where(bulat, 0.5 - np.abs(pecahan - 0.5), -1.0)))
+        nilai_j = rel['x'][j]
+        for lb_anak, ub_anak in ((lb_node, ub_node.copy()), (lb_node.copy(), ub_node)):
+            if ub_anak is not ub_node:
+                ub_anak[j] = math.floor(nilai_j)
+            else:
+                lb_anak[j] = math.ceil(nilai_j)
+            if lb_anak[j] > ub_anak[j]:
+                continue
+            anak = _lp_relaksasi(c, A, b, lb_anak, ub_anak, tol, maks_iterasi)
+            node += 1
+            iterasi += anak['iterasi']
+            if anak['status'] != 'optimal':
+                continue
+            batas = batas_efektif(anak['nilai'])
+            if batas > terbaik_nilai + tol_bulat:
+                heapq.heappush(antrian, (-batas, urutan, lb_anak, ub_anak, anak))
+                urutan += 1
+
+    if terbaik_x is None:
+        return {'status': 'tidak_layak' if not antrian else 'batas_node', 'node': node, 'iterasi': iterasi,
+                'x': np.full(c.size, np.nan), 'nilai': np.nan}
+    return {
+        'status': 'batas_node' if antrian and node >= maks_node else 'optimal',
+        'x': terbaik_x,
+        'nilai': terbaik_nilai,
+        'node': node,
+        'iterasi': iterasi,
+    }
@@ -0,0 +1,142 @@
+import math
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+from .diagram_blok import DiagramBlok
+from .simulasi_antrian import pembangkit
+
+# Jumlah bin histogram ketersediaan per replikasi untuk menaksir persentilnya
+_BIN_KETERSEDIAAN = 1000
+
+
+def skala_weibull(mttf, bentuk):
+    """Parameter skala η Weibull dengan rata-rata `mttf` dan parameter bentuk β (β = 1 berarti eksponensial)."""
+    return mttf / math.gamma(1 + 1 / bentuk)
+
+
+def mttf_dari_keandalan(keandalan, periode, bentuk=1.0):
+    """MTTF yang membuat keandalan selama `periode` sama dengan `keandalan`, untuk kegagalan Weibull(β)."""
+    return periode / (-np.log(keandalan)) ** (1 / bentuk) * math.gamma(1 + 1 / bentuk)
+
+
+def _jadwal_kejadian(rng, n, horizon, mttf, bentuk, mttr, cv_perbaikan):
+    """Waktu kumulatif kejadian gagal/pulih (n, 2k) untuk satu mesin yang mulai dalam keadaan baru.
+
+    Kolom genap adalah saat gagal, kolom ganjil saat selesai diperbaiki; perbaikan membuat mesin
+    seperti baru. Kolom ditambah sampai setiap replikasi melewati `horizon`.
+    """
+    eta = skala_weibull(mttf, bentuk)
+    ambil_ttr = pembangkit('lognormal', mttr, cv_perbaikan)
+    k = math.ceil(1.5 * horizon / (mttf + mttr)) + 2
+    durasi = np.empty((n, 0))
+    akhir = np.zeros(n)
+    while akhir.min() <= horizon:
+        blok = np.empty((n, 2 * k))
+        blok[:, 0::2] = eta * rng.weibull(bentuk, (n, k))
+        blok[:, 1::2] = ambil_ttr(rng, n * k).reshape(n, k)
+        durasi = np.concatenate([durasi, blok], axis=1)
+        akhir = akhir + blok.sum(axis=1)
+    return np.cumsum(durasi, axis=1)
+
+
+def _status_di_grid(kejadian, grid):
+    """Status mesin (1 = hidup) pada setiap titik grid, dengan satu searchsorted untuk semua replikasi."""
+    n, m = kejadian.shape
+    batas = grid[-1] + 1.0
+    # Geser setiap baris sejauh `batas` agar seluruh matriks menjadi satu larik terurut
+    geser = (np.arange(n) * batas)[:, None]
+    datar = (np.minimum(kejadian, batas) + geser).ravel()
+    jumlah = np.searchsorted(datar, (grid + geser).ravel(), side='right').reshape(n, -1) - (np.arange(n) * m)[:, None]
+    return (jumlah % 2 == 0).astype(float)
+
+
+def _chunk_ketersediaan(diagram, mesin, horizon, grid, n, seed):
+    """Simulasikan `n` replikasi dan kembalikan hanya ringkasan yang dapat dijumlahkan antar chunk."""
+    rng = np.random.default_rng(seed)
+    status = np.empty((n, grid.size, len(diagram.komponen)))
+    for i, nama in enumerate(diagram.komponen):
+        p = mesin[nama]
+        kejadian = _jadwal_kejadian(rng, n, horizon, p['mttf'], p.get('bentuk', 1.0), p['mttr'],
+                                    p.get('cv_perbaikan', 1.0))
+        status[:, :, i] = _status_di_grid(kejadian, grid)
+
+    # Fungsi struktur sistem: BDD yang sama dievaluasi dengan R komponen 0/1
+    sistem = diagram.keandalan(status)
+    ketersediaan = sistem.mean(axis=1)
+    mati = 1 - sistem
+    return {
+        'jumlah': ketersediaan.sum(),
+        'jumlah_kuadrat': (ketersediaan ** 2).sum(),
+        'histogram': np.bincount(np.minimum((ketersediaan * _BIN_KETERSEDIAAN).astype(int), _BIN_KETERSEDIAAN - 1),
+                                 minlength=_BIN_KETERSEDIAAN),
+        'kurva': sistem.sum(axis=0),
+        'mesin': status.mean(axis=1).sum(axis=0),
+        'kontribusi': ((1 - status) * mati[:, :, None]).sum(axis=(0, 1)),
+        'total_mati': mati.sum(),
+        'kegagalan': (np.diff(sistem, axis=1) < 0).sum(),
+    }
+
+
+def simulasi_ketersediaan(definisi, mesin, horizon=720.0, langkah=1.0, replikasi=2000, laju_produksi=1.0,
+                          ukuran_chunk=250, n_proses=None, seed=0):
+    """Simulasi Monte Carlo ketersediaan lini sepanjang `horizon` jam dengan kegagalan dan perbaikan acak.
+
+    `definisi` adalah diagram blok seperti pada `DiagramBlok`; `mesin` memetakan setiap komponen ke
+    `{'mttf', 'bentuk', 'mttr', 'cv_perbaikan'}` (jam). Waktu antar-kegagalan ~ Weibull(bentuk) dengan
+    rata-rata mttf, waktu perbaikan ~ lognormal dengan rata-rata mttr. Status sistem dievaluasi setiap
+    `langkah` jam dan `laju_produksi` (unit/jam) dipakai untuk menghitung kehilangan throughput.
+
+    Replikasi dibagi per `ukuran_chunk` dan dijalankan di `n_proses` proses (bawaan: semua CPU);
+    hasil setiap chunk langsung dijumlahkan sehingga memori tidak bertambah dengan jumlah replikasi.
+    Setiap chunk punya seed turunan sendiri, jadi hasil tidak bergantung pada jumlah proses.
+    """
+    diagram = DiagramBlok(definisi)
+    grid = np.arange(0.5, horizon / langkah) * langkah
+    ukuran = [min(ukuran_chunk, replikasi - awal) for awal in range(0, replikasi, ukuran_chunk)]
+    seeds = np.random.SeedSequence(seed).spawn(len(ukuran))
+    tugas = [(diagram, mesin, horizon, grid, n, s) for n, s in zip(ukuran, seeds)]
+
+    total = {}
+
+    def tambah(hasil):
+        for k, v in hasil.items():
+            total[k] = total.get(k, 0) + v
+
+    n_proses = min(n_proses or os.cpu_count() or 1, len(tugas))
+    if n_proses <= 1:
+        for argumen in tugas:
+            tambah(_chunk_ketersediaan(*argumen))
+    else:
+        # Batasi chunk yang sedang berjalan agar hasil yang belum dijumlahkan tidak menumpuk
+        with ProcessPoolExecutor(n_proses) as pool:
+            berjalan = set()
+            for argumen in tugas:
+                if len(berjalan) >= 2 * n_proses:
+                    selesai, berjalan = wait(berjalan, return_when=FIRST_COMPLETED)
+                    for f in selesai:
+                        tambah(f.result())
+                berjalan.add(pool.submit(_chunk_ketersediaan, *argumen))
+            for f in berjalan:
+                tambah(f.result())
+
+    rata = total['jumlah'] / replikasi
+    kumulatif = np.cumsum(total['histogram']) / replikasi
+    jam_mati = (1 - rata) * horizon
+    return {
+        'ketersediaan': float(rata),
+        'sd_ketersediaan': float(math.sqrt(max(total['jumlah_kuadrat'] / replikasi - rata ** 2, 0.0))),
+        'persentil_ketersediaan': {q: float((np.searchsorted(kumulatif, q / 100) + 0.5) / _BIN_KETERSEDIAAN)
+                                   for q in (5, 50, 95)},
+        't': grid,
+        'kurva_ketersediaan': total['kurva'] / replikasi,
+        'komponen': list(diagram.komponen),
+        'ketersediaan_mesin': total['mesin'] / replikasi,
+        # Porsi waktu henti lini saat komponen tersebut sedang rusak (bisa > 1 jika bersamaan)
+        'kontribusi_henti': total['kontribusi'] / total['total_mati'] if total['total_mati'] else
+                            np.zeros(len(diagram.komponen)),
+        'jam_henti': float(jam_mati),
+        'kehilangan_throughput': float(jam_mati * laju_produksi),
+        'kegagalan_lini': float(total['kegagalan'] / replikasi),
+    }
@@ -0,0 +1,108 @@
+import math
+
+import numpy as np
+
+from .persediaan import HARI_PER_TAHUN
+
+# Resolusi histogram permintaan selama lead time untuk menaksir safety stock
+_BIN_HISTOGRAM = 4096
+
+
+def _permintaan(rng, rata, sd, ukuran):
+    """Sampel permintaan Normal(rata, sd) yang dipotong di nol; deterministik jika sd = 0."""
+    if np.all(np.asarray(sd) <= 0):
+        return np.broadcast_to(np.asarray(rata, dtype=float), (ukuran,)).copy()
+    return np.maximum(rng.normal(rata, sd, ukuran), 0.0)
+
+
+def _lead_time(rng, rata, sd, lt_maks, ukuran):
+    """Lead time dalam hari bulat, minimal 1 dan maksimal `lt_maks`."""
+    if sd <= 0:
+        return np.full(ukuran, min(max(int(round(rata)), 1), lt_maks))
+    return np.clip(np.rint(rng.normal(rata, sd, ukuran)), 1, lt_maks).astype(int)
+
+
+def simulasi_persediaan(D, eoq, rop, safety_stock=0, lead_time=14, sd_permintaan=0.0, sd_lead_time=0.0,
+                        horizon=HARI_PER_TAHUN, replikasi=2000, target_layanan=0.95, ukuran_chunk=500,
+                        n_jalur=20, seed=0):
+    """Simulasi Monte Carlo kebijakan (Q = eoq, ROP) harian dengan permintaan dan lead time acak.
+
+    Permintaan harian ~ Normal(D/360, `sd_permintaan`) dipotong di nol, lead time ~ Normal(`lead_time`,
+    `sd_lead_time`) dibulatkan ke hari. Permintaan yang tidak terlayani hilang (lost sales). Pesanan
+    dilakukan saat posisi persediaan (stok + pesanan dalam perjalanan) <= ROP.
+
+    Replikasi diproses per `ukuran_chunk` sebagai array NumPy; statistik dijumlahkan antar chunk,
+    sehingga memori hanya bergantung pada `ukuran_chunk`, `horizon`, dan `n_jalur`.
+    Mengembalikan fill rate, probabilitas kehabisan (per hari dan per siklus pesanan), safety stock
+    untuk `target_layanan` (cycle service level), rata-rata stok per hari, dan contoh jalur stok.
+    """
+    rng = np.random.default_rng(seed)
+    d_harian = D / HARI_PER_TAHUN
+    lt_maks = max(1, math.ceil(lead_time + 6 * sd_lead_time))
+    lebar = lt_maks + 1
+
+    rata_ddlt = d_harian * lead_time
+    sd_ddlt = math.sqrt(lead_time * sd_permintaan ** 2 + d_harian ** 2 * sd_lead_time ** 2)
+    tepi = np.linspace(0.0, rata_ddlt + 10 * sd_ddlt + d_harian + 1.0, _BIN_HISTOGRAM + 1)
+    histogram = np.zeros(_BIN_HISTOGRAM)
+
+    total_permintaan = total_terlayani = hari_kehabisan = kejadian_kehabisan = jumlah_pesanan = 0.0
+    total_stok = np.zeros(horizon)
+    jalur = np.empty((min(n_jalur, replikasi), horizon))
+
+    for awal in range(0, replikasi, ukuran_chunk):
+        n = min(ukuran_chunk, replikasi - awal)
+        baris = np.arange(n)
+        stok = np.full(n, float(eoq + safety_stock))
+        dalam_perjalanan = np.zeros(n)
+        # Buffer melingkar: kedatangan[:, t % lebar] = jumlah barang yang tiba pada hari t
+        kedatangan = np.zeros((n, lebar))
+        habis_kemarin = np.zeros(n, dtype=bool)
+
+        for t in range(horizon):
+            slot = t % lebar
+            stok += kedatangan[:, slot]
+            dalam_perjalanan -= kedatangan[:, slot]
+            kedatangan[:, slot] = 0.0
+
+            permintaan = _permintaan(rng, d_harian, sd_permintaan, n)
+            terlayani = np.minimum(stok, permintaan)
+            stok -= terlayani
+            habis = permintaan - terlayani > 1e-9
+
+            total_permintaan += permintaan.sum()
+            total_terlayani += terlayani.sum()
+            hari_kehabisan += habis.sum()
+            kejadian_kehabisan += (habis & ~habis_kemarin).sum()
+            habis_kemarin = habis
+
+            posisi = stok + dalam_perjalanan
+            pesan = np.flatnonzero(posisi <= rop)
+            if pesan.size and eoq > 0:
+                # Pesan beberapa lot sekaligus jika satu lot belum mengangkat posisi di atas ROP
+                jumlah = (np.floor((rop - posisi[pesan]) / eoq) + 1) * eoq
+                lt = _lead_time(rng, lead_time, sd_lead_time, lt_maks, pesan.size)
+                kedatangan[baris[pesan], (t + lt) % lebar] += jumlah
+                dalam_perjalanan[pesan] += jumlah
+                jumlah_pesanan += pesan.size
+
+            total_stok[t] += stok.sum()
+            if awal == 0:
+                jalur[:, t] = stok[:jalur.shape[0]]
+
+        lt = _lead_time(rng, lead_time, sd_lead_time, lt_maks, n)
+        ddlt = _permintaan(rng, d_harian * lt, sd_permintaan * np.sqrt(lt), n)
+        histogram += np.histogram(np.minimum(ddlt, tepi[-1]), tepi)[0]
+
+    kumulatif = np.cumsum(histogram) / histogram.sum()
+    kuantil = tepi[1:][min(np.searchsorted(kumulatif, target_layanan), _BIN_HISTOGRAM - 1)]
+
+    return {
+        'fill_rate': float(total_terlayani / total_permintaan) if total_permintaan > 0 else 1.0,
+        'prob_kehabisan_harian': float(hari_kehabisan / (replikasi * horizon)),
+        'prob_kehabisan_siklus': float(min(kejadian_kehabisan / jumlah_pesanan, 1.0)) if jumlah_pesanan else 0.0,
+        'safety_stock_target': max(float(kuantil) - rata_ddlt, 0.0),
+        'rata_stok': total_stok / replikasi,
+        'jalur': jalur,
+        'pesanan_per_replikasi': float(jumlah_pesanan / replikasi),
+    }